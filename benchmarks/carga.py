@@ -0,0 +1,415 @@
+# benchmarks/carga.py
+"""Pruebas de carga con escenarios de temporada alta: semana de inscripciones y semana de exámenes.
+
+Usuarios virtuales (corrutinas) recorren journeys ponderados hechos con las rutas existentes
+(login + inscripción al último ciclo, préstamo, devolución, renovación, consultas) siguiendo un perfil
+de rampa por etapas. Al final se comparan p95/p99 y tasa de error por ruta contra los SLO del
+escenario; el comando termina con código 1 si alguno no se cumple.
+
+Por defecto levanta la app en el mismo proceso sobre una BD poblada con el generador (igual que
+benchmarks/e2e.py). Con --objetivo apunta a un servidor ya levantado (uvicorn/gunicorn con sus workers),
+que debe tener datos del generador para que el login funcione.
+
+    python -m benchmarks.carga --escenario inscripciones --factor-tiempo 0.2
+    python -m benchmarks.carga --escenario examenes --objetivo http://127.0.0.1:8000 --factor-usuarios 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.e2e import Medicion, _commit_actual, preparar_bd
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class Etapa:
+    """Lleva linealmente los usuarios virtuales desde el objetivo de la etapa anterior hasta `usuarios`"""
+    duracion_s: float
+    usuarios: int
+
+
+@dataclass(frozen=True)
+class Slo:
+    p95_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    # Fracción de peticiones con error (5xx o fallo de transporte); los rechazos de negocio no cuentan
+    max_errores: float = 0.01
+
+
+@dataclass(frozen=True)
+class Escenario:
+    descripcion: str
+    journeys: Dict[str, float]
+    etapas: List[Etapa]
+    # Por plantilla de ruta ("POST /prestamos/"); "*" aplica al total
+    slos: Dict[str, Slo]
+    # Pausa media entre journeys de un mismo usuario (distribución exponencial)
+    pausa_s: float = 1.0
+
+
+@dataclass
+class MedicionRuta(Medicion):
+    # Respuestas 4xx del negocio (p. ej. "ya tiene una inscripción activa"): esperables en un pico
+    rechazos: int = 0
+
+    def resumen(self, duracion_s: float) -> dict:
+        resumen = super().resumen(duracion_s)
+        total = resumen["peticiones"] + self.errores
+        resumen["rechazos"] = self.rechazos
+        resumen["tasa_errores"] = round(self.errores / total, 4) if total else 0.0
+        return resumen
+
+
+class Estado:
+    """Datos compartidos por los usuarios virtuales y las mediciones de la ejecución"""
+
+    def __init__(self, estudiantes: List[int], disponibles: List[int], semilla: int):
+        self.rng = random.Random(semilla)
+        self.estudiantes = estudiantes
+        self.disponibles = disponibles
+        self.abiertos: List[int] = []
+        self.mediciones: Dict[str, MedicionRuta] = {}
+        self.por_etapa: Dict[int, MedicionRuta] = {}
+        self.journeys: Dict[str, int] = {}
+        self.etapa = 0
+
+    def estudiante(self) -> int:
+        return self.rng.choice(self.estudiantes)
+
+    async def peticion(self, cliente, metodo: str, plantilla: str, url: str, **kwargs):
+        """Hace la petición y la registra bajo `plantilla`; devuelve el cuerpo si la petición tuvo éxito"""
+        medicion = self.mediciones.setdefault(plantilla, MedicionRuta())
+        etapa = self.por_etapa.setdefault(self.etapa, MedicionRuta())
+        inicio = time.perf_counter()
+        try:
+            respuesta = await cliente.request(metodo, url, **kwargs)
+            cuerpo = respuesta.json()
+        except Exception:
+            medicion.errores += 1
+            etapa.errores += 1
+            return None
+        latencia = (time.perf_counter() - inicio) * 1000
+        # GenericResponse deja el código HTTP por defecto de la ruta y reporta el real en el cuerpo
+        codigo = cuerpo.get("status", respuesta.status_code) if isinstance(cuerpo, dict) else respuesta.status_code
+        if respuesta.status_code >= 500 or codigo >= 500:
+            medicion.errores += 1
+            etapa.errores += 1
+            return None
+        for destino in (medicion, etapa):
+            destino.latencias_ms.append(latencia)
+        consultas = respuesta.headers.get("X-DB-Query-Count")
+        if consultas is not None:
+            medicion.consultas.append(int(consultas))
+        if not cuerpo.get("success"):
+            medicion.rechazos += 1
+            etapa.rechazos += 1
+            return None
+        return cuerpo
+
+
+# --- Journeys ----------------------------------------------------------------------------------
+
+Journey = Callable[["httpx.AsyncClient", Estado], Awaitable[None]]
+
+
+async def inscripcion(cliente, estado: Estado):
+    from benchmarks.generador_datos import CONTRASENA
+    id_usuario = estado.estudiante()
+    sesion = await estado.peticion(cliente, "POST", "POST /users/login", "/users/login", json={
+        "email": f"usuario{id_usuario}@umich.mx", "contraseña": CONTRASENA,
+    })
+    if sesion is None:
+        return
+    await estado.peticion(cliente, "POST", "POST /inscripciones/last_ciclo/{id_usuario}",
+                          f"/inscripciones/last_ciclo/{id_usuario}")
+    await estado.peticion(cliente, "GET", "GET /inscripciones/usuario/{id_usuario}/activas",
+                          f"/inscripciones/usuario/{id_usuario}/activas")
+
+
+async def consulta_referencias(cliente, estado: Estado):
+    # Catálogos de referencia que el front pide al abrir la pantalla de inscripción
+    await estado.peticion(cliente, "GET", "GET /ciclos/", "/ciclos/")
+    await estado.peticion(cliente, "GET", "GET /carreras/", "/carreras/")
+
+
+async def consulta_prestamos(cliente, estado: Estado):
+    id_usuario = estado.estudiante()
+    await estado.peticion(cliente, "GET", "GET /prestamos/usuario/{id_usuario}/detalles",
+                          f"/prestamos/usuario/{id_usuario}/detalles")
+
+
+async def prestamo(cliente, estado: Estado):
+    if not estado.disponibles:
+        return
+    id_ejemplar = estado.disponibles.pop()
+    await estado.peticion(cliente, "GET", "GET /ejemplares/{id_ejemplar}/detalles", f"/ejemplares/{id_ejemplar}/detalles")
+    cuerpo = await estado.peticion(cliente, "POST", "POST /prestamos/", "/prestamos/", json={
+        "id_usuario": estado.estudiante(),
+        "id_ejemplar": id_ejemplar,
+        "fecha_devolucion_esperada": (date.today() + timedelta(days=7)).isoformat(),
+    })
+    if cuerpo:
+        estado.abiertos.append(cuerpo["data"]["id_prestamo"])
+    else:
+        estado.disponibles.insert(0, id_ejemplar)
+
+
+async def devolucion(cliente, estado: Estado):
+    if not estado.abiertos:
+        return
+    id_prestamo = estado.abiertos.pop(estado.rng.randrange(len(estado.abiertos)))
+    cuerpo = await estado.peticion(cliente, "POST", "POST /prestamos/{id_prestamo}/devolver",
+                                   f"/prestamos/{id_prestamo}/devolver", json={})
+    if cuerpo:
+        estado.disponibles.insert(0, cuerpo["data"]["id_ejemplar"])
+    else:
+        estado.abiertos.append(id_prestamo)
+
+
+async def renovacion(cliente, estado: Estado):
+    if not estado.abiertos:
+        return
+    id_prestamo = estado.rng.choice(estado.abiertos)
+    await estado.peticion(cliente, "POST", "POST /prestamos/{id_prestamo}/renovar",
+                          f"/prestamos/{id_prestamo}/renovar", json={
+                              "nueva_fecha_devolucion": (date.today() + timedelta(days=14)).isoformat()})
+
+
+JOURNEYS: Dict[str, Journey] = {
+    "inscripcion": inscripcion,
+    "consulta_referencias": consulta_referencias,
+    "consulta_prestamos": consulta_prestamos,
+    "prestamo": prestamo,
+    "devolucion": devolucion,
+    "renovacion": renovacion,
+}
+
+# Rampa, meseta, pico de 3x y descenso; las duraciones y usuarios se escalan por línea de comandos
+_RAMPA_CON_PICO = [Etapa(30, 20), Etapa(60, 20), Etapa(10, 60), Etapa(30, 60), Etapa(10, 0)]
+
+ESCENARIOS: Dict[str, Escenario] = {
+    "inscripciones": Escenario(
+        descripcion="Semana de inscripciones: ráfagas de POST /inscripciones/last_ciclo",
+        journeys={"inscripcion": 6, "consulta_referencias": 3, "consulta_prestamos": 1},
+        etapas=_RAMPA_CON_PICO,
+        slos={
+            "*": Slo(max_errores=0.01),
+            "POST /inscripciones/last_ciclo/{id_usuario}": Slo(p95_ms=800, p99_ms=2000),
+            "GET /inscripciones/usuario/{id_usuario}/activas": Slo(p95_ms=300),
+            # Servidos por la caché de referencia
+            "GET /ciclos/": Slo(p95_ms=150),
+            "GET /carreras/": Slo(p95_ms=150),
+        },
+    ),
+    "examenes": Escenario(
+        descripcion="Semana de exámenes: ráfagas de préstamos y devoluciones",
+        journeys={"prestamo": 4, "devolucion": 3, "renovacion": 1, "consulta_prestamos": 2},
+        etapas=_RAMPA_CON_PICO,
+        slos={
+            "*": Slo(max_errores=0.01),
+            "POST /prestamos/": Slo(p95_ms=500, p99_ms=1500),
+            "POST /prestamos/{id_prestamo}/devolver": Slo(p95_ms=500, p99_ms=1500),
+            "POST /prestamos/{id_prestamo}/renovar": Slo(p95_ms=500),
+            "GET /prestamos/usuario/{id_usuario}/detalles": Slo(p95_ms=300),
+        },
+    ),
+    "mixto": Escenario(
+        descripcion="Inicio de semestre: inscripciones y circulación a la vez",
+        journeys={"inscripcion": 3, "consulta_referencias": 2, "prestamo": 2, "devolucion": 2,
+                  "renovacion": 1, "consulta_prestamos": 2},
+        etapas=_RAMPA_CON_PICO,
+        slos={"*": Slo(max_errores=0.01)},
+    ),
+}
+
+
+def objetivo_usuarios(etapas: List[Etapa], t: float) -> Tuple[int, int]:
+    """(índice de etapa, usuarios objetivo) en el segundo `t` del perfil; (-1, 0) al terminar"""
+    previo = 0
+    for indice, etapa in enumerate(etapas):
+        if t < etapa.duracion_s:
+            return indice, round(previo + (etapa.usuarios - previo) * t / etapa.duracion_s)
+        t -= etapa.duracion_s
+        previo = etapa.usuarios
+    return -1, 0
+
+
+async def usuario_virtual(cliente, estado: Estado, escenario: Escenario, detener: asyncio.Event, rng: random.Random):
+    nombres = list(escenario.journeys)
+    pesos = [escenario.journeys[n] for n in nombres]
+    while not detener.is_set():
+        nombre = rng.choices(nombres, weights=pesos)[0]
+        estado.journeys[nombre] = estado.journeys.get(nombre, 0) + 1
+        await JOURNEYS[nombre](cliente, estado)
+        try:
+            await asyncio.wait_for(detener.wait(), timeout=rng.expovariate(1 / escenario.pausa_s))
+        except asyncio.TimeoutError:
+            pass
+
+
+async def ejecutar(cliente, estado: Estado, escenario: Escenario, semilla: int) -> float:
+    """Sigue el perfil de etapas ajustando los usuarios virtuales cada 250 ms; devuelve la duración"""
+    activos: List[tuple] = []
+    inicio = time.perf_counter()
+    siguiente = 0
+    while True:
+        etapa, objetivo = objetivo_usuarios(escenario.etapas, time.perf_counter() - inicio)
+        if etapa < 0:
+            break
+        estado.etapa = etapa
+        while len(activos) < objetivo:
+            detener = asyncio.Event()
+            rng = random.Random(f"{semilla}:{siguiente}")
+            siguiente += 1
+            activos.append((detener, asyncio.create_task(usuario_virtual(cliente, estado, escenario, detener, rng))))
+        while len(activos) > objetivo:
+            # El usuario termina su journey en curso antes de salir
+            activos.pop()[0].set()
+        await asyncio.sleep(0.25)
+    for detener, _ in activos:
+        detener.set()
+    await asyncio.gather(*(tarea for _, tarea in activos))
+    return time.perf_counter() - inicio
+
+
+def verificar_slos(escenario: Escenario, rutas: Dict[str, dict], total: dict) -> List[str]:
+    incumplidos = []
+    for plantilla, slo in escenario.slos.items():
+        resumen = total if plantilla == "*" else rutas.get(plantilla)
+        if not resumen:
+            continue
+        if slo.p95_ms is not None and resumen["p95_ms"] is not None and resumen["p95_ms"] > slo.p95_ms:
+            incumplidos.append(f"{plantilla}: p95 {resumen['p95_ms']} ms > {slo.p95_ms} ms")
+        if slo.p99_ms is not None and resumen["p99_ms"] is not None and resumen["p99_ms"] > slo.p99_ms:
+            incumplidos.append(f"{plantilla}: p99 {resumen['p99_ms']} ms > {slo.p99_ms} ms")
+        if resumen["tasa_errores"] > slo.max_errores:
+            incumplidos.append(f"{plantilla}: errores {resumen['tasa_errores']:.2%} > {slo.max_errores:.2%}")
+    return incumplidos
+
+
+async def _datos_iniciales(cliente) -> Tuple[List[int], List[int]]:
+    """Estudiantes y ejemplares disponibles, leídos por la API para funcionar igual contra un servidor remoto"""
+    estudiantes = (await cliente.get("/estudiantes/")).json().get("data") or []
+    disponibles = (await cliente.get("/ejemplares/disponibles/prestamo")).json().get("data") or []
+    return [e["id_usuario"] for e in estudiantes], [e["id_ejemplar"] for e in disponibles]
+
+
+async def correr(app, args, escenario: Escenario) -> dict:
+    import httpx
+
+    limites = httpx.Limits(max_connections=max(e.usuarios for e in escenario.etapas) + 10)
+    if app is None:
+        opciones = {"base_url": args.objetivo}
+    else:
+        opciones = {"transport": httpx.ASGITransport(app=app), "base_url": "http://carga"}
+
+    async def con_cliente():
+        async with httpx.AsyncClient(timeout=args.timeout, limits=limites, **opciones) as cliente:
+            estudiantes, disponibles = await _datos_iniciales(cliente)
+            if not estudiantes:
+                raise SystemExit("El objetivo no tiene estudiantes: puebla la BD con benchmarks.generador_datos")
+            estado = Estado(estudiantes, disponibles, args.semilla)
+            duracion = await ejecutar(cliente, estado, escenario, args.semilla)
+            return estado, duracion
+
+    if app is None:
+        estado, duracion = await con_cliente()
+    else:
+        # El lifespan corre igual que en uvicorn: calentamiento incluido
+        async with app.router.lifespan_context(app):
+            estado, duracion = await con_cliente()
+
+    total = MedicionRuta()
+    for medicion in estado.mediciones.values():
+        total.latencias_ms += medicion.latencias_ms
+        total.errores += medicion.errores
+        total.rechazos += medicion.rechazos
+        total.consultas += medicion.consultas
+    rutas = {plantilla: m.resumen(duracion) for plantilla, m in sorted(estado.mediciones.items())}
+    resumen_total = total.resumen(duracion)
+    etapas = []
+    for indice, etapa in enumerate(escenario.etapas):
+        medicion = estado.por_etapa.get(indice, MedicionRuta())
+        etapas.append({"usuarios": etapa.usuarios, **medicion.resumen(etapa.duracion_s)})
+    return {
+        "duracion_s": round(duracion, 1),
+        "journeys": estado.journeys,
+        "total": resumen_total,
+        "rutas": rutas,
+        "etapas": etapas,
+        "slo_incumplidos": verificar_slos(escenario, rutas, resumen_total),
+    }
+
+
+def _escalar(escenario: Escenario, factor_usuarios: float, factor_tiempo: float, pausa: Optional[float]) -> Escenario:
+    etapas = [Etapa(e.duracion_s * factor_tiempo, round(e.usuarios * factor_usuarios)) for e in escenario.etapas]
+    return Escenario(escenario.descripcion, escenario.journeys, etapas, escenario.slos,
+                     pausa if pausa is not None else escenario.pausa_s)
+
+
+def main(argv=None) -> int:
+    from benchmarks.generador_datos import ESCALAS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--escenario", choices=list(ESCENARIOS), default="mixto")
+    parser.add_argument("--objetivo", help="URL de un servidor ya levantado; sin ella la app corre en el proceso")
+    parser.add_argument("--url", help="BD para el modo en proceso (por defecto SQLite en un archivo temporal)")
+    parser.add_argument("--escala", choices=sorted(ESCALAS), default="pequena")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--reusar-bd", action="store_true", help="no poblar si la BD ya tiene datos")
+    parser.add_argument("--factor-usuarios", type=float, default=1.0, help="multiplica los usuarios de cada etapa")
+    parser.add_argument("--factor-tiempo", type=float, default=1.0, help="multiplica la duración de cada etapa")
+    parser.add_argument("--pausa", type=float, help="pausa media entre journeys en segundos")
+    parser.add_argument("--timeout", type=float, default=30.0, help="timeout por petición en segundos")
+    parser.add_argument("--sin-slo", action="store_true", help="reporta sin fallar por SLO incumplidos")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, _RAIZ_PROYECTO)
+    escenario = _escalar(ESCENARIOS[args.escenario], args.factor_usuarios, args.factor_tiempo, args.pausa)
+    app = bd = None
+    if not args.objetivo:
+        url = args.url or f"sqlite:///{os.path.join(tempfile.gettempdir(), f'umsnh_bench_{args.escala}.db')}"
+        app, engine, _ = preparar_bd(url, args.escala, args.semilla, args.reusar_bd)
+        bd = engine.dialect.name
+
+    print(f"Escenario {args.escenario}: {escenario.descripcion}", file=sys.stderr)
+    resultado = asyncio.run(correr(app, args, escenario))
+    reporte = {
+        "commit": _commit_actual(),
+        "fecha": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "objetivo": args.objetivo or "en proceso",
+        "bd": bd,
+        "escenario": args.escenario,
+        "etapas": [{"duracion_s": e.duracion_s, "usuarios": e.usuarios} for e in escenario.etapas],
+        **resultado,
+    }
+
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    for plantilla, r in reporte["rutas"].items():
+        print(f"  {plantilla:<50} {r['peticiones']:>6} ok {r['rechazos']:>5} rech {r['errores']:>4} err  "
+              f"p95 {r['p95_ms'] or 0:>8.1f} ms", file=sys.stderr)
+    for incumplido in reporte["slo_incumplidos"]:
+        print(f"  SLO incumplido: {incumplido}", file=sys.stderr)
+    return 1 if reporte["slo_incumplidos"] and not args.sin_slo else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
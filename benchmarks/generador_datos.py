@@ -0,0 +1,495 @@
+# benchmarks/generador_datos.py
+"""Datos sintéticos del dominio UMSNH: inserciones masivas por lotes sobre las tablas SQLModel.
+
+Los ids se asignan aquí (no los genera la BD) para poder referenciarlos en las tablas hijas sin
+releer nada, y todo sale de generadores `random.Random` derivados de la semilla: misma semilla,
+mismos datos. Las filas se generan de forma perezosa, así que la memoria no crece con las filas.
+
+Invariantes:
+- cada usuario Estudiante, Maestro o Administrativo tiene su fila en la tabla del rol;
+- los estudiantes tienen carrera y solo se inscriben en ciclos desde su ingreso;
+- los ciclos ('YYYY-YYYY') no se traslapan;
+- los libros llevan un ISBN-13 con dígito de control válido;
+- la ubicación de un ejemplar coincide con su id_biblioteca / id_laboratorio;
+- un ejemplar nunca está en dos préstamos a la vez y los prestados tienen un préstamo abierto;
+- solo piden préstamos los usuarios activos.
+
+Uso:
+    python -m benchmarks.generador_datos --url sqlite:////tmp/umsnh.db --escala mediana --semilla 7
+"""
+import argparse
+import random
+import sys
+import time
+from array import array
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from src.app.features.rol.infrastructure.models.rol_model import RolDB
+from src.app.features.user.infrastructure.models.user_model import UserDB
+from src.app.features.carrera.infrastructure.models.carrera_model import CarreraDB
+from src.app.features.estudiante.infrastructure.models.estudiante_model import EstudianteDB
+from src.app.features.maestros.infrastructure.models.maestro_model import MaestroDB
+from src.app.features.administrativo.infrastructure.models.administrativo_model import AdministrativoDB
+from src.app.features.ciclo.infrastructure.models.ciclo_model import CicloDB
+from src.app.features.inscripcion.infrastructure.models.inscripcion_model import InscripcionDB
+from src.app.features.bibliotecas.infrastructure.models.biblioteca_model import BibliotecaDB
+from src.app.features.laboratorios.infrastructure.models.laboratorio_model import LaboratorioDB
+from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.features.catalogo.infrastructure.contadores_ejemplares import recalcular_todos
+from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
+from src.app.features.prestamos.infrastructure.models.prestamo_model import PrestamoDB
+from src.app.features.estadisticas.infrastructure.rollups_prestamos import anotar_origenes, reconstruir
+
+# Todos los usuarios sintéticos comparten contraseña; el hash se calcula una sola vez
+CONTRASENA = "benchmark123"
+
+TAMANO_LOTE = 10_000
+
+# Mismos ids que asume el código (ROL_ESTUDIANTE = 1 en inscripciones)
+ROL_ESTUDIANTE, ROL_MAESTRO, ROL_ADMINISTRATIVO, ROL_BIBLIOTECARIO = 1, 2, 3, 4
+ROLES = {ROL_ESTUDIANTE: "Estudiante", ROL_MAESTRO: "Maestro",
+         ROL_ADMINISTRATIVO: "Administrativo", ROL_BIBLIOTECARIO: "Bibliotecario"}
+
+# Historia de préstamos; los históricos se devuelven antes de que empiece cualquier préstamo abierto
+_DIAS_HISTORIA = 3 * 365
+_DIAS_ABIERTOS = 40
+_MAXIMO_DIAS_USO = 60
+
+
+@dataclass(frozen=True)
+class Escala:
+    usuarios: int
+    ejemplares: int
+    prestamos: int
+    bibliotecas: int = 10
+    laboratorios: int = 20
+    carreras: int = 40
+    # Ciclos anuales, terminando en el actual
+    ciclos: int = 6
+    # Ejemplares por título del catálogo
+    ejemplares_por_item: int = 10
+    # Fracción de ejemplares con un préstamo en curso
+    fraccion_prestados: float = 0.05
+
+    def validar(self):
+        if min(self.usuarios, self.ejemplares, self.bibliotecas, self.laboratorios, self.carreras, self.ciclos) < 1:
+            raise ValueError("Todas las cantidades de la escala deben ser positivas")
+        # Con ~2 semanas por préstamo, por encima de esto no caben sin traslaparse en un ejemplar
+        capacidad = self.ejemplares * (_DIAS_HISTORIA - _DIAS_ABIERTOS - _MAXIMO_DIAS_USO) // 30
+        if self.prestamos > capacidad:
+            raise ValueError(f"Demasiados préstamos para {self.ejemplares} ejemplares (máximo {capacidad})")
+
+
+ESCALAS: Dict[str, Escala] = {
+    "pequena": Escala(usuarios=1_000, ejemplares=5_000, prestamos=20_000),
+    "mediana": Escala(usuarios=10_000, ejemplares=100_000, prestamos=500_000),
+    "completa": Escala(usuarios=100_000, ejemplares=1_000_000, prestamos=5_000_000, carreras=80),
+}
+
+_NOMBRES = ["Ana", "Luis", "María", "José", "Carmen", "Jorge", "Lucía", "Miguel", "Sofía", "Diego",
+            "Elena", "Pablo", "Valeria", "Andrés", "Camila", "Fernando", "Paula", "Ricardo"]
+_APELLIDOS = ["García", "Hernández", "López", "Martínez", "González", "Pérez", "Rodríguez", "Sánchez",
+              "Ramírez", "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Cruz", "Morales"]
+_PALABRAS = ["Introducción", "Fundamentos", "Manual", "Teoría", "Práctica", "Análisis", "Cálculo",
+             "Química", "Física", "Programación", "Redes", "Estructuras", "Diseño", "Historia"]
+_FACULTADES = ["Facultad de Ingeniería Civil", "Facultad de Ingeniería Eléctrica", "Facultad de Derecho",
+               "Facultad de Químico Farmacobiología", "Facultad de Contaduría", "Facultad de Medicina",
+               "Facultad de Arquitectura", "Facultad de Ciencias Físico Matemáticas"]
+_PREFIJOS_CARRERA = ["Ingeniería en", "Licenciatura en"]
+_DISCIPLINAS = ["Computación", "Electrónica", "Derecho", "Contaduría", "Medicina", "Arquitectura",
+                "Física", "Matemáticas", "Química", "Biología", "Economía", "Administración"]
+_DEPARTAMENTOS = ["Control Escolar", "Biblioteca Central", "Recursos Humanos", "Tesorería", "Servicios Escolares"]
+
+
+def isbn13(rng: random.Random) -> str:
+    """ISBN-13 con prefijo 978 y dígito de control válido"""
+    digitos = [9, 7, 8] + [rng.randrange(10) for _ in range(9)]
+    suma = sum(d * (1 if i % 2 == 0 else 3) for i, d in enumerate(digitos))
+    return "".join(map(str, digitos)) + str((10 - suma % 10) % 10)
+
+
+def _en_lotes(filas: Iterable[dict], tamano: int) -> Iterator[List[dict]]:
+    lote: List[dict] = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) == tamano:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def insertar(engine: Engine, modelo, filas: Iterable[dict], tamano_lote: int = TAMANO_LOTE) -> int:
+    """INSERT ... VALUES por lotes (executemany), una transacción por lote"""
+    total = 0
+    tabla = modelo.__table__
+    for lote in _en_lotes(filas, tamano_lote):
+        with engine.begin() as conn:
+            conn.execute(tabla.insert(), lote)
+        total += len(lote)
+    return total
+
+
+class GeneradorDatos:
+    def __init__(self, escala: Escala, semilla: int = 42, hoy: Optional[date] = None):
+        escala.validar()
+        self.escala = escala
+        self.semilla = semilla
+        self.hoy = hoy or date.today()
+        self.ejemplares_prestados: set = set()
+        # Rol de cada usuario (índice = id_usuario), usuarios activos y maestros; los llena preparar()
+        self._rol_usuario = bytearray()
+        self._usuarios_activos = array("i")
+        self._maestros = array("i")
+        # 1 si el item del catálogo es un libro; lo llena catalogo() y lo usa ejemplares()
+        self._es_libro = bytearray()
+
+    def _rng(self, tabla: str) -> random.Random:
+        # Un generador por tabla: cambiar una tabla no altera los datos de las demás
+        return random.Random(f"{self.semilla}:{tabla}")
+
+    def preparar(self):
+        """Decide roles, usuarios activos y ejemplares prestados antes de generar las tablas"""
+        rng = self._rng("roles_usuarios")
+        self._rol_usuario = bytearray(self.escala.usuarios + 1)
+        self._usuarios_activos = array("i")
+        self._maestros = array("i")
+        for i in range(1, self.escala.usuarios + 1):
+            # La mayoría son estudiantes
+            rol = rng.choices((ROL_ESTUDIANTE, ROL_MAESTRO, ROL_ADMINISTRATIVO, ROL_BIBLIOTECARIO),
+                              weights=(85, 8, 5, 2))[0]
+            self._rol_usuario[i] = rol
+            if rng.random() < 0.97:
+                self._usuarios_activos.append(i)
+            if rol == ROL_MAESTRO:
+                self._maestros.append(i)
+        if not self._usuarios_activos:
+            self._usuarios_activos.append(1)
+        self.elegir_prestados()
+
+    def elegir_prestados(self):
+        """Ejemplares con un préstamo en curso; se decide antes de generar ejemplares y préstamos"""
+        rng = self._rng("prestados")
+        cantidad = min(int(self.escala.ejemplares * self.escala.fraccion_prestados), self.escala.prestamos)
+        self.ejemplares_prestados = set(rng.sample(range(1, self.escala.ejemplares + 1), cantidad))
+
+    # --- Usuarios y roles ---------------------------------------------------------------------
+
+    def roles(self) -> Iterator[dict]:
+        for id_rol, tipo in ROLES.items():
+            yield {"id_rol": id_rol, "tipo_rol": tipo}
+
+    def usuarios(self, hash_contrasena: str) -> Iterator[dict]:
+        rng = self._rng("usuarios")
+        activos = set(self._usuarios_activos)
+        for i in range(1, self.escala.usuarios + 1):
+            yield {
+                "id_usuario": i,
+                "nombre": rng.choice(_NOMBRES),
+                "apellidoP": rng.choice(_APELLIDOS),
+                "apellidoM": rng.choice(_APELLIDOS),
+                "matricula": f"{i:08d}",
+                "email": f"usuario{i}@umich.mx",
+                "contraseña": hash_contrasena,
+                "id_rol": self._rol_usuario[i],
+                "status": "activo" if i in activos else "inactivo",
+            }
+
+    def carreras(self) -> Iterator[dict]:
+        rng = self._rng("carreras")
+        for i in range(1, self.escala.carreras + 1):
+            yield {
+                "id_carrera": i,
+                "carrera": f"{rng.choice(_PREFIJOS_CARRERA)} {rng.choice(_DISCIPLINAS)} {i}",
+                "facultad": rng.choice(_FACULTADES),
+            }
+
+    def estudiantes(self) -> Iterator[dict]:
+        rng = self._rng("estudiantes")
+        id_estudiante = 0
+        for id_usuario in range(1, self.escala.usuarios + 1):
+            if self._rol_usuario[id_usuario] != ROL_ESTUDIANTE:
+                continue
+            id_estudiante += 1
+            # Pocas carreras concentran a la mayoría de los estudiantes
+            id_carrera = min(int(rng.paretovariate(1.2)), self.escala.carreras)
+            yield {"id_estudiante": id_estudiante, "id_usuario": id_usuario, "id_carrera": id_carrera}
+
+    def maestros(self) -> Iterator[dict]:
+        for id_maestro, id_usuario in enumerate(self._maestros, start=1):
+            yield {"id_maestro": id_maestro, "id_usuario": id_usuario}
+
+    def administrativos(self) -> Iterator[dict]:
+        rng = self._rng("administrativos")
+        id_administrativo = 0
+        for id_usuario in range(1, self.escala.usuarios + 1):
+            if self._rol_usuario[id_usuario] != ROL_ADMINISTRATIVO:
+                continue
+            id_administrativo += 1
+            yield {"id_administrativo": id_administrativo, "id_usuario": id_usuario,
+                   "departamento": rng.choice(_DEPARTAMENTOS)}
+
+    # --- Ciclos e inscripciones ---------------------------------------------------------------
+
+    def _anios_ciclos(self) -> List[int]:
+        # Ciclos de agosto a julio; el último es el que contiene a `hoy`
+        actual = self.hoy.year if self.hoy >= date(self.hoy.year, 8, 1) else self.hoy.year - 1
+        return list(range(actual - self.escala.ciclos + 1, actual + 1))
+
+    def ciclos(self) -> Iterator[dict]:
+        for id_ciclo, anio in enumerate(self._anios_ciclos(), start=1):
+            yield {
+                "id_ciclo": id_ciclo,
+                "ciclo": f"{anio}-{anio + 1}",
+                "fecha_inicio": date(anio, 8, 1),
+                "fecha_final": date(anio + 1, 7, 15),
+            }
+
+    def inscripciones(self) -> Iterator[dict]:
+        rng = self._rng("inscripciones")
+        anios = self._anios_ciclos()
+        id_inscripcion = 0
+        for id_usuario in range(1, self.escala.usuarios + 1):
+            if self._rol_usuario[id_usuario] != ROL_ESTUDIANTE:
+                continue
+            # Ingreso en alguno de los ciclos; a lo más 5 ciclos por estudiante
+            ingreso = rng.randrange(len(anios))
+            for indice in range(ingreso, min(ingreso + 5, len(anios))):
+                anio = anios[indice]
+                id_inscripcion += 1
+                yield {
+                    "id_inscripcion": id_inscripcion,
+                    "id_usuario": id_usuario,
+                    "id_ciclo": indice + 1,
+                    "fecha_inscripcion": date(anio, 8, 1) - timedelta(days=rng.randrange(21)),
+                    "estado": "finalizada" if date(anio + 1, 7, 15) < self.hoy else "activa",
+                }
+
+    # --- Bibliotecas, laboratorios, catálogo y ejemplares ---------------------------------------
+
+    def bibliotecas(self) -> Iterator[dict]:
+        for i in range(1, self.escala.bibliotecas + 1):
+            yield {"id_biblioteca": i, "nombre": f"Biblioteca {i}", "ubicacion": f"Edificio B{i}, Ciudad Universitaria"}
+
+    def laboratorios(self) -> Iterator[dict]:
+        rng = self._rng("laboratorios")
+        for i in range(1, self.escala.laboratorios + 1):
+            yield {
+                "id_laboratorio": i,
+                "nombre": f"Laboratorio {i}",
+                "ubicacion": f"Edificio L{i}, Ciudad Universitaria",
+                # El responsable es un maestro, si la escala tiene alguno
+                "responsable_id": rng.choice(self._maestros) if self._maestros else None,
+            }
+
+    def total_catalogo(self) -> int:
+        return max(1, self.escala.ejemplares // self.escala.ejemplares_por_item)
+
+    def catalogo(self) -> Iterator[dict]:
+        rng = self._rng("catalogo")
+        self._es_libro = bytearray(self.total_catalogo() + 1)
+        for i in range(1, self.total_catalogo() + 1):
+            tipo = rng.choices(["libro", "equipo", "herramienta"], weights=[80, 12, 8])[0]
+            es_libro = tipo == "libro"
+            self._es_libro[i] = es_libro
+            yield {
+                "id_catalogo": i,
+                "tipo": tipo,
+                "nombre": f"{rng.choice(_PALABRAS)} de {rng.choice(_PALABRAS).lower()} {i}",
+                "autor": f"{rng.choice(_NOMBRES)} {rng.choice(_APELLIDOS)}" if es_libro else None,
+                "isbn": isbn13(rng) if es_libro else None,
+                "descripcion": None,
+            }
+
+    def ejemplares(self) -> Iterator[dict]:
+        rng = self._rng("ejemplares")
+        total_catalogo = self.total_catalogo()
+        for i in range(1, self.escala.ejemplares + 1):
+            id_catalogo = (i - 1) % total_catalogo + 1
+            # Libros casi siempre en bibliotecas; equipo y herramientas casi siempre en laboratorios
+            en_laboratorio = rng.random() < (0.05 if self._es_libro[id_catalogo] else 0.9)
+            if i in self.ejemplares_prestados:
+                estado = "prestado"
+            else:
+                estado = rng.choices(["disponible", "mantenimiento", "perdido"], weights=[96, 3, 1])[0]
+            yield {
+                "id_ejemplar": i,
+                "id_catalogo": id_catalogo,
+                "codigo_inventario": f"INV-{i:09d}",
+                "ubicacion": "laboratorio" if en_laboratorio else "biblioteca",
+                "id_laboratorio": rng.randint(1, self.escala.laboratorios) if en_laboratorio else None,
+                "id_biblioteca": None if en_laboratorio else rng.randint(1, self.escala.bibliotecas),
+                "estado": estado,
+                "version": 1,
+            }
+
+    # --- Préstamos ----------------------------------------------------------------------------
+
+    def _ejemplar_libre(self, rng: random.Random, libre_desde: array, dia: int) -> int:
+        """Un ejemplar sin préstamo el día `dia`: primero al azar y, si no, barriendo desde un punto al azar"""
+        total = self.escala.ejemplares
+        for _ in range(20):
+            candidato = rng.randint(1, total)
+            if libre_desde[candidato] <= dia:
+                return candidato
+        inicio = rng.randint(1, total)
+        for desplazamiento in range(total):
+            candidato = (inicio + desplazamiento - 1) % total + 1
+            if libre_desde[candidato] <= dia:
+                return candidato
+        raise ValueError("No quedan ejemplares libres; reduce los préstamos de la escala")
+
+    def prestamos(self) -> Iterator[dict]:
+        rng = self._rng("prestamos")
+        en_curso = sorted(self.ejemplares_prestados)
+        historicos = self.escala.prestamos - len(en_curso)
+        inicio_historia = self.hoy - timedelta(days=_DIAS_HISTORIA)
+        dias_historia = _DIAS_HISTORIA - _DIAS_ABIERTOS - _MAXIMO_DIAS_USO - 1
+        # Día (contado desde inicio_historia) a partir del cual cada ejemplar vuelve a estar libre
+        libre_desde = array("H", bytes(2 * (self.escala.ejemplares + 1)))
+        activos = self._usuarios_activos
+
+        for i in range(1, historicos + 1):
+            # Ids en orden cronológico, como los asignaría la BD; sin préstamos en domingo
+            dia = i * dias_historia // (historicos + 1)
+            fecha = inicio_historia + timedelta(days=dia)
+            if fecha.weekday() == 6:
+                dia += 1
+                fecha += timedelta(days=1)
+            id_ejemplar = self._ejemplar_libre(rng, libre_desde, dia)
+            plazo = rng.choice((7, 14, 14, 21))
+            # La mayoría devuelve a tiempo; una cola larga devuelve tarde
+            dias_uso = min(int(rng.expovariate(1 / (plazo * 0.7))) + 1, _MAXIMO_DIAS_USO)
+            libre_desde[id_ejemplar] = dia + dias_uso + 1
+            fecha_prestamo = datetime.combine(fecha, datetime.min.time()) + timedelta(
+                minutes=rng.randrange(8 * 60, 20 * 60))
+            yield {
+                "id_prestamo": i,
+                "id_usuario": activos[rng.randrange(len(activos))],
+                "id_ejemplar": id_ejemplar,
+                "fecha_prestamo": fecha_prestamo,
+                "fecha_devolucion_esperada": fecha + timedelta(days=plazo),
+                "fecha_devolucion_real": fecha_prestamo + timedelta(days=dias_uso, hours=rng.randrange(8)),
+                "estado": "completado",
+                "version": 2,
+            }
+
+        # Préstamos abiertos, también en orden cronológico (del más antiguo al más reciente)
+        aperturas = sorted(((rng.randrange(_DIAS_ABIERTOS), id_ejemplar) for id_ejemplar in en_curso), reverse=True)
+        for id_prestamo, (dias_desde_prestamo, id_ejemplar) in enumerate(aperturas, start=historicos + 1):
+            fecha = self.hoy - timedelta(days=dias_desde_prestamo)
+            esperada = fecha + timedelta(days=14)
+            yield {
+                "id_prestamo": id_prestamo,
+                "id_usuario": activos[rng.randrange(len(activos))],
+                "id_ejemplar": id_ejemplar,
+                "fecha_prestamo": datetime.combine(fecha, datetime.min.time()) + timedelta(
+                    minutes=rng.randrange(8 * 60, 20 * 60)),
+                "fecha_devolucion_esperada": esperada,
+                "fecha_devolucion_real": None,
+                "estado": "retrasado" if esperada < self.hoy else "activo",
+                "version": 1,
+            }
+
+    def poblar(self, engine: Engine, hash_contrasena: str,
+               informar: Optional[Callable[[str, int, float], None]] = None,
+               tamano_lote: int = TAMANO_LOTE) -> Dict[str, int]:
+        """Inserta todas las tablas en orden de dependencias; devuelve filas por tabla"""
+        self.preparar()
+        pasos = [
+            ("roles", RolDB, self.roles),
+            ("usuarios", UserDB, lambda: self.usuarios(hash_contrasena)),
+            ("carreras", CarreraDB, self.carreras),
+            ("estudiantes", EstudianteDB, self.estudiantes),
+            ("maestros", MaestroDB, self.maestros),
+            ("administrativos", AdministrativoDB, self.administrativos),
+            ("ciclos", CicloDB, self.ciclos),
+            ("inscripciones", InscripcionDB, self.inscripciones),
+            ("bibliotecas", BibliotecaDB, self.bibliotecas),
+            ("laboratorios", LaboratorioDB, self.laboratorios),
+            ("catalogo", CatalogoDB, self.catalogo),
+            ("ejemplares", EjemplarDB, self.ejemplares),
+            ("prestamos", PrestamoDB, self.prestamos),
+        ]
+        totales = {}
+        for nombre, modelo, filas in pasos:
+            inicio = time.perf_counter()
+            totales[nombre] = insertar(engine, modelo, filas(), tamano_lote)
+            if informar:
+                informar(nombre, totales[nombre], time.perf_counter() - inicio)
+
+        # Los contadores de ejemplares del catálogo los mantiene el repositorio; en la carga masiva se calculan al final
+        inicio = time.perf_counter()
+        with Session(engine) as session:
+            recalcular_todos(session)
+        if informar:
+            informar("contadores de catálogo", totales["catalogo"], time.perf_counter() - inicio)
+
+        # Igual con las estadísticas de préstamos: se anota el origen de cada préstamo y se reconstruyen
+        # de todo el histórico
+        inicio = time.perf_counter()
+        with Session(engine) as session:
+            anotar_origenes(session)
+            reconstruccion = reconstruir(session)
+        if informar:
+            informar("estadísticas", reconstruccion["filas_diarias"] + reconstruccion["filas_titulos"],
+                     time.perf_counter() - inicio)
+        return totales
+
+
+def _acelerar_sqlite(engine: Engine):
+    """Carga masiva en SQLite sin fsync ni diario en disco; solo para el engine de este CLI"""
+    @event.listens_for(engine, "connect")
+    def _pragmas(conexion_dbapi, _registro):
+        cursor = conexion_dbapi.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.close()
+
+
+def main(argv=None) -> int:
+    from sqlmodel import SQLModel, create_engine
+
+    from src.app.features.user.application.services.user_service import pwd_context
+
+    parser = argparse.ArgumentParser(description="Genera datos sintéticos del dominio UMSNH")
+    parser.add_argument("--url", required=True, help="URL SQLAlchemy de la BD destino (sin datos)")
+    parser.add_argument("--escala", choices=sorted(ESCALAS), default="pequena")
+    parser.add_argument("--usuarios", type=int, help="sobrescribe la cantidad de la escala")
+    parser.add_argument("--ejemplares", type=int, help="sobrescribe la cantidad de la escala")
+    parser.add_argument("--prestamos", type=int, help="sobrescribe la cantidad de la escala")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--lote", type=int, default=TAMANO_LOTE, help="filas por INSERT y por transacción")
+    parser.add_argument("--sin-crear-tablas", action="store_true", help="no ejecutar create_all")
+    args = parser.parse_args(argv)
+
+    cambios = {campo: getattr(args, campo) for campo in ("usuarios", "ejemplares", "prestamos")
+               if getattr(args, campo) is not None}
+    escala = replace(ESCALAS[args.escala], **cambios)
+
+    engine = create_engine(args.url)
+    if engine.dialect.name == "sqlite":
+        _acelerar_sqlite(engine)
+    if not args.sin_crear_tablas:
+        SQLModel.metadata.create_all(engine)
+
+    def informar(tabla, filas, segundos):
+        velocidad = filas / segundos if segundos else 0
+        print(f"  {tabla:<16} {filas:>11,} filas en {segundos:7.1f} s ({velocidad:,.0f} filas/s)", file=sys.stderr)
+
+    # Mismo contexto que el servicio de usuarios, así el login del benchmark e2e funciona con estos datos
+    hash_contrasena = pwd_context.hash(CONTRASENA)
+    inicio = time.perf_counter()
+    totales = GeneradorDatos(escala, semilla=args.semilla).poblar(engine, hash_contrasena, informar, args.lote)
+    print(f"{sum(totales.values()):,} filas en {time.perf_counter() - inicio:.1f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
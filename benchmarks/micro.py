@@ -0,0 +1,293 @@
+# benchmarks/micro.py
+"""Microbenchmarks del costo por fila de mappers, value objects y construcción de respuestas.
+
+Sin BD ni red: las filas salen del generador de datos sintéticos y cada caso se mide aislado.
+- `<feature>.to_domain` / `<feature>.to_db`: el mapper de infraestructura;
+- `<feature>.respuesta`: el endpoint de listado (GET /<feature>/) con un servicio que devuelve las
+  entidades ya cargadas, más la validación y serialización que hace FastAPI con su response_model;
+- `vo.<ValueObject>`: construcción validada de los value objects más usados.
+
+Cada caso reporta ns/fila (mínimo y mediana de las repeticiones) y, con tracemalloc, los bloques y
+bytes que quedan asignados por fila en el resultado, más el pico de memoria por fila.
+
+    python -m benchmarks.micro --filas 2000 --repeticiones 7
+    python -m benchmarks.micro --casos prestamos ejemplares vo.ISBN --salida micro.json
+    python -m benchmarks.micro --comparar anterior.json --salida actual.json
+"""
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import cycle, islice
+from typing import Any, Callable, Dict, List
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# feature -> (tabla del generador, módulo y clase del mapper, prefijo del router)
+FEATURES: Dict[str, tuple] = {
+    "rol": ("roles", "src.app.features.rol.infrastructure.mappers.rol_mapper", "RolMapper", "/roles"),
+    "user": ("usuarios", "src.app.features.user.infrastructure.mappers.user_mapper", "UserMapper", "/users"),
+    "carrera": ("carreras", "src.app.features.carrera.infrastructure.mappers.carrera_mapper", "CarreraMapper", "/carreras"),
+    "estudiante": ("estudiantes", "src.app.features.estudiante.infrastructure.mappers.estudiante_mapper",
+                   "EstudianteMapper", "/estudiantes"),
+    "ciclo": ("ciclos", "src.app.features.ciclo.infrastructure.mappers.ciclo_mapper", "CicloMapper", "/ciclos"),
+    "inscripcion": ("inscripciones", "src.app.features.inscripcion.infrastructure.mappers.inscripcion_mapper",
+                    "InscripcionMapper", "/inscripciones"),
+    "administrativo": ("administrativos", "src.app.features.administrativo.infrastructure.mappers.administrativo_mapper",
+                       "AdministrativoMapper", "/administrativos"),
+    "maestros": ("maestros", "src.app.features.maestros.infrastructure.mappers.maestro_mapper", "MaestroMapper", "/maestros"),
+    "bibliotecas": ("bibliotecas", "src.app.features.bibliotecas.infrastructure.mappers.biblioteca_mapper",
+                    "BibliotecaMapper", "/bibliotecas"),
+    "laboratorios": ("laboratorios", "src.app.features.laboratorios.infrastructure.mappers.laboratorio_mapper",
+                     "LaboratorioMapper", "/laboratorios"),
+    "catalogo": ("catalogo", "src.app.features.catalogo.infrastructure.mappers.catalogo_mapper", "CatalogoMapper", "/catalogo"),
+    "ejemplares": ("ejemplares", "src.app.features.ejemplares.infrastructure.mappers.ejemplar_mapper",
+                   "EjemplarMapper", "/ejemplares"),
+    "prestamos": ("prestamos", "src.app.features.prestamos.infrastructure.mappers.prestamo_mapper",
+                  "PrestamoMapper", "/prestamos"),
+}
+
+
+@dataclass(frozen=True)
+class Caso:
+    nombre: str
+    # Construye las entradas fuera de la medición
+    preparar: Callable[[], List[Any]]
+    # Procesa todas las entradas; el resultado se conserva para medir lo que queda asignado
+    ejecutar: Callable[[List[Any]], Any]
+
+
+class _ServicioFijo:
+    """Servicio de listado que devuelve entidades ya construidas: aísla el router de la BD"""
+
+    def __init__(self, entidades: List[Any]):
+        self._entidades = entidades
+
+    def get_all(self):
+        return self._entidades
+
+
+def filas_sinteticas(cantidad: int, semilla: int) -> Dict[str, List[dict]]:
+    """`cantidad` filas por tabla; las tablas pequeñas (roles, ciclos...) se repiten hasta llenarla"""
+    from benchmarks.generador_datos import Escala, GeneradorDatos
+
+    escala = Escala(usuarios=cantidad, ejemplares=cantidad, prestamos=cantidad)
+    generador = GeneradorDatos(escala, semilla=semilla)
+    generador.preparar()
+    fuentes = {
+        "roles": generador.roles,
+        # El hash no se verifica aquí; basta con que tenga la forma de uno real
+        "usuarios": lambda: generador.usuarios("$2b$12$" + "x" * 53),
+        "carreras": generador.carreras,
+        "estudiantes": generador.estudiantes,
+        "ciclos": generador.ciclos,
+        "inscripciones": generador.inscripciones,
+        "administrativos": generador.administrativos,
+        "maestros": generador.maestros,
+        "bibliotecas": generador.bibliotecas,
+        "laboratorios": generador.laboratorios,
+        # catalogo antes que ejemplares: decide qué items son libros
+        "catalogo": generador.catalogo,
+        "ejemplares": generador.ejemplares,
+        "prestamos": generador.prestamos,
+    }
+    filas = {}
+    for tabla, fuente in fuentes.items():
+        generadas = list(islice(fuente(), cantidad))
+        filas[tabla] = list(islice(cycle(generadas), cantidad)) if generadas else []
+    return filas
+
+
+def _ruta_listado(prefijo: str):
+    from src.app.core.startup.routers_diferidos import ROUTERS_FEATURES
+
+    modulo = importlib.import_module(dict(ROUTERS_FEATURES)[prefijo])
+    for ruta in modulo.router.routes:
+        if ruta.path == f"{prefijo}/" and "GET" in ruta.methods:
+            return ruta
+    raise LookupError(f"{prefijo} no tiene endpoint de listado")
+
+
+def _responder(ruta, entidades: List[Any]):
+    # Lo mismo que hace FastAPI (fastapi.routing.serialize_response) para un endpoint síncrono
+    contenido = ruta.endpoint(service=_ServicioFijo(entidades))
+    if not contenido.success:
+        raise RuntimeError(f"{ruta.path} respondió con error: {contenido.errors}")
+    valor, errores = ruta.response_field.validate(contenido, {}, loc=("response",))
+    if errores:
+        raise RuntimeError(f"{ruta.path} no cumple su response_model: {errores}")
+    return ruta.response_field.serialize(valor)
+
+
+def casos_features(filas: Dict[str, List[dict]]) -> List[Caso]:
+    casos = []
+    for feature, (tabla, modulo_mapper, clase_mapper, prefijo) in FEATURES.items():
+        mapper = getattr(importlib.import_module(modulo_mapper), clase_mapper)
+        modelo = mapper.to_domain.__annotations__[next(iter(mapper.to_domain.__annotations__))]
+        ruta = _ruta_listado(prefijo)
+
+        def modelos(modelo=modelo, tabla=tabla):
+            return [modelo(**fila) for fila in filas[tabla]]
+
+        def entidades(modelos=modelos, mapper=mapper):
+            return [mapper.to_domain(m) for m in modelos()]
+
+        casos += [
+            Caso(f"{feature}.to_domain", modelos, lambda xs, mapper=mapper: [mapper.to_domain(x) for x in xs]),
+            Caso(f"{feature}.to_db", entidades, lambda xs, mapper=mapper: [mapper.to_db(x) for x in xs]),
+            Caso(f"{feature}.respuesta", entidades, lambda xs, ruta=ruta: _responder(ruta, xs)),
+        ]
+    return casos
+
+
+def casos_value_objects(filas: Dict[str, List[dict]]) -> List[Caso]:
+    from src.app.features.catalogo.domain.value_objects.isbn import ISBN
+    from src.app.features.prestamos.domain.value_objects.fechas_prestamo import FechasPrestamo
+    from src.app.features.user.domain.value_objects.email import EmailValueObject
+    from src.app.features.user.domain.value_objects.matricula import MatriculaValueObject
+    from src.app.features.ejemplares.domain.value_objects.codigo_inventario import CodigoInventario
+    from src.app.features.ciclo.domain.value_objects.nombre_ciclo import NombreCicloValueObject
+    from src.app.features.ciclo.domain.value_objects.rango_fechas import RangoFechasValueObject
+
+    cantidad = len(filas["usuarios"])
+    isbns = [f["isbn"] for f in filas["catalogo"] if f["isbn"]] or ["9780306406157"]
+    ahora = datetime.now()
+    # Ruta de creación: la devolución esperada siempre en el futuro, como al prestar
+    fechas = [(ahora, ahora.date() + timedelta(days=7 + i % 14)) for i in range(cantidad)]
+
+    def repetir(valores):
+        return lambda: list(islice(cycle(valores), cantidad))
+
+    return [
+        Caso("vo.ISBN", repetir(isbns), lambda xs: [ISBN(valor=x) for x in xs]),
+        Caso("vo.FechasPrestamo", repetir(fechas), lambda xs: [
+            FechasPrestamo(fecha_prestamo=p, fecha_devolucion_esperada=e) for p, e in xs]),
+        Caso("vo.Email", repetir([f["email"] for f in filas["usuarios"]]),
+             lambda xs: [EmailValueObject(valor=x) for x in xs]),
+        Caso("vo.Matricula", repetir([f["matricula"] for f in filas["usuarios"]]),
+             lambda xs: [MatriculaValueObject(valor=x) for x in xs]),
+        Caso("vo.CodigoInventario", repetir([f["codigo_inventario"] for f in filas["ejemplares"]]),
+             lambda xs: [CodigoInventario(valor=x) for x in xs]),
+        Caso("vo.NombreCiclo", repetir([f["ciclo"] for f in filas["ciclos"]]),
+             lambda xs: [NombreCicloValueObject(valor=x) for x in xs]),
+        Caso("vo.RangoFechas", repetir([(f["fecha_inicio"], f["fecha_final"]) for f in filas["ciclos"]]),
+             lambda xs: [RangoFechasValueObject(fecha_inicio=i, fecha_final=f) for i, f in xs]),
+    ]
+
+
+def medir(caso: Caso, repeticiones: int) -> dict:
+    entradas = caso.preparar()
+    total = len(entradas)
+    # Calentamiento: cachés de pydantic y de los validadores fuera de la medición
+    caso.ejecutar(entradas[:100])
+
+    tiempos = []
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter_ns()
+        resultado = caso.ejecutar(entradas)
+        tiempos.append(time.perf_counter_ns() - inicio)
+        del resultado
+
+    # Asignaciones en una pasada aparte: tracemalloc multiplica el tiempo de cada asignación
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        resultado = caso.ejecutar(entradas)
+        actual, pico = tracemalloc.get_traced_memory()
+        despues = tracemalloc.take_snapshot()
+        bloques = sum(e.count for e in despues.statistics("filename")) - sum(e.count for e in antes.statistics("filename"))
+        del resultado
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "filas": total,
+        "ns_fila_min": round(min(tiempos) / total, 1),
+        "ns_fila_mediana": round(statistics.median(tiempos) / total, 1),
+        # Lo que queda asignado por fila en el resultado (objetos vivos) y el pico transitorio
+        "bloques_fila": round(bloques / total, 2),
+        "bytes_fila": round((actual - base) / total, 1),
+        "pico_bytes_fila": round((pico - base) / total, 1),
+    }
+
+
+def comparar(anterior: dict, actual: dict, umbral: float) -> List[str]:
+    """Casos cuyo ns/fila (mediana) empeoró más que `umbral` (fracción) respecto a una ejecución anterior"""
+    regresiones = []
+    for nombre, resumen in actual["casos"].items():
+        previo = anterior.get("casos", {}).get(nombre)
+        if not previo:
+            continue
+        cambio = resumen["ns_fila_mediana"] / previo["ns_fila_mediana"] - 1
+        marca = "REGRESIÓN" if cambio > umbral else ""
+        print(f"  {nombre:<28} {previo['ns_fila_mediana']:>10.0f} -> {resumen['ns_fila_mediana']:>10.0f} ns/fila "
+              f"({cambio:+.0%}) {marca}", file=sys.stderr)
+        if cambio > umbral:
+            regresiones.append(nombre)
+    return regresiones
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filas", type=int, default=2000, help="filas por caso")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--casos", nargs="+", help="prefijos de los casos a correr (p. ej. prestamos vo.ISBN)")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto stdout)")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior para reportar regresiones")
+    parser.add_argument("--umbral-regresion", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, _RAIZ_PROYECTO)
+    # Nada toca la BD, pero importar los routers crea el engine
+    os.environ["URL_CONECCION"] = "sqlite://"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    from benchmarks.e2e import _commit_actual
+
+    filas = filas_sinteticas(args.filas, args.semilla)
+    casos = casos_features(filas) + casos_value_objects(filas)
+    if args.casos:
+        casos = [c for c in casos if c.nombre.startswith(tuple(args.casos))]
+
+    resultados = {}
+    print(f"{'caso':<28} {'ns/fila':>10} {'bloques/fila':>13} {'bytes/fila':>11} {'pico/fila':>10}", file=sys.stderr)
+    for caso in casos:
+        resultados[caso.nombre] = r = medir(caso, args.repeticiones)
+        print(f"{caso.nombre:<28} {r['ns_fila_mediana']:>10.0f} {r['bloques_fila']:>13.1f} "
+              f"{r['bytes_fila']:>11.0f} {r['pico_bytes_fila']:>10.0f}", file=sys.stderr)
+
+    resultado = {
+        "commit": _commit_actual(),
+        "fecha": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "repeticiones": args.repeticiones,
+        "casos": resultados,
+    }
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            if comparar(json.load(archivo), resultado, args.umbral_regresion):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
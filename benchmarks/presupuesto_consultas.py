@@ -0,0 +1,151 @@
+# benchmarks/presupuesto_consultas.py
+"""Presupuesto de sentencias SQL por endpoint, para CI.
+
+Levanta la app con TestClient contra una BD SQLite temporal poblada con el generador sintético, hace
+una petición por endpoint y falla (código 1) si alguno ejecuta más sentencias de las presupuestadas.
+El número de sentencias de un endpoint no debe crecer con los datos: un recorrido completo de una
+tabla o un N+1 que se cuele en un servicio aparece aquí aunque las pruebas funcionales pasen.
+
+    python -m benchmarks.presupuesto_consultas
+    python -m benchmarks.presupuesto_consultas --medir      # solo reporta, para ajustar la tabla
+"""
+import argparse
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class Presupuesto:
+    descripcion: str
+    peticion: Callable[["TestClient", Dict[str, object]], "Response"]
+    maximo: Optional[int] = None
+    exacto: Optional[int] = None
+
+
+def _crear_prestamo(cliente, ids):
+    respuesta = cliente.post("/prestamos/", json={
+        "id_usuario": ids["usuario"],
+        "id_ejemplar": ids["ejemplar_disponible"],
+        "fecha_devolucion_esperada": (date.today() + timedelta(days=14)).isoformat(),
+    })
+    if respuesta.json().get("success"):
+        ids["prestamo_creado"] = respuesta.json()["data"]["id_prestamo"]
+    return respuesta
+
+
+# En este orden: renovar y devolver usan el préstamo que crea POST /prestamos/
+PRESUPUESTOS: List[Presupuesto] = [
+    Presupuesto("POST /users/login", lambda c, ids: c.post("/users/login", json={
+        "email": f"usuario{ids['usuario']}@umich.mx", "contraseña": ids["contrasena"]}), maximo=1),
+    Presupuesto("GET /users/detalles/", lambda c, ids: c.get("/users/detalles/"), exacto=1),
+    Presupuesto("GET /estudiantes/detalles/", lambda c, ids: c.get("/estudiantes/detalles/"), exacto=1),
+    Presupuesto("GET /maestros/detalles/", lambda c, ids: c.get("/maestros/detalles/"), exacto=1),
+    Presupuesto("GET /ejemplares/detalles/", lambda c, ids: c.get("/ejemplares/detalles/"), exacto=1),
+    Presupuesto("GET /ejemplares/disponibles/prestamo", lambda c, ids: c.get("/ejemplares/disponibles/prestamo"),
+                maximo=1),
+    Presupuesto("GET /prestamos/detalles/", lambda c, ids: c.get("/prestamos/detalles/"), exacto=1),
+    Presupuesto("GET /prestamos/{id}/detalles", lambda c, ids: c.get(f"/prestamos/{ids['prestamo']}/detalles"),
+                exacto=1),
+    Presupuesto("GET /prestamos/usuario/{id}/detalles",
+                lambda c, ids: c.get(f"/prestamos/usuario/{ids['usuario']}/detalles"), exacto=1),
+    # Leer usuario y ejemplar (con el tipo de su catálogo), UPDATE versionado del ejemplar, ajuste de los
+    # contadores del catálogo, INSERT y un upsert por tabla de estadísticas; sin recorrer préstamos activos
+    Presupuesto("POST /prestamos/", _crear_prestamo, maximo=7),
+    Presupuesto("POST /prestamos/{id}/renovar",
+                lambda c, ids: c.post(f"/prestamos/{ids['prestamo_creado']}/renovar", json={
+                    "nueva_fecha_devolucion": (date.today() + timedelta(days=21)).isoformat()}), maximo=2),
+    Presupuesto("POST /prestamos/{id}/devolver",
+                lambda c, ids: c.post(f"/prestamos/{ids['prestamo_creado']}/devolver", json={}), maximo=6),
+    # Una sola lectura en columnas; días, multas y antigüedad se calculan en memoria
+    Presupuesto("GET /prestamos/reportes/multas", lambda c, ids: c.get("/prestamos/reportes/multas"), exacto=1),
+    # Las estadísticas leen solo los rollups, nunca Prestamos
+    Presupuesto("GET /estadisticas/prestamos/diarias", lambda c, ids: c.get("/estadisticas/prestamos/diarias"),
+                exacto=1),
+    Presupuesto("GET /estadisticas/prestamos/resumen", lambda c, ids: c.get("/estadisticas/prestamos/resumen"),
+                exacto=1),
+    Presupuesto("GET /estadisticas/prestamos/bibliotecas",
+                lambda c, ids: c.get("/estadisticas/prestamos/bibliotecas"), exacto=1),
+    Presupuesto("GET /estadisticas/prestamos/titulos", lambda c, ids: c.get("/estadisticas/prestamos/titulos"),
+                exacto=1),
+]
+
+
+def preparar_app(url: str):
+    """Importa la app contra `url`, crea el esquema y lo puebla; devuelve (app, engine, ids de ejemplo)"""
+    os.environ["URL_CONECCION"] = url
+    os.environ["LAZY_ROUTERS"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    import main
+    from sqlmodel import SQLModel, Session, select
+    from src.app.core.database.database import engine
+    from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
+    from src.app.features.prestamos.infrastructure.models.prestamo_model import PrestamoDB
+    from src.app.features.user.application.services.user_service import pwd_context
+    from benchmarks.generador_datos import CONTRASENA, Escala, GeneradorDatos
+
+    SQLModel.metadata.create_all(engine)
+    # Pocos datos: lo que se presupuesta es el número de sentencias, no su duración
+    escala = Escala(usuarios=200, ejemplares=400, prestamos=1_000, bibliotecas=3, laboratorios=3, carreras=5, ciclos=3)
+    GeneradorDatos(escala).poblar(engine, pwd_context.hash(CONTRASENA))
+
+    with Session(engine) as session:
+        ejemplar = session.exec(select(EjemplarDB.id_ejemplar).where(EjemplarDB.estado == "disponible")).first()
+        prestamo = session.exec(select(PrestamoDB.id_prestamo).where(PrestamoDB.estado == "activo")).first()
+    ids = {"usuario": 1, "ejemplar_disponible": ejemplar, "prestamo": prestamo, "contrasena": CONTRASENA}
+    return main.app, engine, ids
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="URL de una BD vacía (por defecto SQLite en un archivo temporal)")
+    parser.add_argument("--medir", action="store_true", help="solo reporta las sentencias, sin fallar")
+    parser.add_argument("--verbose", action="store_true", help="lista las sentencias de cada endpoint")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, _RAIZ_PROYECTO)
+    with tempfile.TemporaryDirectory() as directorio:
+        url = args.url or f"sqlite:///{os.path.join(directorio, 'presupuesto.db')}"
+        app, engine, ids = preparar_app(url)
+
+        from fastapi.testclient import TestClient
+        from src.app.core.observability.query_budget import (
+            PresupuestoConsultasExcedido, registrar_sentencias, verificar_presupuesto,
+        )
+
+        fallos = 0
+        # Con el lifespan: las cachés de referencia ya están calientes, como en producción
+        with TestClient(app) as cliente:
+            for presupuesto in PRESUPUESTOS:
+                with registrar_sentencias(engine) as registro:
+                    respuesta = presupuesto.peticion(cliente, ids)
+                cuerpo = respuesta.json()
+                limite = f"= {presupuesto.exacto}" if presupuesto.exacto is not None else f"<= {presupuesto.maximo}"
+                if not cuerpo.get("success"):
+                    fallos += 1
+                    print(f"ERROR    {presupuesto.descripcion}: la petición falló: {cuerpo.get('errors') or cuerpo}", file=sys.stderr)
+                    continue
+                try:
+                    verificar_presupuesto(registro, presupuesto.maximo, presupuesto.exacto, presupuesto.descripcion)
+                    marca = "ok"
+                except PresupuestoConsultasExcedido as e:
+                    marca = "medido" if args.medir else "EXCEDE"
+                    fallos += not args.medir
+                    if not args.medir:
+                        print(e, file=sys.stderr)
+                print(f"{marca:<8} {presupuesto.descripcion:<40} {registro.total:>3} sentencias ({limite})", file=sys.stderr)
+                if args.verbose:
+                    print(registro.resumen(), file=sys.stderr)
+        engine.dispose()
+
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,45 +1,70 @@
 from fastapi import FastAPI
-import os
 from dotenv import load_dotenv
 
-from src.app.features.user.presentation.routers.user_router import router as user_router
-from src.app.features.rol.presentation.routers.rol_router import router as rol_router
-from src.app.features.carrera.presentation.routers.carrera_router import router as carrera_router
-from src.app.features.estudiante.presentation.routers.estudiante_router import router as estudiante_router
-from src.app.features.ciclo.presentation.routers.ciclo_router import router as ciclo_router
-from src.app.features.inscripcion.presentation.routers.inscripcion_router import router as inscripcion_router
-from src.app.features.administrativo.presentation.routers.administrativo_router import router as administrativo_router
-from src.app.features.maestros.presentation.routers.maestro_router import router as maestros_router
-from src.app.features.bibliotecas.presentation.routers.biblioteca_router import router as bibliotecas_router
-from src.app.features.laboratorios.presentation.routers.laboratorio_router import router as laboratorios_router
-from src.app.features.catalogo.presentation.routers.catalogo_router import router as catalogo_router
-from src.app.features.ejemplares.presentation.routers.ejemplar_router import router as ejemplares_router
-from src.app.features.prestamos.presentation.routers.prestamo_router import router as prestamos_router
+from src.app.core.database.database import engine, engines_replica, selector_replicas
+from src.app.core.database.replicas import LecturaPropiaMiddleware
+from src.app.core.observability.db_events import instrumentar_engine
+from src.app.core.observability.query_counter import QueryCounterMiddleware, registrar_contador_consultas
+from src.app.core.observability.metrics import MetricsMiddleware, endpoint_metricas, instrumentar_metricas
+from src.app.core.observability.slow_query import registrar_consultas_lentas
+from src.app.core.observability.tracing import configurar_tracing, instrumentar_capas
+from src.app.core.observability.profiler import ProfilerMiddleware, instrumentar_endpoints
+from src.app.core.observability.memory import MemoryMiddleware
+from src.app.core.observability.sentry import inicializar_sentry
+from src.app.core.observability.logging_config import configurar_logging
+from src.app.core.admin.admin_router import router as admin_router
+from src.app.core.health.health_router import router as health_router
+from src.app.core.startup.routers_diferidos import al_cargar_routers, registrar_routers
+from src.app.core.startup.documentacion import opciones_documentacion
+from src.app.core.startup.warmup import lifespan
 
 load_dotenv()
-db_username = os.getenv('USER_DB')
 
-print(db_username)
+# Logs JSON por una cola: el formateo y la escritura ocurren fuera del hilo de la petición
+configurar_logging()
 
+# Sentry opcional (SENTRY_DSN); se inicializa antes de crear la app para que sus integraciones la envuelvan
+inicializar_sentry()
 
+# OPENAPI_ENABLED=false quita /openapi.json, /docs y /redoc (producción); el lifespan calienta
+# pool, cachés y validadores antes de aceptar tráfico (WARMUP_ENABLED)
+app = FastAPI(title="Sistema UMSNH", version="1.0.0", lifespan=lifespan, **opciones_documentacion())
 
+# Conteo de consultas por petición (cabeceras X-DB-*, logs y detección de N+1)
+registrar_contador_consultas(engine)
+app.add_middleware(QueryCounterMiddleware)
 
-app = FastAPI(title="Sistema UMSNH", version="1.0.0")
+# Lecturas de repositorios @lectura_replica a las réplicas (URL_REPLICAS); las sentencias de las
+# réplicas alimentan los mismos contadores, métricas y trazas que las de la primaria
+for replica in engines_replica:
+    instrumentar_engine(replica)
+app.add_middleware(LecturaPropiaMiddleware, selector=selector_replicas)
 
-# Registrar routers
-app.include_router(rol_router)
-app.include_router(user_router)
-app.include_router(carrera_router) 
-app.include_router(estudiante_router)
-app.include_router(ciclo_router)
-app.include_router(inscripcion_router)
-app.include_router(administrativo_router)
-app.include_router(maestros_router)
-app.include_router(bibliotecas_router)
-app.include_router(laboratorios_router)
-app.include_router(catalogo_router)
-app.include_router(ejemplares_router)
-app.include_router(prestamos_router)
+# Métricas Prometheus en /metrics
+instrumentar_metricas(engine)
+app.add_middleware(MetricsMiddleware)
+app.add_route("/metrics", endpoint_metricas, include_in_schema=False)
+
+# Consultas que superan SLOW_QUERY_THRESHOLD_MS, consultables en /admin/consultas-lentas
+registrar_consultas_lentas(engine)
+
+# Registrar routers; con LAZY_ROUTERS=true cada feature se importa en la primera petición a su prefijo
+registrar_routers(app)
+app.include_router(admin_router)
+app.include_router(health_router)
+
+# Trazas OpenTelemetry router → servicio → repositorio → SQL (OTEL_TRACES_EXPORTER); va después de
+# registrar los routers para que servicios y repositorios ya estén importados
+if configurar_tracing(app, engine):
+    al_cargar_routers(lambda _app: instrumentar_capas())
+
+# Perfilado por muestreo de peticiones individuales (cabecera X-Profile firmada o /admin/perfilador)
+instrumentar_endpoints(app)
+al_cargar_routers(instrumentar_endpoints)
+app.add_middleware(ProfilerMiddleware)
+
+# Pico de memoria por ruta, solo mientras el trazado de /admin/memoria está encendido
+app.add_middleware(MemoryMiddleware)
 
 
 @app.get("/")
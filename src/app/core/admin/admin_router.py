@@ -0,0 +1,291 @@
+# src/app/core/admin/admin_router.py
+import tracemalloc
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+from typing import Literal
+from src.app.core.admin.dependencies import admin_dep
+from src.app.core.admin.schemas import (
+    ConsultaLentaResponse,
+    ConsultasLentasListResponse,
+    ArmarPerfiladorRequest,
+    PerfilResumenResponse,
+    PerfilesListResponse,
+    IniciarMemoriaRequest,
+    TomarSnapshotRequest,
+    EstadoMemoriaResponse,
+    CapaMemoriaResponse,
+    SnapshotMemoriaResponse,
+    SnapshotsMemoriaListResponse,
+    AsignadorResponse,
+    SnapshotMayoresResponse,
+    DiferenciaAsignadorResponse,
+    DiferenciaCapaResponse,
+    DiferenciaMemoriaResponse,
+    MemoriaRutaResponse,
+    MemoriaRutasListResponse
+)
+from src.app.core.observability import slow_query
+from src.app.core.observability.memory import diagnostico_memoria, rss_bytes
+from src.app.core.observability.profiler import almacen_perfiles
+from src.app.shared.schemas.generic_response import GenericResponse
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[admin_dep])
+
+@router.get("/consultas-lentas", response_model=ConsultasLentasListResponse)
+def get_consultas_lentas():
+    """Consultas que superaron el umbral, de la más lenta a la más rápida, con su EXPLAIN"""
+    registro = slow_query.registro_consultas_lentas
+    if registro is None:
+        return GenericResponse.create_error(
+            message="Registro de consultas lentas no activo",
+            errors=["El registro de consultas lentas no está habilitado"],
+            status=404
+        )
+
+    consultas_response = [
+        ConsultaLentaResponse(
+            fecha=consulta.fecha,
+            duracion_ms=round(consulta.duracion_ms, 2),
+            sentencia=consulta.sentencia,
+            parametros=consulta.parametros,
+            repositorio=consulta.repositorio,
+            explain=consulta.explain
+        ) for consulta in registro.consultas()
+    ]
+
+    return GenericResponse.create_success(
+        message="Consultas lentas obtenidas exitosamente",
+        data=consultas_response,
+        status=200
+    )
+
+@router.delete("/consultas-lentas", response_model=GenericResponse[dict])
+def limpiar_consultas_lentas():
+    """Vacía el buffer de consultas lentas"""
+    registro = slow_query.registro_consultas_lentas
+    if registro is not None:
+        registro.limpiar()
+
+    return GenericResponse.create_success(
+        message="Registro de consultas lentas vaciado",
+        data={},
+        status=200
+    )
+
+@router.post("/perfilador", response_model=GenericResponse[dict])
+def armar_perfilador(request: ArmarPerfiladorRequest):
+    """Perfila las próximas `veces` peticiones a `ruta` en este worker"""
+    almacen_perfiles.armar(request.ruta, request.veces)
+
+    return GenericResponse.create_success(
+        message="Perfilador armado exitosamente",
+        data={"ruta": request.ruta, "veces": request.veces},
+        status=200
+    )
+
+@router.get("/perfiles", response_model=PerfilesListResponse)
+def get_perfiles():
+    """Perfiles capturados, del más reciente al más antiguo"""
+    perfiles_response = [
+        PerfilResumenResponse(
+            id_perfil=perfil.id,
+            nombre=perfil.nombre,
+            duracion_ms=round(perfil.duracion_ms, 2),
+            muestras=sum(sum(contador.values()) for contador in perfil.muestras.values())
+        ) for perfil in almacen_perfiles.listar()
+    ]
+
+    return GenericResponse.create_success(
+        message="Perfiles obtenidos exitosamente",
+        data=perfiles_response,
+        status=200
+    )
+
+@router.get("/perfiles/{id_perfil}")
+def get_perfil(id_perfil: int, formato: Literal["speedscope", "collapsed"] = "speedscope"):
+    """Descarga un perfil en formato speedscope (JSON) o de pilas colapsadas"""
+    perfil = almacen_perfiles.obtener(id_perfil)
+    if not perfil:
+        return GenericResponse.create_error(
+            message="Perfil no encontrado",
+            errors=[f"Perfil con ID {id_perfil} no existe"],
+            status=404
+        )
+
+    if formato == "collapsed":
+        return PlainTextResponse(perfil.a_collapsed())
+    return JSONResponse(perfil.a_speedscope())
+
+
+def _estado_memoria() -> EstadoMemoriaResponse:
+    trazada, pico = tracemalloc.get_traced_memory()
+    return EstadoMemoriaResponse(
+        activo=diagnostico_memoria.activo,
+        trazada_bytes=trazada,
+        pico_bytes=pico,
+        rss_bytes=rss_bytes()
+    )
+
+def _snapshot_response(guardado) -> SnapshotMemoriaResponse:
+    return SnapshotMemoriaResponse(
+        id_snapshot=guardado.id,
+        etiqueta=guardado.etiqueta,
+        fecha=guardado.fecha,
+        trazada_bytes=guardado.trazada_bytes,
+        pico_bytes=guardado.pico_bytes,
+        rss_bytes=guardado.rss_bytes
+    )
+
+@router.get("/memoria", response_model=GenericResponse[EstadoMemoriaResponse])
+def get_estado_memoria():
+    """Estado de tracemalloc y RSS de este worker"""
+    return GenericResponse.create_success(
+        message="Estado de memoria obtenido exitosamente",
+        data=_estado_memoria(),
+        status=200
+    )
+
+@router.post("/memoria/iniciar", response_model=GenericResponse[EstadoMemoriaResponse])
+def iniciar_memoria(request: IniciarMemoriaRequest):
+    """Enciende tracemalloc en este worker; descarta los snapshots y la memoria por ruta anteriores"""
+    diagnostico_memoria.iniciar(request.marcos)
+
+    return GenericResponse.create_success(
+        message="Trazado de memoria iniciado",
+        data=_estado_memoria(),
+        status=200
+    )
+
+@router.post("/memoria/detener", response_model=GenericResponse[EstadoMemoriaResponse])
+def detener_memoria():
+    """Apaga tracemalloc; los snapshots ya tomados siguen disponibles"""
+    diagnostico_memoria.detener()
+
+    return GenericResponse.create_success(
+        message="Trazado de memoria detenido",
+        data=_estado_memoria(),
+        status=200
+    )
+
+@router.post("/memoria/snapshots", response_model=GenericResponse[SnapshotMemoriaResponse])
+def tomar_snapshot_memoria(request: TomarSnapshotRequest):
+    """Toma un snapshot de las asignaciones vivas"""
+    if not diagnostico_memoria.activo:
+        return GenericResponse.create_error(
+            message="Trazado de memoria no activo",
+            errors=["Inicia el trazado con POST /admin/memoria/iniciar"],
+            status=409
+        )
+
+    guardado = diagnostico_memoria.tomar_snapshot(request.etiqueta)
+
+    return GenericResponse.create_success(
+        message="Snapshot tomado exitosamente",
+        data=_snapshot_response(guardado),
+        status=201
+    )
+
+@router.get("/memoria/snapshots", response_model=SnapshotsMemoriaListResponse)
+def get_snapshots_memoria():
+    """Snapshots guardados, del más antiguo al más reciente"""
+    return GenericResponse.create_success(
+        message="Snapshots obtenidos exitosamente",
+        data=[_snapshot_response(guardado) for guardado in diagnostico_memoria.listar()],
+        status=200
+    )
+
+@router.get("/memoria/snapshots/{id_snapshot}", response_model=GenericResponse[SnapshotMayoresResponse])
+def get_snapshot_memoria(
+    id_snapshot: int,
+    agrupar: Literal["lineno", "filename", "traceback"] = "lineno",
+    limite: int = Query(default=20, ge=1, le=500)
+):
+    """Mayores asignadores del snapshot y reparto por capa (orm, dominio, respuesta, otros)"""
+    guardado = diagnostico_memoria.obtener(id_snapshot)
+    if not guardado:
+        return GenericResponse.create_error(
+            message="Snapshot no encontrado",
+            errors=[f"Snapshot con ID {id_snapshot} no existe"],
+            status=404
+        )
+
+    snapshot_response = SnapshotMayoresResponse(
+        snapshot=_snapshot_response(guardado),
+        capas={capa: CapaMemoriaResponse(**valores) for capa, valores in guardado.capas().items()},
+        asignadores=[AsignadorResponse(**a) for a in diagnostico_memoria.mayores(guardado, agrupar, limite)]
+    )
+
+    return GenericResponse.create_success(
+        message="Snapshot obtenido exitosamente",
+        data=snapshot_response,
+        status=200
+    )
+
+@router.get("/memoria/diferencia", response_model=GenericResponse[DiferenciaMemoriaResponse])
+def get_diferencia_memoria(
+    base: int,
+    actual: int,
+    agrupar: Literal["lineno", "filename", "traceback"] = "lineno",
+    limite: int = Query(default=20, ge=1, le=500)
+):
+    """Asignadores y capas que más crecieron entre dos snapshots"""
+    guardado_base = diagnostico_memoria.obtener(base)
+    guardado_actual = diagnostico_memoria.obtener(actual)
+    faltantes = [id_snapshot for id_snapshot, guardado in ((base, guardado_base), (actual, guardado_actual)) if not guardado]
+    if faltantes:
+        return GenericResponse.create_error(
+            message="Snapshot no encontrado",
+            errors=[f"Snapshot con ID {id_snapshot} no existe" for id_snapshot in faltantes],
+            status=404
+        )
+
+    diferencia_response = DiferenciaMemoriaResponse(
+        base=_snapshot_response(guardado_base),
+        actual=_snapshot_response(guardado_actual),
+        capas={
+            capa: DiferenciaCapaResponse(**valores)
+            for capa, valores in diagnostico_memoria.diferencia_capas(guardado_base, guardado_actual).items()
+        },
+        asignadores=[
+            DiferenciaAsignadorResponse(**a)
+            for a in diagnostico_memoria.diferencia(guardado_base, guardado_actual, agrupar, limite)
+        ]
+    )
+
+    return GenericResponse.create_success(
+        message="Diferencia de memoria obtenida exitosamente",
+        data=diferencia_response,
+        status=200
+    )
+
+@router.get("/memoria/rutas", response_model=MemoriaRutasListResponse)
+def get_memoria_rutas():
+    """Pico y memoria retenida por ruta desde que se inició el trazado, de mayor a menor pico"""
+    rutas_response = [
+        MemoriaRutaResponse(
+            ruta=ruta,
+            peticiones=memoria.peticiones,
+            pico_max_bytes=memoria.pico_max_bytes,
+            pico_promedio_bytes=memoria.pico_total_bytes // memoria.peticiones,
+            retenida_promedio_bytes=memoria.retenida_total_bytes // memoria.peticiones,
+            retenida_total_bytes=memoria.retenida_total_bytes
+        ) for ruta, memoria in diagnostico_memoria.rutas().items()
+    ]
+    rutas_response.sort(key=lambda r: r.pico_max_bytes, reverse=True)
+
+    return GenericResponse.create_success(
+        message="Memoria por ruta obtenida exitosamente",
+        data=rutas_response,
+        status=200
+    )
+
+@router.delete("/memoria/rutas", response_model=GenericResponse[dict])
+def limpiar_memoria_rutas():
+    """Reinicia la memoria por ruta sin apagar el trazado"""
+    diagnostico_memoria.limpiar_rutas()
+
+    return GenericResponse.create_success(
+        message="Memoria por ruta reiniciada",
+        data={},
+        status=200
+    )
@@ -0,0 +1,18 @@
+# src/app/core/admin/dependencies.py
+import hmac
+import os
+from typing import Annotated, Optional
+
+from fastapi import Depends, Header, HTTPException, status
+
+
+def verificar_admin(x_admin_token: Annotated[Optional[str], Header()] = None):
+    """Los endpoints de diagnóstico exigen la cabecera X-Admin-Token igual a ADMIN_TOKEN"""
+    token = os.getenv("ADMIN_TOKEN")
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Endpoints de administración deshabilitados")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Token de administración inválido")
+
+
+admin_dep = Depends(verificar_admin)
@@ -0,0 +1,88 @@
+# src/app/core/admin/schemas.py
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from src.app.shared.schemas.generic_response import GenericResponse
+
+class ConsultaLentaResponse(BaseModel):
+    fecha: datetime
+    duracion_ms: float
+    sentencia: str
+    parametros: Optional[Any] = None
+    repositorio: Optional[str] = None
+    explain: Optional[List[str]] = None
+
+ConsultasLentasListResponse = GenericResponse[List[ConsultaLentaResponse]]
+
+class ArmarPerfiladorRequest(BaseModel):
+    ruta: str
+    veces: int = Field(default=1, ge=1, le=100)
+
+class PerfilResumenResponse(BaseModel):
+    id_perfil: int
+    nombre: str
+    duracion_ms: float
+    muestras: int
+
+PerfilesListResponse = GenericResponse[List[PerfilResumenResponse]]
+
+class IniciarMemoriaRequest(BaseModel):
+    marcos: int = Field(default=15, ge=1, le=100)
+
+class TomarSnapshotRequest(BaseModel):
+    etiqueta: Optional[str] = None
+
+class EstadoMemoriaResponse(BaseModel):
+    activo: bool
+    trazada_bytes: int
+    pico_bytes: int
+    rss_bytes: Optional[int] = None
+
+class CapaMemoriaResponse(BaseModel):
+    bytes: int
+    bloques: int
+
+class SnapshotMemoriaResponse(BaseModel):
+    id_snapshot: int
+    etiqueta: Optional[str] = None
+    fecha: datetime
+    trazada_bytes: int
+    pico_bytes: int
+    rss_bytes: Optional[int] = None
+
+SnapshotsMemoriaListResponse = GenericResponse[List[SnapshotMemoriaResponse]]
+
+class AsignadorResponse(BaseModel):
+    ubicacion: str
+    bytes: int
+    bloques: int
+
+class SnapshotMayoresResponse(BaseModel):
+    snapshot: SnapshotMemoriaResponse
+    capas: Dict[str, CapaMemoriaResponse]
+    asignadores: List[AsignadorResponse]
+
+class DiferenciaAsignadorResponse(AsignadorResponse):
+    diferencia_bytes: int
+    diferencia_bloques: int
+
+class DiferenciaCapaResponse(BaseModel):
+    bytes: int
+    diferencia_bytes: int
+    diferencia_bloques: int
+
+class DiferenciaMemoriaResponse(BaseModel):
+    base: SnapshotMemoriaResponse
+    actual: SnapshotMemoriaResponse
+    capas: Dict[str, DiferenciaCapaResponse]
+    asignadores: List[DiferenciaAsignadorResponse]
+
+class MemoriaRutaResponse(BaseModel):
+    ruta: str
+    peticiones: int
+    pico_max_bytes: int
+    pico_promedio_bytes: int
+    retenida_promedio_bytes: int
+    retenida_total_bytes: int
+
+MemoriaRutasListResponse = GenericResponse[List[MemoriaRutaResponse]]
@@ -5,13 +5,21 @@ from dotenv import load_dotenv
 import os
 load_dotenv()
 
+from src.app.core.database.replicas import URLS_REPLICA, SelectorReplicas, SesionEnrutada
+
 url_conecction = os.getenv("URL_CONECCION")
-engine = create_engine(url_conecction,echo= True)
+# SQL_ECHO=true vuelca cada sentencia a stdout; solo para depurar en local
+sql_echo = os.getenv("SQL_ECHO", "false").lower() == "true"
+engine = create_engine(url_conecction, echo=sql_echo)
+
+# Réplicas de lectura opcionales (URL_REPLICAS, separadas por comas); sin ellas selector_replicas es None
+engines_replica = [create_engine(url, echo=sql_echo) for url in URLS_REPLICA]
+selector_replicas = SelectorReplicas(engines_replica) if engines_replica else None
 
 
 
 def get_session():
-    with Session(engine) as session:
+    with SesionEnrutada(engine, selector_replicas) as session:
         yield session # Se usa a menudo con frameworks web como FastAPI
         
 
@@ -0,0 +1,209 @@
+# src/app/core/database/replicas.py
+"""Separación de lecturas y escrituras entre la BD primaria y sus réplicas (URL_REPLICAS).
+
+Solo van a una réplica los SELECT ejecutados dentro de un método de repositorio marcado con
+`@lectura_replica` (listados, detalles y búsquedas que no preceden a una escritura). Todo lo demás
+va a la primaria:
+- las escrituras, y cualquier lectura posterior en la misma sesión (leer lo que se acaba de escribir);
+- las lecturas que validan una escritura (get_by_id, exists_*...), que no marcan el decorador;
+- las peticiones de un cliente que escribió hace menos de REPLICA_MAX_LAG_SECONDS, mediante la
+  cookie que pone `LecturaPropiaMiddleware`, para que vea su escritura aunque la réplica vaya atrasada.
+
+Una réplica con más retraso que REPLICA_MAX_LAG_SECONDS, o que no responde, deja de recibir lecturas
+hasta la siguiente medición. Sin URL_REPLICAS todo va a la primaria como siempre.
+"""
+import functools
+import itertools
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+URLS_REPLICA = [url.strip() for url in os.getenv("URL_REPLICAS", "").split(",") if url.strip()]
+RETRASO_MAXIMO = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+INTERVALO_MEDICION = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", "2"))
+
+COOKIE_LECTURA_PRIMARIA = "lectura_primaria"
+
+# Retraso de la réplica en segundos, según el dialecto; en otros dialectos se asume al día
+_CONSULTAS_RETRASO = {
+    "postgresql": (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    ),
+    "mysql": "SHOW REPLICA STATUS",
+    "mariadb": "SHOW SLAVE STATUS",
+}
+
+_lectura_replica: ContextVar[bool] = ContextVar("lectura_replica", default=False)
+
+
+class EstadoLectura:
+    """Lo que sabe la petición en curso sobre sus lecturas y escrituras"""
+    __slots__ = ("forzar_primaria", "escribio")
+
+    def __init__(self, forzar_primaria: bool = False):
+        self.forzar_primaria = forzar_primaria
+        self.escribio = False
+
+
+# El middleware coloca aquí el estado de la petición; fuera de una petición queda en None
+_estado: ContextVar[Optional[EstadoLectura]] = ContextVar("estado_lectura", default=None)
+
+
+def lectura_replica(metodo):
+    """Marca un método de repositorio de solo lectura: sus SELECT pueden ir a una réplica"""
+    @functools.wraps(metodo)
+    def envoltura(*args, **kwargs):
+        token = _lectura_replica.set(True)
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            _lectura_replica.reset(token)
+    return envoltura
+
+
+def _medir_retraso(engine: Engine) -> float:
+    consulta = _CONSULTAS_RETRASO.get(engine.dialect.name)
+    if consulta is None:
+        return 0.0
+    with engine.connect() as conexion:
+        if engine.dialect.name == "postgresql":
+            return float(conexion.execute(text(consulta)).scalar() or 0)
+        fila = conexion.execute(text(consulta)).mappings().first()
+    if fila is None:
+        # No es réplica (o no hay permisos para ver su estado): no se puede confiar en ella
+        return float("inf")
+    retraso = fila.get("Seconds_Behind_Source", fila.get("Seconds_Behind_Master"))
+    # NULL significa que la replicación está detenida
+    return float("inf") if retraso is None else float(retraso)
+
+
+class SelectorReplicas:
+    """Reparte lecturas entre las réplicas al día, midiendo su retraso cada INTERVALO_MEDICION segundos"""
+
+    def __init__(self, replicas: Sequence[Engine], retraso_maximo: float = RETRASO_MAXIMO,
+                 intervalo: float = INTERVALO_MEDICION):
+        self.replicas = list(replicas)
+        self.retraso_maximo = retraso_maximo
+        self.intervalo = intervalo
+        self._retrasos: Dict[Engine, float] = {replica: 0.0 for replica in self.replicas}
+        self._disponibles: List[Engine] = list(self.replicas)
+        self._turno = itertools.count()
+        self._ultima_medicion = 0.0
+        self._lock = threading.Lock()
+
+    def retrasos(self) -> Dict[str, float]:
+        return {replica.url.render_as_string(hide_password=True): retraso for replica, retraso in self._retrasos.items()}
+
+    def elegir(self) -> Optional[Engine]:
+        """Réplica para la siguiente lectura (por turnos), o None si ninguna está dentro del retraso tolerado"""
+        if not self.replicas:
+            return None
+        if time.monotonic() - self._ultima_medicion >= self.intervalo:
+            self._medir()
+        disponibles = self._disponibles
+        if not disponibles:
+            return None
+        return disponibles[next(self._turno) % len(disponibles)]
+
+    def _medir(self):
+        # Un solo hilo mide; los demás siguen con la medición anterior
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            for replica in self.replicas:
+                try:
+                    self._retrasos[replica] = _medir_retraso(replica)
+                except Exception:
+                    logger.warning("No se pudo medir el retraso de la réplica %s", replica.url.host, exc_info=True)
+                    self._retrasos[replica] = float("inf")
+            self._disponibles = [r for r in self.replicas if self._retrasos[r] <= self.retraso_maximo]
+            if len(self._disponibles) < len(self.replicas):
+                logger.warning("Réplicas fuera del retraso tolerado (%.1f s): %s", self.retraso_maximo, {
+                    r.url.host: self._retrasos[r] for r in self.replicas if r not in self._disponibles})
+            self._ultima_medicion = time.monotonic()
+        finally:
+            self._lock.release()
+
+
+class SesionEnrutada(Session):
+    """Sesión que envía a una réplica los SELECT de métodos `@lectura_replica` mientras no haya escrito"""
+
+    def __init__(self, bind: Engine, selector: Optional[SelectorReplicas] = None, **kwargs):
+        super().__init__(bind=bind, **kwargs)
+        self._selector = selector
+        self._escribio = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primaria = super().get_bind(mapper, clause=clause, **kwargs)
+        if self._flushing or isinstance(clause, UpdateBase):
+            self._marcar_escritura()
+            return primaria
+        # SQL textual o sin sentencia (session.connection()): no se puede saber si escribe
+        if not getattr(clause, "is_select", False):
+            return primaria
+        if self._selector is None or self._escribio or not _lectura_replica.get():
+            return primaria
+        estado = _estado.get()
+        if estado is not None and (estado.forzar_primaria or estado.escribio):
+            return primaria
+        return self._selector.elegir() or primaria
+
+    def _marcar_escritura(self):
+        self._escribio = True
+        estado = _estado.get()
+        if estado is not None:
+            estado.escribio = True
+
+
+def _cookie_vigente(scope) -> bool:
+    for nombre, valor in scope.get("headers", []):
+        if nombre != b"cookie":
+            continue
+        for cookie in valor.decode("latin-1").split(";"):
+            clave, _, expira = cookie.strip().partition("=")
+            if clave == COOKIE_LECTURA_PRIMARIA:
+                try:
+                    return float(expira) > time.time()
+                except ValueError:
+                    return False
+    return False
+
+
+class LecturaPropiaMiddleware:
+    """Middleware ASGI: tras una escritura, el cliente lee de la primaria durante REPLICA_MAX_LAG_SECONDS"""
+
+    def __init__(self, app, selector: Optional[SelectorReplicas] = None):
+        self.app = app
+        self.selector = selector
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.selector is None:
+            await self.app(scope, receive, send)
+            return
+
+        estado = EstadoLectura(forzar_primaria=_cookie_vigente(scope))
+        token = _estado.set(estado)
+
+        async def send_con_cookie(message):
+            if message["type"] == "http.response.start" and estado.escribio:
+                vigencia = max(int(self.selector.retraso_maximo + 0.999), 1)
+                cookie = (f"{COOKIE_LECTURA_PRIMARIA}={time.time() + vigencia:.0f}; Max-Age={vigencia}; "
+                          "Path=/; HttpOnly; SameSite=Lax")
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", cookie.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_con_cookie)
+        finally:
+            _estado.reset(token)
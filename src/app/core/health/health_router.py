@@ -0,0 +1,41 @@
+# src/app/core/health/health_router.py
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from src.app.core.database.database import engine
+from src.app.core.health.readiness import VerificadorReadiness
+from src.app.shared.schemas.generic_response import GenericResponse
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+verificador = VerificadorReadiness(engine)
+
+@router.get("/live", response_model=GenericResponse[dict])
+def liveness():
+    """El proceso responde; no toca la base de datos"""
+    return GenericResponse.create_success(
+        message="Servicio activo",
+        data={"status": "ok"},
+        status=200
+    )
+
+@router.get("/ready", response_model=GenericResponse[dict])
+def readiness():
+    """Listo para recibir tráfico: BD alcanzable, pool y peticiones en curso por debajo del límite"""
+    estado = verificador.evaluar()
+
+    if estado["listo"]:
+        respuesta = GenericResponse.create_success(
+            message="Servicio listo",
+            data=estado,
+            status=200
+        )
+    else:
+        respuesta = GenericResponse.create_error(
+            message="Servicio no listo",
+            errors=estado["motivos"],
+            status=503
+        )
+        respuesta.data = estado
+
+    # El balanceador decide por el código HTTP, no por el cuerpo
+    return JSONResponse(status_code=respuesta.status, content=respuesta.model_dump())
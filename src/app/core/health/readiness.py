@@ -0,0 +1,96 @@
+# src/app/core/health/readiness.py
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from src.app.core.observability.metrics import peticiones_en_curso
+from src.app.core.startup.warmup import calentamiento_terminado
+
+# El ping se reutiliza durante este tiempo: un balanceador que sondea cada segundo no carga la BD
+TTL_PING_SEGUNDOS = float(os.getenv("HEALTH_DB_PING_TTL_SECONDS", "2"))
+# Fracción de conexiones del pool (tamaño + overflow) en uso a partir de la cual el worker se declara saturado
+MAXIMA_SATURACION_POOL = float(os.getenv("HEALTH_MAX_POOL_SATURATION", "0.9"))
+# Peticiones simultáneas por worker a partir de las cuales se deja de aceptar tráfico
+MAXIMO_EN_CURSO = int(os.getenv("HEALTH_MAX_IN_FLIGHT", "100"))
+
+
+class ResultadoPing:
+    __slots__ = ("ok", "latencia_ms", "error", "fecha")
+
+    def __init__(self, ok: bool, latencia_ms: float, error: Optional[str]):
+        self.ok = ok
+        self.latencia_ms = latencia_ms
+        self.error = error
+        self.fecha = time.monotonic()
+
+
+class VerificadorReadiness:
+    def __init__(self, engine: Engine, ttl: float = TTL_PING_SEGUNDOS):
+        self.engine = engine
+        self.ttl = ttl
+        self._ultimo_ping: Optional[ResultadoPing] = None
+        self._lock = threading.Lock()
+
+    def ping(self) -> ResultadoPing:
+        ultimo = self._ultimo_ping
+        if ultimo is not None and time.monotonic() - ultimo.fecha < self.ttl:
+            return ultimo
+        # Un solo hilo hace el ping; los demás esperan y reutilizan su resultado
+        with self._lock:
+            ultimo = self._ultimo_ping
+            if ultimo is not None and time.monotonic() - ultimo.fecha < self.ttl:
+                return ultimo
+            inicio = time.perf_counter()
+            try:
+                with self.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                resultado = ResultadoPing(True, (time.perf_counter() - inicio) * 1000, None)
+            except Exception as e:
+                resultado = ResultadoPing(False, (time.perf_counter() - inicio) * 1000, str(e))
+            self._ultimo_ping = resultado
+            return resultado
+
+    def estado_pool(self) -> dict:
+        pool = self.engine.pool
+        if not hasattr(pool, "checkedout"):
+            return {"en_uso": 0, "capacidad": None, "saturacion": 0.0}
+        capacidad = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        en_uso = pool.checkedout()
+        return {
+            "en_uso": en_uso,
+            "capacidad": capacidad,
+            "saturacion": round(en_uso / capacidad, 3) if capacidad else 0.0,
+        }
+
+    def evaluar(self) -> dict:
+        pool = self.estado_pool()
+        en_curso = peticiones_en_curso()
+        saturado = pool["saturacion"] >= MAXIMA_SATURACION_POOL
+
+        motivos = []
+        if not calentamiento_terminado.is_set():
+            motivos.append("Calentamiento en curso")
+        if saturado:
+            motivos.append(f"Pool de conexiones saturado ({pool['en_uso']}/{pool['capacidad']})")
+        if en_curso >= MAXIMO_EN_CURSO:
+            motivos.append(f"Demasiadas peticiones en curso ({en_curso})")
+
+        # Con el pool saturado el ping esperaría una conexión libre: se usa el último resultado conocido
+        ping = self._ultimo_ping if saturado else self.ping()
+        if ping is not None and not ping.ok:
+            motivos.append(f"Base de datos no disponible: {ping.error}")
+
+        return {
+            "listo": not motivos,
+            "motivos": motivos,
+            "base_datos": {
+                "ok": ping.ok if ping else None,
+                "latencia_ms": round(ping.latencia_ms, 2) if ping else None,
+            },
+            "pool": pool,
+            "peticiones_en_curso": en_curso,
+        }
@@ -0,0 +1,44 @@
+# src/app/core/observability/db_events.py
+import time
+from typing import Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Cada observador recibe (sentencia, parámetros, duración en segundos, contexto de ejecución)
+ObservadorConsultas = Callable[[str, object, float, object], None]
+
+_observadores: List[ObservadorConsultas] = []
+
+
+def observar_consultas(observador: ObservadorConsultas):
+    """Suscribe un observador a la duración de cada sentencia ejecutada por los engines instrumentados"""
+    if observador not in _observadores:
+        _observadores.append(observador)
+
+
+def dejar_de_observar(observador: ObservadorConsultas):
+    """Retira un observador suscrito con observar_consultas; no falla si no estaba"""
+    if observador in _observadores:
+        _observadores.remove(observador)
+
+
+def _antes_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.inicio_consulta = time.perf_counter()
+
+
+def _despues_de_ejecutar(conn, cursor, statement, parameters, context, executemany):
+    inicio = getattr(context, "inicio_consulta", None)
+    if inicio is None:
+        return
+    duracion = time.perf_counter() - inicio
+    for observador in _observadores:
+        observador(statement, parameters, duracion, context)
+
+
+def instrumentar_engine(engine: Engine):
+    """Registra una sola vez los eventos que miden cada sentencia del engine"""
+    if not event.contains(engine, "before_cursor_execute", _antes_de_ejecutar):
+        event.listen(engine, "before_cursor_execute", _antes_de_ejecutar)
+        event.listen(engine, "after_cursor_execute", _despues_de_ejecutar)
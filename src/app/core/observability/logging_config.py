@@ -0,0 +1,109 @@
+# src/app/core/observability/logging_config.py
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+# Atributos propios de LogRecord; el resto llega por `extra=` y se serializa como campo
+_ATRIBUTOS_ESTANDAR = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[QueueListener] = None
+
+
+class FormateadorJSON(logging.Formatter):
+    """Una línea JSON por registro"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        documento = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for clave, valor in vars(record).items():
+            if clave not in _ATRIBUTOS_ESTANDAR and not clave.startswith("_"):
+                documento[clave] = valor
+        if record.exc_text:
+            documento["exception"] = record.exc_text
+        return json.dumps(documento, ensure_ascii=False, default=str)
+
+
+class FiltroMuestreoDebug(logging.Filter):
+    """Deja pasar solo una fracción de los registros DEBUG; los demás niveles pasan siempre"""
+
+    def __init__(self, tasa: float):
+        super().__init__()
+        self.tasa = tasa
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.tasa >= 1.0 or random.random() < self.tasa
+
+
+class QueueHandlerDiferido(QueueHandler):
+    """QueueHandler que solo resuelve el mensaje en el hilo de la petición; el JSON y la escritura
+    se hacen en el hilo del QueueListener"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Se convierte a texto aquí para no mantener vivas en la cola las tramas del traceback
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _niveles_por_modulo(valor: str) -> Dict[str, str]:
+    """'sqlalchemy.engine=WARNING,src.app.features.prestamos=DEBUG' -> {logger: nivel}"""
+    niveles = {}
+    for par in filter(None, (p.strip() for p in valor.split(","))):
+        nombre, _, nivel = par.partition("=")
+        niveles[nombre.strip()] = nivel.strip().upper()
+    return niveles
+
+
+def configurar_logging():
+    """Configura el logger raíz: JSON (o texto) por stdout a través de una cola"""
+    global _listener
+    if _listener is not None:
+        return
+
+    salida = logging.StreamHandler(sys.stdout)
+    if os.getenv("LOG_FORMAT", "json").lower() == "text":
+        salida.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    else:
+        salida.setFormatter(FormateadorJSON())
+
+    cola = queue.SimpleQueue()
+    manejador = QueueHandlerDiferido(cola)
+    manejador.addFilter(FiltroMuestreoDebug(float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))))
+
+    raiz = logging.getLogger()
+    raiz.handlers[:] = [manejador]
+    raiz.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    for nombre, nivel in _niveles_por_modulo(os.getenv("LOG_LEVELS", "")).items():
+        logging.getLogger(nombre).setLevel(nivel)
+
+    _listener = QueueListener(cola, salida, respect_handler_level=True)
+    _listener.start()
+    atexit.register(detener_logging)
+
+
+def detener_logging():
+    """Vacía la cola y detiene el hilo de escritura"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
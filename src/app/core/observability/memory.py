@@ -0,0 +1,248 @@
+# src/app/core/observability/memory.py
+"""Diagnóstico de memoria del worker con tracemalloc.
+
+Se enciende y apaga desde /admin/memoria: apagado no cuesta nada (el middleware solo consulta
+`tracemalloc.is_tracing()`). Encendido permite:
+- tomar snapshots y ver los mayores asignadores, o la diferencia entre dos snapshots (fugas);
+- repartir la memoria por capa: filas ORM (SQLAlchemy/SQLModel), entidades de dominio (mappers y
+  value objects) y respuesta (routers, schemas y serialización de FastAPI);
+- el pico de memoria por ruta durante cada petición.
+
+Con tracemalloc activo cada asignación cuesta varias veces más: es para diagnosticar un worker, no
+para dejarlo encendido. El pico por ruta es aproximado si hay peticiones simultáneas, porque
+tracemalloc lleva un único pico por proceso.
+"""
+import itertools
+import os
+import threading
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Marcos de pila por asignación: hacen falta varios para atribuir a una capa lo que asigna pydantic
+MARCOS = int(os.getenv("MEMORY_TRACE_FRAMES", "15"))
+SNAPSHOTS_GUARDADOS = int(os.getenv("MEMORY_MAX_SNAPSHOTS", "10"))
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+# Se excluyen las asignaciones del propio tracemalloc y del sistema de imports
+_FILTROS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+]
+
+# (fragmento de ruta, capa). Las trazas de tracemalloc van del marco más antiguo al más reciente:
+# se recorren al revés y decide el marco más cercano a la asignación que coincida
+_CAPAS: List[Tuple[str, str]] = [
+    (f"{os.sep}sqlalchemy{os.sep}", "orm"),
+    (f"{os.sep}sqlmodel{os.sep}", "orm"),
+    (f"{os.sep}infrastructure{os.sep}repositories{os.sep}", "orm"),
+    (f"{os.sep}infrastructure{os.sep}mappers{os.sep}", "dominio"),
+    (f"{os.sep}domain{os.sep}", "dominio"),
+    (f"{os.sep}presentation{os.sep}", "respuesta"),
+    (f"{os.sep}fastapi{os.sep}", "respuesta"),
+    (f"{os.sep}starlette{os.sep}", "respuesta"),
+]
+# Marcos que no deciden la capa: lo que asignan se atribuye a quien los llamó
+_NEUTROS = (f"{os.sep}pydantic{os.sep}", f"{os.sep}typing.py", f"{os.sep}copy.py")
+
+
+def rss_bytes() -> Optional[int]:
+    """RSS actual del proceso (Linux); None donde /proc no existe"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _archivo_corto(archivo: str) -> str:
+    if archivo.startswith(_RAIZ_PROYECTO):
+        return os.path.relpath(archivo, _RAIZ_PROYECTO)
+    if "site-packages" + os.sep in archivo:
+        return archivo.split("site-packages" + os.sep, 1)[1]
+    return archivo
+
+
+def capa_de(traza: tracemalloc.Traceback) -> str:
+    """Capa responsable de una asignación según su pila (orm, dominio, respuesta u otros)"""
+    for marco in reversed(traza):
+        archivo = marco.filename
+        if any(neutro in archivo for neutro in _NEUTROS):
+            continue
+        for fragmento, capa in _CAPAS:
+            if fragmento in archivo:
+                return capa
+    return "otros"
+
+
+def _por_capa(snapshot: tracemalloc.Snapshot) -> Dict[str, Dict[str, int]]:
+    capas: Dict[str, Dict[str, int]] = {}
+    for estadistica in snapshot.statistics("traceback"):
+        capa = capas.setdefault(capa_de(estadistica.traceback), {"bytes": 0, "bloques": 0})
+        capa["bytes"] += estadistica.size
+        capa["bloques"] += estadistica.count
+    return capas
+
+
+class SnapshotMemoria:
+    __slots__ = ("id", "etiqueta", "fecha", "snapshot", "trazada_bytes", "pico_bytes", "rss_bytes", "_capas")
+
+    def __init__(self, id_snapshot: int, etiqueta: Optional[str], snapshot: tracemalloc.Snapshot):
+        self.id = id_snapshot
+        self.etiqueta = etiqueta
+        self.fecha = datetime.now()
+        self.snapshot = snapshot
+        self.trazada_bytes, self.pico_bytes = tracemalloc.get_traced_memory()
+        self.rss_bytes = rss_bytes()
+        self._capas: Optional[Dict[str, Dict[str, int]]] = None
+
+    def capas(self) -> Dict[str, Dict[str, int]]:
+        # Recorre todas las trazas: se calcula solo cuando se pide y una vez
+        if self._capas is None:
+            self._capas = _por_capa(self.snapshot)
+        return self._capas
+
+
+class MemoriaRuta:
+    __slots__ = ("peticiones", "pico_max_bytes", "pico_total_bytes", "retenida_total_bytes")
+
+    def __init__(self):
+        self.peticiones = 0
+        self.pico_max_bytes = 0
+        self.pico_total_bytes = 0
+        self.retenida_total_bytes = 0
+
+    def registrar(self, pico: int, retenida: int):
+        self.peticiones += 1
+        self.pico_max_bytes = max(self.pico_max_bytes, pico)
+        self.pico_total_bytes += pico
+        self.retenida_total_bytes += retenida
+
+
+class DiagnosticoMemoria:
+    """Estado de tracemalloc, snapshots guardados y memoria por ruta de este worker"""
+
+    def __init__(self, maximo: int = SNAPSHOTS_GUARDADOS):
+        self._snapshots: "OrderedDict[int, SnapshotMemoria]" = OrderedDict()
+        self._maximo = maximo
+        self._ids = itertools.count(1)
+        self._rutas: Dict[str, MemoriaRuta] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def activo(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def iniciar(self, marcos: int = MARCOS):
+        """Enciende tracemalloc; los snapshots y rutas de una sesión anterior se descartan"""
+        with self._lock:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._snapshots.clear()
+            self._rutas.clear()
+            tracemalloc.start(marcos)
+
+    def detener(self):
+        """Apaga tracemalloc; los snapshots ya tomados se conservan para consultarlos"""
+        tracemalloc.stop()
+
+    def tomar_snapshot(self, etiqueta: Optional[str] = None) -> SnapshotMemoria:
+        if not tracemalloc.is_tracing():
+            raise ValueError("tracemalloc no está activo")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FILTROS)
+        with self._lock:
+            guardado = SnapshotMemoria(next(self._ids), etiqueta, snapshot)
+            self._snapshots[guardado.id] = guardado
+            while len(self._snapshots) > self._maximo:
+                self._snapshots.popitem(last=False)
+        return guardado
+
+    def obtener(self, id_snapshot: int) -> Optional[SnapshotMemoria]:
+        return self._snapshots.get(id_snapshot)
+
+    def listar(self) -> List[SnapshotMemoria]:
+        with self._lock:
+            return list(self._snapshots.values())
+
+    def mayores(self, guardado: SnapshotMemoria, agrupar: str = "lineno", limite: int = 20) -> List[dict]:
+        return [
+            {"ubicacion": self._ubicacion(e.traceback, agrupar), "bytes": e.size, "bloques": e.count}
+            for e in guardado.snapshot.statistics(agrupar)[:limite]
+        ]
+
+    def diferencia(self, base: SnapshotMemoria, actual: SnapshotMemoria,
+                   agrupar: str = "lineno", limite: int = 20) -> List[dict]:
+        """Asignadores que más crecieron de `base` a `actual`: lo que sigue creciendo entre snapshots es una fuga"""
+        return [
+            {
+                "ubicacion": self._ubicacion(e.traceback, agrupar),
+                "bytes": e.size,
+                "bloques": e.count,
+                "diferencia_bytes": e.size_diff,
+                "diferencia_bloques": e.count_diff,
+            }
+            for e in actual.snapshot.compare_to(base.snapshot, agrupar)[:limite]
+        ]
+
+    @staticmethod
+    def diferencia_capas(base: SnapshotMemoria, actual: SnapshotMemoria) -> Dict[str, Dict[str, int]]:
+        capas_base, capas_actual = base.capas(), actual.capas()
+        vacia = {"bytes": 0, "bloques": 0}
+        return {
+            capa: {
+                "bytes": capas_actual.get(capa, vacia)["bytes"],
+                "diferencia_bytes": capas_actual.get(capa, vacia)["bytes"] - capas_base.get(capa, vacia)["bytes"],
+                "diferencia_bloques": capas_actual.get(capa, vacia)["bloques"] - capas_base.get(capa, vacia)["bloques"],
+            }
+            for capa in sorted(set(capas_base) | set(capas_actual))
+        }
+
+    @staticmethod
+    def _ubicacion(traza: tracemalloc.Traceback, agrupar: str) -> str:
+        # Con "traceback" la pila completa, de la llamada más externa a la asignación
+        marcos = list(traza) if agrupar == "traceback" else [traza[0]]
+        if agrupar == "filename":
+            return _archivo_corto(marcos[0].filename)
+        return " <- ".join(f"{_archivo_corto(m.filename)}:{m.lineno}" for m in marcos)
+
+    def registrar_ruta(self, ruta: str, pico: int, retenida: int):
+        with self._lock:
+            self._rutas.setdefault(ruta, MemoriaRuta()).registrar(pico, retenida)
+
+    def rutas(self) -> Dict[str, MemoriaRuta]:
+        with self._lock:
+            return dict(self._rutas)
+
+    def limpiar_rutas(self):
+        with self._lock:
+            self._rutas.clear()
+
+
+diagnostico_memoria = DiagnosticoMemoria()
+
+
+class MemoryMiddleware:
+    """Middleware ASGI: con tracemalloc activo registra el pico y la memoria retenida por ruta"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        inicio, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # tracemalloc pudo apagarse durante la petición (p. ej. la que lo detiene)
+            if tracemalloc.is_tracing():
+                actual, pico = tracemalloc.get_traced_memory()
+                route = scope.get("route")
+                ruta = f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+                diagnostico_memoria.registrar_ruta(ruta, max(pico - inicio, 0), actual - inicio)
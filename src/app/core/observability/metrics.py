@@ -0,0 +1,148 @@
+# src/app/core/observability/metrics.py
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.app.core.observability.db_events import instrumentar_engine, observar_consultas
+
+# Con varios workers (gunicorn/uvicorn --workers) cada proceso escribe sus métricas en este directorio
+# y /metrics las agrega; sin la variable se usa el registro en memoria del proceso
+MULTIPROCESO = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+RUTA_SIN_PLANTILLA = "<sin_ruta>"
+
+LATENCIA_PETICIONES = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de las peticiones HTTP por plantilla de ruta",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+PETICIONES_EN_CURSO = Gauge(
+    "http_requests_in_progress",
+    "Peticiones HTTP en curso",
+    multiprocess_mode="livesum",
+)
+LATENCIA_CONSULTAS = Histogram(
+    "db_statement_duration_seconds",
+    "Latencia de las sentencias SQL por tipo de operación",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+POOL_EN_USO = Gauge(
+    "db_pool_checked_out",
+    "Conexiones del pool prestadas actualmente",
+    multiprocess_mode="livesum",
+)
+POOL_DESBORDE = Gauge(
+    "db_pool_overflow",
+    "Conexiones abiertas por encima del tamaño del pool",
+    multiprocess_mode="livesum",
+)
+CACHE_ACIERTOS = Counter("cache_hits_total", "Aciertos de caché", ["cache"])
+CACHE_FALLOS = Counter("cache_misses_total", "Fallos de caché", ["cache"])
+
+# Copia local del gauge de peticiones en curso de este proceso, para el chequeo de readiness
+_en_curso = 0
+
+
+def peticiones_en_curso() -> int:
+    return _en_curso
+
+
+def registrar_acceso_cache(cache: str, acierto: bool):
+    """Cuenta un acceso a una caché con nombre; la tasa de aciertos se calcula en Prometheus"""
+    (CACHE_ACIERTOS if acierto else CACHE_FALLOS).labels(cache=cache).inc()
+
+
+def _operacion(sentencia: str) -> str:
+    partes = sentencia.lstrip().split(None, 1)
+    return partes[0].upper() if partes else "OTRA"
+
+
+def _observar_consulta(statement, parameters, duracion, context):
+    LATENCIA_CONSULTAS.labels(operation=_operacion(statement)).observe(duracion)
+
+
+def instrumentar_metricas(engine: Engine):
+    """Mide la latencia de cada sentencia y mantiene los gauges del pool al prestar/devolver conexiones"""
+    instrumentar_engine(engine)
+    observar_consultas(_observar_consulta)
+
+    pool = engine.pool
+    # Solo QueuePool expone checkedout/overflow; con otros pools los gauges quedan en 0
+    if not hasattr(pool, "checkedout"):
+        return
+
+    def al_prestar(*_):
+        POOL_EN_USO.set(pool.checkedout())
+        POOL_DESBORDE.set(max(pool.overflow(), 0))
+
+    def al_devolver(*_):
+        # El evento checkin se emite antes de que la conexión vuelva a la cola; si la cola ya está
+        # llena, el pool la cierra al devolverla y el desborde baja en uno
+        POOL_EN_USO.set(max(pool.checkedout() - 1, 0))
+        cerrada = 1 if pool.checkedin() >= pool.size() else 0
+        POOL_DESBORDE.set(max(pool.overflow() - cerrada, 0))
+
+    event.listen(pool, "checkout", al_prestar)
+    event.listen(pool, "checkin", al_devolver)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI: latencia por plantilla de ruta y peticiones en curso"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        inicio = time.perf_counter()
+
+        async def send_con_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        global _en_curso
+        _en_curso += 1
+        PETICIONES_EN_CURSO.inc()
+        try:
+            await self.app(scope, receive, send_con_status)
+        finally:
+            _en_curso -= 1
+            PETICIONES_EN_CURSO.dec()
+            # El router de FastAPI deja la ruta resuelta en el scope; la plantilla evita una serie por id
+            route = scope.get("route")
+            LATENCIA_PETICIONES.labels(
+                method=scope["method"],
+                route=getattr(route, "path", RUTA_SIN_PLANTILLA),
+                status=str(status),
+            ).observe(time.perf_counter() - inicio)
+
+
+def endpoint_metricas(request: Request) -> Response:
+    if MULTIPROCESO:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
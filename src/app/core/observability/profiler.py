@@ -0,0 +1,300 @@
+# src/app/core/observability/profiler.py
+"""Perfilador por muestreo de una sola petición.
+
+Se activa con la cabecera firmada X-Profile (ver `firmar_perfil`) o armándolo desde
+POST /admin/perfilador. Mientras está inactivo no hay hilo de muestreo ni hooks de trazado:
+solo una lectura de ContextVar al entrar en cada endpoint síncrono.
+
+Uso para firmar una ruta desde la terminal:
+    python -m src.app.core.observability.profiler /prestamos/ 300
+"""
+import hashlib
+import hmac
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.routing import APIRoute
+
+HEADER_PERFIL = "X-Profile"
+HEADER_ID_PERFIL = "X-Profile-Id"
+
+SECRETO = os.getenv("PROFILER_SECRET")
+INTERVALO_MS = float(os.getenv("PROFILER_INTERVAL_MS", "1"))
+PERFILES_GUARDADOS = int(os.getenv("PROFILER_MAX_PROFILES", "20"))
+_MAXIMA_PROFUNDIDAD = 128
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+Marco = Tuple[str, str, int]
+
+_nombres_codigo: Dict[object, Tuple[str, str]] = {}
+
+
+def _nombre_codigo(codigo) -> Tuple[str, str]:
+    """(función, archivo corto) de un code object, memoizado para no recalcular rutas en cada muestra"""
+    nombre = _nombres_codigo.get(codigo)
+    if nombre is None:
+        archivo = codigo.co_filename
+        if archivo.startswith(_RAIZ_PROYECTO):
+            archivo = os.path.relpath(archivo, _RAIZ_PROYECTO)
+        elif "site-packages" + os.sep in archivo:
+            archivo = archivo.split("site-packages" + os.sep, 1)[1]
+        nombre = _nombres_codigo[codigo] = (codigo.co_qualname, archivo)
+    return nombre
+
+
+def _firma(expira: int, ruta: str) -> str:
+    return hmac.new(SECRETO.encode(), f"{expira}:{ruta}".encode(), hashlib.sha256).hexdigest()
+
+
+def firmar_perfil(ruta: str, segundos: int = 300) -> str:
+    """Valor de X-Profile que habilita perfilar `ruta` durante `segundos`"""
+    if not SECRETO:
+        raise ValueError("PROFILER_SECRET no está configurado")
+    expira = int(time.time()) + segundos
+    return f"{expira}.{_firma(expira, ruta)}"
+
+
+def firma_valida(valor: str, ruta: str) -> bool:
+    if not SECRETO or not valor or "." not in valor:
+        return False
+    expira, firma = valor.split(".", 1)
+    if not expira.isdigit() or int(expira) < time.time():
+        return False
+    return hmac.compare_digest(firma, _firma(int(expira), ruta))
+
+
+class Perfil:
+    """Muestras de pila de los hilos que atienden una petición"""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, metodo: str, ruta: str):
+        self.id = next(self._ids)
+        self.nombre = f"{metodo} {ruta}"
+        self.inicio = time.perf_counter()
+        self.duracion_ms = 0.0
+        self.intervalo_ms = INTERVALO_MS
+        # hilo -> (código ancla desde el que se recorta la pila, nombre del hilo en el perfil)
+        self._hilos: Dict[int, Tuple[object, str]] = {}
+        self.muestras: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def registrar_hilo(self, ancla, nombre: str):
+        with self._lock:
+            self._hilos[threading.get_ident()] = (ancla, nombre)
+
+    def liberar_hilo(self):
+        with self._lock:
+            self._hilos.pop(threading.get_ident(), None)
+
+    def muestrear(self, marcos_actuales):
+        with self._lock:
+            hilos = list(self._hilos.items())
+        for id_hilo, (ancla, nombre) in hilos:
+            frame = marcos_actuales.get(id_hilo)
+            pila = self._pila_desde_ancla(frame, ancla)
+            if pila:
+                self.muestras.setdefault(nombre, Counter())[pila] += 1
+
+    @staticmethod
+    def _pila_desde_ancla(frame, ancla) -> Optional[Tuple[Marco, ...]]:
+        """Pila raíz→hoja a partir del marco ancla; None si el hilo está fuera de la petición"""
+        pila: List[Marco] = []
+        while frame is not None and len(pila) < _MAXIMA_PROFUNDIDAD:
+            codigo = frame.f_code
+            pila.append(_nombre_codigo(codigo) + (frame.f_lineno,))
+            if codigo is ancla:
+                return tuple(reversed(pila))
+            frame = frame.f_back
+        return None
+
+    def a_collapsed(self) -> str:
+        """Formato de pilas colapsadas (flamegraph.pl, speedscope, inferno)"""
+        lineas = []
+        for nombre_hilo, contador in self.muestras.items():
+            for pila, veces in contador.items():
+                marcos = [nombre_hilo] + [f"{funcion} ({archivo}:{linea})" for funcion, archivo, linea in pila]
+                lineas.append(f"{';'.join(marcos)} {veces}")
+        return "\n".join(lineas) + "\n"
+
+    def a_speedscope(self) -> dict:
+        marcos: Dict[Marco, int] = {}
+        perfiles = []
+        for nombre_hilo, contador in self.muestras.items():
+            muestras, pesos = [], []
+            for pila, veces in contador.items():
+                muestras.append([marcos.setdefault(marco, len(marcos)) for marco in pila])
+                pesos.append(veces * self.intervalo_ms)
+            perfiles.append({
+                "type": "sampled",
+                "name": f"{self.nombre} [{nombre_hilo}]",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(pesos),
+                "samples": muestras,
+                "weights": pesos,
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.nombre,
+            "exporter": "umsnh-profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": f, "file": a, "line": l} for (f, a, l) in marcos]},
+            "profiles": perfiles,
+        }
+
+
+class _Muestreador(threading.Thread):
+    def __init__(self, perfil: Perfil):
+        super().__init__(name="perfilador", daemon=True)
+        self.perfil = perfil
+        self._detener = threading.Event()
+
+    def run(self):
+        intervalo = self.perfil.intervalo_ms / 1000
+        while not self._detener.wait(intervalo):
+            self.perfil.muestrear(sys._current_frames())
+
+    def detener(self):
+        self._detener.set()
+        self.join()
+
+
+class AlmacenPerfiles:
+    """Últimos perfiles capturados y rutas armadas desde el endpoint de administración"""
+
+    def __init__(self, maximo: int = PERFILES_GUARDADOS):
+        self._perfiles: "OrderedDict[int, Perfil]" = OrderedDict()
+        self._maximo = maximo
+        self._armados: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def guardar(self, perfil: Perfil):
+        with self._lock:
+            self._perfiles[perfil.id] = perfil
+            while len(self._perfiles) > self._maximo:
+                self._perfiles.popitem(last=False)
+
+    def obtener(self, id_perfil: int) -> Optional[Perfil]:
+        return self._perfiles.get(id_perfil)
+
+    def listar(self) -> List[Perfil]:
+        with self._lock:
+            return list(reversed(self._perfiles.values()))
+
+    def armar(self, ruta: str, veces: int):
+        with self._lock:
+            self._armados[ruta] = veces
+
+    def consumir_armado(self, ruta: str) -> bool:
+        if not self._armados:
+            return False
+        with self._lock:
+            restantes = self._armados.get(ruta, 0)
+            if restantes <= 0:
+                return False
+            if restantes == 1:
+                del self._armados[ruta]
+            else:
+                self._armados[ruta] = restantes - 1
+            return True
+
+
+almacen_perfiles = AlmacenPerfiles()
+
+_perfil_actual: ContextVar[Optional[Perfil]] = ContextVar("perfil_actual", default=None)
+# Un solo perfil a la vez: el muestreo de dos peticiones simultáneas se contaminaría
+_perfilando = threading.Lock()
+
+
+def _envolver_endpoint(endpoint):
+    def endpoint_perfilable(*args, **kwargs):
+        perfil = _perfil_actual.get()
+        if perfil is None:
+            return endpoint(*args, **kwargs)
+        perfil.registrar_hilo(endpoint_perfilable.__code__, "handler")
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            perfil.liberar_hilo()
+    endpoint_perfilable.__perfilable__ = True
+    return endpoint_perfilable
+
+
+def instrumentar_endpoints(app):
+    """Los endpoints síncronos corren en el threadpool: al entrar registran su hilo en el perfil activo.
+    Se puede llamar de nuevo tras registrar routers diferidos: los ya envueltos se omiten"""
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not inspect.isfunction(route.dependant.call):
+            continue
+        if getattr(route.dependant.call, "__perfilable__", False):
+            continue
+        # Las corrutinas corren en el hilo del event loop, que ya cubre el middleware
+        if not inspect.iscoroutinefunction(route.dependant.call):
+            route.dependant.call = _envolver_endpoint(route.dependant.call)
+
+
+class ProfilerMiddleware:
+    """Middleware ASGI: perfila la petición si trae X-Profile válido o si su ruta fue armada"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._solicitado(scope):
+            await self.app(scope, receive, send)
+            return
+        if not _perfilando.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self._ejecutar_perfilado(scope, receive, send)
+        finally:
+            _perfilando.release()
+
+    def _solicitado(self, scope) -> bool:
+        ruta = scope["path"]
+        if almacen_perfiles.consumir_armado(ruta):
+            return True
+        if not SECRETO:
+            return False
+        for clave, valor in scope.get("headers", []):
+            if clave == b"x-profile":
+                return firma_valida(valor.decode("latin-1"), ruta)
+        return False
+
+    async def _ejecutar_perfilado(self, scope, receive, send):
+        perfil = Perfil(scope["method"], scope["path"])
+        perfil.registrar_hilo(self._ejecutar_perfilado.__code__, "event_loop")
+        token = _perfil_actual.set(perfil)
+        muestreador = _Muestreador(perfil)
+        muestreador.start()
+
+        async def send_con_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (HEADER_ID_PERFIL.encode(), str(perfil.id).encode())
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_con_id)
+        finally:
+            muestreador.detener()
+            _perfil_actual.reset(token)
+            perfil.duracion_ms = (time.perf_counter() - perfil.inicio) * 1000
+            almacen_perfiles.guardar(perfil)
+
+
+if __name__ == "__main__":
+    ruta = sys.argv[1] if len(sys.argv) > 1 else "/"
+    segundos = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(firmar_perfil(ruta, segundos))
@@ -0,0 +1,75 @@
+# src/app/core/observability/query_budget.py
+"""Presupuestos de sentencias SQL: registra lo que ejecuta un bloque de código y falla si se pasa.
+
+    with presupuesto_consultas(maximo=3, descripcion="POST /prestamos/"):
+        cliente.post("/prestamos/", json={...})
+
+El registro es global al proceso (no depende del contexto de la petición), así que también ve las
+sentencias que la app ejecuta en el hilo del TestClient. Está pensado para pruebas y scripts de CI
+que hacen una petición a la vez.
+"""
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from src.app.core.observability.db_events import dejar_de_observar, instrumentar_engine, observar_consultas
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    pass
+
+
+class RegistroSentencias:
+    """Sentencias ejecutadas mientras el registro está activo"""
+
+    def __init__(self):
+        self.sentencias: List[str] = []
+
+    @property
+    def total(self) -> int:
+        return len(self.sentencias)
+
+    def _observar(self, statement, parameters, duracion, context):
+        self.sentencias.append(statement)
+
+    def resumen(self, limite: int = 200) -> str:
+        return "\n".join(f"  {i}. {' '.join(s.split())[:limite]}" for i, s in enumerate(self.sentencias, start=1))
+
+
+@contextmanager
+def registrar_sentencias(engine: Optional[Engine] = None) -> Iterator[RegistroSentencias]:
+    """Registra las sentencias de los engines instrumentados (y de `engine`, si se pasa) durante el bloque"""
+    if engine is not None:
+        instrumentar_engine(engine)
+    registro = RegistroSentencias()
+    observar_consultas(registro._observar)
+    try:
+        yield registro
+    finally:
+        dejar_de_observar(registro._observar)
+
+
+def verificar_presupuesto(registro: RegistroSentencias, maximo: Optional[int] = None,
+                          exacto: Optional[int] = None, descripcion: str = "bloque"):
+    """Lanza PresupuestoConsultasExcedido si el registro no cumple el presupuesto"""
+    if exacto is not None and registro.total != exacto:
+        condicion = f"exactamente {exacto}"
+    elif maximo is not None and registro.total > maximo:
+        condicion = f"como máximo {maximo}"
+    else:
+        return
+    raise PresupuestoConsultasExcedido(
+        f"{descripcion}: {registro.total} sentencias SQL, se esperaban {condicion}:\n{registro.resumen()}"
+    )
+
+
+@contextmanager
+def presupuesto_consultas(maximo: Optional[int] = None, exacto: Optional[int] = None,
+                          descripcion: str = "bloque", engine: Optional[Engine] = None) -> Iterator[RegistroSentencias]:
+    """registrar_sentencias + verificar_presupuesto al salir del bloque (si el bloque no falló)"""
+    if maximo is None and exacto is None:
+        raise ValueError("Indica maximo o exacto")
+    with registrar_sentencias(engine) as registro:
+        yield registro
+    verificar_presupuesto(registro, maximo=maximo, exacto=exacto, descripcion=descripcion)
@@ -0,0 +1,99 @@
+# src/app/core/observability/query_counter.py
+import logging
+import os
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+
+from src.app.core.observability.db_events import instrumentar_engine, observar_consultas
+
+logger = logging.getLogger(__name__)
+
+UMBRAL_N_MAS_UNO = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+
+HEADER_CONSULTAS = "X-DB-Query-Count"
+HEADER_TIEMPO = "X-DB-Time-Ms"
+HEADER_N_MAS_UNO = "X-DB-N-Plus-One"
+
+
+class EstadisticasConsultas:
+    """Consultas ejecutadas durante una petición"""
+    __slots__ = ("total", "tiempo", "sentencias")
+
+    def __init__(self):
+        self.total = 0
+        self.tiempo = 0.0
+        self.sentencias = Counter()
+
+    def registrar(self, sentencia: str, duracion: float):
+        self.total += 1
+        self.tiempo += duracion
+        self.sentencias[sentencia] += 1
+
+    def repetidas(self, umbral: int) -> list:
+        """Sentencias idénticas ejecutadas al menos `umbral` veces: posible patrón N+1"""
+        return [(sql, veces) for sql, veces in self.sentencias.items() if veces >= umbral]
+
+
+# El middleware coloca aquí el acumulador de la petición; fuera de una petición queda en None
+_estadisticas: ContextVar[Optional[EstadisticasConsultas]] = ContextVar("estadisticas_consultas", default=None)
+
+
+def estadisticas_actuales() -> Optional[EstadisticasConsultas]:
+    return _estadisticas.get()
+
+
+def _registrar_en_peticion(statement, parameters, duracion, context):
+    estadisticas = _estadisticas.get()
+    if estadisticas is not None:
+        estadisticas.registrar(statement, duracion)
+
+
+def registrar_contador_consultas(engine: Engine):
+    """Engancha los eventos del engine que alimentan el contador por petición"""
+    instrumentar_engine(engine)
+    observar_consultas(_registrar_en_peticion)
+
+
+class QueryCounterMiddleware:
+    """Middleware ASGI: cuenta sentencias y tiempo de BD por petición y los expone en cabeceras y logs"""
+
+    def __init__(self, app, umbral_n_mas_uno: int = UMBRAL_N_MAS_UNO):
+        self.app = app
+        self.umbral_n_mas_uno = umbral_n_mas_uno
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        estadisticas = EstadisticasConsultas()
+        token = _estadisticas.set(estadisticas)
+
+        async def send_con_cabeceras(message):
+            if message["type"] == "http.response.start":
+                repetidas = estadisticas.repetidas(self.umbral_n_mas_uno)
+                headers = list(message.get("headers", []))
+                headers.append((HEADER_CONSULTAS.encode(), str(estadisticas.total).encode()))
+                headers.append((HEADER_TIEMPO.encode(), f"{estadisticas.tiempo * 1000:.2f}".encode()))
+                if repetidas:
+                    headers.append((HEADER_N_MAS_UNO.encode(), str(len(repetidas)).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_con_cabeceras)
+        finally:
+            _estadisticas.reset(token)
+            self._registrar_log(scope, estadisticas)
+
+    def _registrar_log(self, scope, estadisticas: EstadisticasConsultas):
+        ruta = f"{scope['method']} {scope['path']}"
+        logger.debug("%s: %d consultas en %.2f ms", ruta, estadisticas.total, estadisticas.tiempo * 1000)
+        for sentencia, veces in estadisticas.repetidas(self.umbral_n_mas_uno):
+            logger.warning(
+                "Posible N+1 en %s: sentencia repetida %d veces: %s",
+                ruta, veces, " ".join(sentencia.split())[:300]
+            )
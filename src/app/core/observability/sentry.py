@@ -0,0 +1,68 @@
+# src/app/core/observability/sentry.py
+import logging
+import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.app.core.observability.sentry_local import TransporteLocal
+
+logger = logging.getLogger(__name__)
+
+# SENTRY_DSN=local no sale a la red: los envíos quedan en memoria (pruebas y desarrollo)
+DSN_LOCAL = "local"
+_DSN_FICTICIO = "http://local@localhost/0"
+
+# Rutas de infraestructura que nunca generan transacciones
+_RUTAS_SIN_TRAZA = ("/metrics", "/health")
+
+# Se crea al inicializar con SENTRY_DSN=local
+transporte_local: Optional["TransporteLocal"] = None
+
+
+def _muestreo_de_trazas(contexto_muestreo: dict) -> float:
+    # Respeta la decisión de un servicio anterior si la petición ya viene trazada
+    decision_padre = contexto_muestreo.get("parent_sampled")
+    if decision_padre is not None:
+        return float(decision_padre)
+
+    ruta = (contexto_muestreo.get("asgi_scope") or {}).get("path", "")
+    if ruta.startswith(_RUTAS_SIN_TRAZA):
+        return 0.0
+    return float(os.getenv("SENTRY_TRACES_SAMPLE_RATE", "0.05"))
+
+
+def inicializar_sentry() -> bool:
+    """Inicializa Sentry si SENTRY_DSN está definido; sin él ni siquiera se importa sentry_sdk"""
+    global transporte_local
+    dsn = os.getenv("SENTRY_DSN")
+    if not dsn:
+        return False
+
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+    from sentry_sdk.integrations.starlette import StarletteIntegration
+
+    local = dsn == DSN_LOCAL
+    if local and transporte_local is None:
+        from src.app.core.observability.sentry_local import TransporteLocal
+        transporte_local = TransporteLocal()
+    sentry_sdk.init(
+        dsn=_DSN_FICTICIO if local else dsn,
+        transport=transporte_local if local else None,
+        environment=os.getenv("SENTRY_ENVIRONMENT", "development"),
+        release=os.getenv("SENTRY_RELEASE"),
+        traces_sampler=_muestreo_de_trazas,
+        # Fracción de las transacciones muestreadas que además se perfilan
+        profiles_sample_rate=float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0")),
+        send_default_pii=False,
+        integrations=[
+            # "url" nombra la transacción con la plantilla de ruta (/prestamos/{id_prestamo}); sin un
+            # span por middleware, que en esta app serían media docena por petición
+            StarletteIntegration(transaction_style="url", middleware_spans=False),
+            FastApiIntegration(transaction_style="url", middleware_spans=False),
+            SqlalchemyIntegration(),
+        ],
+    )
+    logger.info("Sentry inicializado (%s)", "transporte local" if local else "remoto")
+    return True
@@ -0,0 +1,33 @@
+# src/app/core/observability/sentry_local.py
+import threading
+from typing import List
+
+from sentry_sdk.envelope import Envelope
+from sentry_sdk.transport import Transport
+
+
+class TransporteLocal(Transport):
+    """Transporte que guarda los envelopes en memoria en lugar de enviarlos a Sentry"""
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        self.envelopes: List[Envelope] = []
+        self._lock = threading.Lock()
+
+    def capture_envelope(self, envelope: Envelope):
+        with self._lock:
+            self.envelopes.append(envelope)
+
+    def eventos(self, tipo: str = "event") -> list:
+        """Payloads capturados de un tipo: event, transaction, profile..."""
+        with self._lock:
+            return [
+                item.payload.json
+                for envelope in self.envelopes
+                for item in envelope.items
+                if item.type == tipo and item.payload.json is not None
+            ]
+
+    def limpiar(self):
+        with self._lock:
+            self.envelopes.clear()
@@ -0,0 +1,142 @@
+# src/app/core/observability/slow_query.py
+import logging
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy.engine import Engine
+
+from src.app.core.observability.db_events import instrumentar_engine, observar_consultas
+
+logger = logging.getLogger(__name__)
+
+UMBRAL_CONSULTA_LENTA_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+TAMANO_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "200"))
+
+# Parámetros cuyo valor nunca debe salir del proceso
+_PARAMETRO_SENSIBLE = re.compile(r"contrase|password|passwd|secret|token|email", re.IGNORECASE)
+_LARGO_MAXIMO_VALOR = 64
+_SENTENCIAS_EXPLICABLES = ("SELECT", "UPDATE", "DELETE")
+_MAXIMO_PLANES_EN_CACHE = 256
+
+_MARCADOR_REPOSITORIO = os.sep + os.path.join("infrastructure", "repositories") + os.sep
+
+
+class ConsultaLenta:
+    __slots__ = ("fecha", "duracion_ms", "sentencia", "parametros", "repositorio", "explain")
+
+    def __init__(self, duracion_ms: float, sentencia: str, parametros, repositorio: Optional[str]):
+        self.fecha = datetime.now()
+        self.duracion_ms = duracion_ms
+        self.sentencia = sentencia
+        self.parametros = parametros
+        self.repositorio = repositorio
+        self.explain: Optional[List[str]] = None
+
+
+def redactar_parametros(parametros):
+    """Oculta valores sensibles y recorta textos largos antes de guardar o registrar los parámetros"""
+    if isinstance(parametros, dict):
+        return {
+            clave: "***" if _PARAMETRO_SENSIBLE.search(str(clave)) else _recortar(valor)
+            for clave, valor in parametros.items()
+        }
+    if isinstance(parametros, (list, tuple)):
+        # Sin nombres no se puede saber qué es sensible: los textos se ocultan completos
+        return ["***" if isinstance(valor, str) else _recortar(valor) for valor in parametros]
+    return parametros
+
+
+def _recortar(valor):
+    if isinstance(valor, str) and len(valor) > _LARGO_MAXIMO_VALOR:
+        return valor[:_LARGO_MAXIMO_VALOR] + "..."
+    if isinstance(valor, (bytes, bytearray)):
+        return f"<{len(valor)} bytes>"
+    return valor
+
+
+def _metodo_repositorio() -> Optional[str]:
+    """Primer método de un repositorio en la pila actual, p. ej. 'PrestamoRepositoryImpl.get_all'"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        if _MARCADOR_REPOSITORIO in frame.f_code.co_filename:
+            instancia = frame.f_locals.get("self")
+            clase = type(instancia).__name__ if instancia is not None else None
+            return f"{clase}.{frame.f_code.co_name}" if clase else frame.f_code.co_name
+        frame = frame.f_back
+    return None
+
+
+class RegistroConsultasLentas:
+    """Buffer circular de consultas lentas con su plan de ejecución"""
+
+    def __init__(self, engine: Engine, umbral_ms: float = UMBRAL_CONSULTA_LENTA_MS, tamano: int = TAMANO_BUFFER):
+        self.engine = engine
+        self.umbral_ms = umbral_ms
+        self._buffer = deque(maxlen=tamano)
+        self._lock = threading.Lock()
+        # Un solo hilo ejecuta los EXPLAIN fuera del camino de la petición
+        self._ejecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+        self._planes = OrderedDict()
+        self._capturando = threading.local()
+
+    def observar(self, statement, parameters, duracion, context):
+        duracion_ms = duracion * 1000
+        if duracion_ms < self.umbral_ms or getattr(self._capturando, "activo", False):
+            return
+
+        consulta = ConsultaLenta(duracion_ms, statement, redactar_parametros(parameters), _metodo_repositorio())
+        with self._lock:
+            self._buffer.append(consulta)
+        logger.warning(
+            "Consulta lenta (%.1f ms) en %s: %s | parámetros=%s",
+            duracion_ms, consulta.repositorio or "?", " ".join(statement.split()), consulta.parametros
+        )
+
+        if statement.lstrip()[:6].upper() in _SENTENCIAS_EXPLICABLES:
+            self._ejecutor.submit(self._capturar_explain, consulta, statement, parameters)
+
+    def _capturar_explain(self, consulta: ConsultaLenta, statement: str, parameters):
+        # El plan depende de la forma de la sentencia, no de los valores: se reutiliza por texto SQL
+        plan = self._planes.get(statement)
+        if plan is None:
+            prefijo = "EXPLAIN QUERY PLAN " if self.engine.dialect.name == "sqlite" else "EXPLAIN "
+            self._capturando.activo = True
+            try:
+                with self.engine.connect() as conn:
+                    filas = conn.exec_driver_sql(prefijo + statement, parameters).fetchall()
+                plan = [" | ".join(str(columna) for columna in fila) for fila in filas]
+            except Exception as e:
+                plan = [f"No se pudo obtener EXPLAIN: {e}"]
+            finally:
+                self._capturando.activo = False
+            self._planes[statement] = plan
+            if len(self._planes) > _MAXIMO_PLANES_EN_CACHE:
+                self._planes.popitem(last=False)
+        consulta.explain = plan
+
+    def consultas(self) -> List[ConsultaLenta]:
+        with self._lock:
+            return sorted(self._buffer, key=lambda c: c.duracion_ms, reverse=True)
+
+    def limpiar(self):
+        with self._lock:
+            self._buffer.clear()
+
+
+registro_consultas_lentas: Optional[RegistroConsultasLentas] = None
+
+
+def registrar_consultas_lentas(engine: Engine) -> RegistroConsultasLentas:
+    """Activa la captura de consultas que superan SLOW_QUERY_THRESHOLD_MS"""
+    global registro_consultas_lentas
+    if registro_consultas_lentas is None:
+        registro_consultas_lentas = RegistroConsultasLentas(engine)
+        instrumentar_engine(engine)
+        observar_consultas(registro_consultas_lentas.observar)
+    return registro_consultas_lentas
@@ -0,0 +1,160 @@
+# src/app/core/observability/tracing.py
+import functools
+import inspect
+import os
+import re
+import sys
+import time
+from typing import TYPE_CHECKING, Optional
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy.engine import Engine
+
+from src.app.core.observability.db_events import instrumentar_engine, observar_consultas
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+# console | otlp | memory | none (por defecto): con "none" no se instala nada y el costo es cero
+EXPORTADOR = os.getenv("OTEL_TRACES_EXPORTER", "none").lower()
+NOMBRE_SERVICIO = os.getenv("OTEL_SERVICE_NAME", "umsnh-api")
+
+# Módulos cuyas clases reciben spans automáticamente, uno por método público
+_CAPAS = {
+    "service": re.compile(r"^src\.app\.features\.\w+\.application\.services\.\w+$"),
+    "repository": re.compile(r"^src\.app\.features\.\w+\.infrastructure\.repositories\.\w+_impl$"),
+}
+
+tracer = trace.get_tracer("umsnh")
+# El SDK solo se importa si el tracing está habilitado
+exportador_en_memoria: Optional["InMemorySpanExporter"] = None
+
+
+def tracing_habilitado() -> bool:
+    return EXPORTADOR != "none"
+
+
+def _crear_procesador():
+    global exportador_en_memoria
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+
+    if EXPORTADOR == "console":
+        return BatchSpanProcessor(ConsoleSpanExporter())
+    if EXPORTADOR == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            raise RuntimeError(
+                "OTEL_TRACES_EXPORTER=otlp requiere instalar opentelemetry-exporter-otlp-proto-http"
+            ) from e
+        # El endpoint se toma de OTEL_EXPORTER_OTLP_ENDPOINT / OTEL_EXPORTER_OTLP_TRACES_ENDPOINT
+        return BatchSpanProcessor(OTLPSpanExporter())
+    if EXPORTADOR == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        exportador_en_memoria = InMemorySpanExporter()
+        return SimpleSpanProcessor(exportador_en_memoria)
+    raise ValueError(f"OTEL_TRACES_EXPORTER no soportado: {EXPORTADOR}")
+
+
+def _envolver_metodo(metodo, nombre_span: str, capa: str):
+    @functools.wraps(metodo)
+    def envoltura(*args, **kwargs):
+        with tracer.start_as_current_span(nombre_span, attributes={"code.layer": capa}):
+            return metodo(*args, **kwargs)
+    return envoltura
+
+
+def _instrumentar_clase(clase, capa: str):
+    for nombre, atributo in list(vars(clase).items()):
+        if nombre.startswith("_") or not inspect.isfunction(atributo):
+            continue
+        setattr(clase, nombre, _envolver_metodo(atributo, f"{clase.__name__}.{nombre}", capa))
+
+
+def instrumentar_capas():
+    """Envuelve los métodos públicos de servicios y repositorios ya importados, sin editarlos uno a uno"""
+    for nombre_modulo, modulo in list(sys.modules.items()):
+        for capa, patron in _CAPAS.items():
+            if modulo is None or not patron.match(nombre_modulo):
+                continue
+            for clase in vars(modulo).values():
+                # Solo las clases definidas en el módulo (no las importadas) y sin instrumentar aún
+                if inspect.isclass(clase) and clase.__module__ == nombre_modulo and not getattr(clase, "__trazada__", False):
+                    _instrumentar_clase(clase, capa)
+                    clase.__trazada__ = True
+
+
+def _span_de_consulta(statement, parameters, duracion, context):
+    # El evento llega al terminar la sentencia: el span se crea con su inicio real hacia atrás
+    fin = time.time_ns()
+    operacion = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+    span = tracer.start_span(
+        f"db {operacion}",
+        kind=SpanKind.CLIENT,
+        start_time=fin - int(duracion * 1e9),
+        attributes={
+            "db.system": context.dialect.name if context is not None else "sql",
+            "db.statement": " ".join(statement.split()),
+            "db.operation": operacion,
+        },
+    )
+    span.end(end_time=fin)
+
+
+class TracingMiddleware:
+    """Middleware ASGI: span de servidor por petición, continuando el contexto de las cabeceras entrantes"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cabeceras = {clave.decode("latin-1"): valor.decode("latin-1") for clave, valor in scope.get("headers", [])}
+        contexto_padre = propagate.extract(cabeceras)
+        status = 500
+
+        async def send_con_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with tracer.start_as_current_span(
+            f"{scope['method']} {scope['path']}",
+            context=contexto_padre,
+            kind=SpanKind.SERVER,
+            attributes={"http.method": scope["method"], "http.target": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_con_status)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.update_name(f"{scope['method']} {route.path}")
+                    span.set_attribute("http.route", route.path)
+                span.set_attribute("http.status_code", status)
+                if status >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+
+
+def configurar_tracing(app, engine: Engine) -> bool:
+    """Instala proveedor, exportador, spans de capas y de BD según OTEL_TRACES_EXPORTER"""
+    if not tracing_habilitado():
+        return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+
+    proveedor = TracerProvider(resource=Resource.create({"service.name": NOMBRE_SERVICIO}))
+    proveedor.add_span_processor(_crear_procesador())
+    trace.set_tracer_provider(proveedor)
+
+    instrumentar_capas()
+    instrumentar_engine(engine)
+    observar_consultas(_span_de_consulta)
+    app.add_middleware(TracingMiddleware)
+    return True
@@ -0,0 +1,13 @@
+# src/app/core/startup/documentacion.py
+import os
+
+
+def opciones_documentacion() -> dict:
+    """Argumentos de FastAPI() para /openapi.json, /docs y /redoc.
+
+    FastAPI ya genera el esquema en la primera petición a /openapi.json; con OPENAPI_ENABLED=false
+    (recomendado en producción) no se expone ni se genera nunca.
+    """
+    if os.getenv("OPENAPI_ENABLED", "true").lower() == "true":
+        return {}
+    return {"openapi_url": None, "docs_url": None, "redoc_url": None}
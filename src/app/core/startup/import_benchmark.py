@@ -0,0 +1,113 @@
+# src/app/core/startup/import_benchmark.py
+"""Costo de importación del arranque a partir de `python -X importtime`.
+
+Importa `main` en un proceso limpio (sin cachés de módulos del proceso actual), agrupa el tiempo
+propio de cada módulo por paquete y falla si el total supera el presupuesto:
+
+    python -m src.app.core.startup.import_benchmark --presupuesto-ms 1500
+    python -m src.app.core.startup.import_benchmark --repeticiones 5 --json
+
+Las variables de entorno se heredan: LAZY_ROUTERS=true mide el arranque con routers diferidos.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+_RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+# import time:       576 |     120566 |         sentry_sdk.client
+_LINEA = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+Medicion = Dict[str, Tuple[int, int]]
+
+
+def medir(modulo: str = "main") -> Tuple[Medicion, int]:
+    """Una importación en frío: ({módulo: (propio_us, acumulado_us)}, total_us)"""
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=_RAIZ_PROYECTO,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"No se pudo importar {modulo}:\n{proceso.stderr[-2000:]}")
+
+    modulos: Medicion = {}
+    for linea in proceso.stderr.splitlines():
+        coincidencia = _LINEA.match(linea)
+        if coincidencia:
+            propio, acumulado, _, nombre = coincidencia.groups()
+            modulos[nombre] = (int(propio), int(acumulado))
+    return modulos, sum(propio for propio, _ in modulos.values())
+
+
+def agrupar(modulos: Medicion) -> Dict[str, int]:
+    """Tiempo propio por paquete; las features se separan (src.app.features.prestamos)"""
+    grupos: Dict[str, int] = defaultdict(int)
+    for nombre, (propio, _) in modulos.items():
+        partes = nombre.split(".")
+        profundidad = 4 if nombre.startswith("src.app.features.") or nombre.startswith("src.app.core.") else 1
+        grupos[".".join(partes[:profundidad])] += propio
+    return dict(grupos)
+
+
+def _mediana_por_clave(mediciones: List[Dict[str, int]]) -> Dict[str, int]:
+    claves = set().union(*mediciones)
+    return {clave: int(statistics.median(m.get(clave, 0) for m in mediciones)) for clave in claves}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modulo", default="main")
+    parser.add_argument("--repeticiones", type=int, default=3, help="se reporta la mediana")
+    parser.add_argument("--presupuesto-ms", type=float, default=float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "0")),
+                        help="falla (código 1) si el total supera este valor; 0 desactiva la comprobación")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="salida JSON en lugar de tabla")
+    args = parser.parse_args(argv)
+
+    totales, grupos, modulos = [], [], []
+    for _ in range(args.repeticiones):
+        medicion, total = medir(args.modulo)
+        totales.append(total)
+        grupos.append(agrupar(medicion))
+        modulos.append({nombre: propio for nombre, (propio, _) in medicion.items()})
+
+    total_ms = statistics.median(totales) / 1000
+    por_paquete = sorted(_mediana_por_clave(grupos).items(), key=lambda p: p[1], reverse=True)
+    por_modulo = sorted(_mediana_por_clave(modulos).items(), key=lambda p: p[1], reverse=True)
+    excedido = args.presupuesto_ms > 0 and total_ms > args.presupuesto_ms
+
+    if args.json:
+        print(json.dumps({
+            "modulo": args.modulo,
+            "total_ms": round(total_ms, 1),
+            "presupuesto_ms": args.presupuesto_ms or None,
+            "excedido": excedido,
+            "paquetes_ms": {nombre: round(us / 1000, 1) for nombre, us in por_paquete[:args.top]},
+            "modulos_ms": {nombre: round(us / 1000, 1) for nombre, us in por_modulo[:args.top]},
+        }, indent=2))
+    else:
+        print(f"Importar {args.modulo}: {total_ms:.1f} ms (mediana de {args.repeticiones})")
+        print("\nPor paquete (tiempo propio):")
+        for nombre, us in por_paquete[:args.top]:
+            print(f"  {us / 1000:9.1f} ms  {nombre}")
+        print("\nMódulos más costosos (tiempo propio):")
+        for nombre, us in por_modulo[:args.top]:
+            print(f"  {us / 1000:9.1f} ms  {nombre}")
+        if args.presupuesto_ms > 0:
+            estado = "EXCEDIDO" if excedido else "OK"
+            print(f"\nPresupuesto {args.presupuesto_ms:.0f} ms: {estado}")
+
+    return 1 if excedido else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
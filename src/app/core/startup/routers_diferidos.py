@@ -0,0 +1,143 @@
+# src/app/core/startup/routers_diferidos.py
+"""Registro de los routers de features, inmediato o diferido.
+
+Con LAZY_ROUTERS=true cada feature se registra como un marcador de prefijo: su router (y con él
+sus esquemas, servicios, repositorios y modelos) se importa en la primera petición a ese prefijo
+o al generar el esquema OpenAPI. Sin la variable se importan todos al arrancar, como antes.
+"""
+import importlib
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+from fastapi import FastAPI
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+logger = logging.getLogger(__name__)
+
+# (prefijo, módulo que define `router`), en el orden en que se registran
+ROUTERS_FEATURES: List[Tuple[str, str]] = [
+    ("/roles", "src.app.features.rol.presentation.routers.rol_router"),
+    ("/users", "src.app.features.user.presentation.routers.user_router"),
+    ("/carreras", "src.app.features.carrera.presentation.routers.carrera_router"),
+    ("/estudiantes", "src.app.features.estudiante.presentation.routers.estudiante_router"),
+    ("/ciclos", "src.app.features.ciclo.presentation.routers.ciclo_router"),
+    ("/inscripciones", "src.app.features.inscripcion.presentation.routers.inscripcion_router"),
+    ("/administrativos", "src.app.features.administrativo.presentation.routers.administrativo_router"),
+    ("/maestros", "src.app.features.maestros.presentation.routers.maestro_router"),
+    ("/bibliotecas", "src.app.features.bibliotecas.presentation.routers.biblioteca_router"),
+    ("/laboratorios", "src.app.features.laboratorios.presentation.routers.laboratorio_router"),
+    ("/catalogo", "src.app.features.catalogo.presentation.routers.catalogo_router"),
+    ("/ejemplares", "src.app.features.ejemplares.presentation.routers.ejemplar_router"),
+    ("/prestamos", "src.app.features.prestamos.presentation.routers.prestamo_router"),
+    ("/estadisticas", "src.app.features.estadisticas.presentation.routers.estadistica_router"),
+]
+
+# Se ejecutan tras cargar cada router diferido, con las rutas nuevas ya registradas
+_al_cargar: List[Callable[[FastAPI], None]] = []
+
+
+def routers_diferidos_habilitados() -> bool:
+    return os.getenv("LAZY_ROUTERS", "false").lower() == "true"
+
+
+def al_cargar_routers(callback: Callable[[FastAPI], None]):
+    """Suscribe una función que necesita ver las rutas nuevas (instrumentación, perfilador...)"""
+    if callback not in _al_cargar:
+        _al_cargar.append(callback)
+
+
+class _RutaDiferida(BaseRoute):
+    """Marcador que atrapa cualquier ruta bajo su prefijo y carga el router real al primer uso"""
+
+    def __init__(self, prefijo: str, modulo: str, cargador: "CargadorRouters"):
+        self.prefijo = prefijo
+        self.modulo = modulo
+        self.cargador = cargador
+
+    def matches(self, scope) -> Tuple[Match, dict]:
+        if scope["type"] in ("http", "websocket"):
+            ruta = get_route_path(scope)
+            if ruta == self.prefijo or ruta.startswith(self.prefijo + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send):
+        self.cargador.cargar(self.prefijo)
+        # Con el marcador ya sustituido, el router resuelve la ruta real (o 404/405/redirección)
+        await self.cargador.app.router(scope, receive, send)
+
+
+class CargadorRouters:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self._pendientes: Dict[str, _RutaDiferida] = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, routers: List[Tuple[str, str]]):
+        for prefijo, modulo in routers:
+            marcador = _RutaDiferida(prefijo, modulo, self)
+            self._pendientes[prefijo] = marcador
+            self.app.router.routes.append(marcador)
+
+    def pendientes(self) -> List[str]:
+        return list(self._pendientes)
+
+    def cargar(self, prefijo: str):
+        # La importación es síncrona: bloquea el event loop una sola vez por feature
+        with self._lock:
+            marcador = self._pendientes.pop(prefijo, None)
+            if marcador is None:
+                return
+            inicio = time.perf_counter()
+            router = importlib.import_module(marcador.modulo).router
+
+            rutas = self.app.router.routes
+            posicion = rutas.index(marcador)
+            rutas.remove(marcador)
+            total_previo = len(rutas)
+            self.app.include_router(router)
+            # include_router agrega al final: las rutas nuevas ocupan el lugar del marcador
+            nuevas = rutas[total_previo:]
+            del rutas[total_previo:]
+            rutas[posicion:posicion] = nuevas
+            self.app.openapi_schema = None
+
+            for callback in _al_cargar:
+                callback(self.app)
+            logger.info(
+                "Router %s cargado en %.1f ms", prefijo, (time.perf_counter() - inicio) * 1000,
+                extra={"prefijo": prefijo, "rutas": len(nuevas)},
+            )
+
+    def cargar_todos(self):
+        for prefijo in self.pendientes():
+            self.cargar(prefijo)
+
+
+def registrar_routers(app: FastAPI, routers: List[Tuple[str, str]] = ROUTERS_FEATURES) -> CargadorRouters:
+    """Registra los routers de features según LAZY_ROUTERS y prepara el esquema OpenAPI para completarlos"""
+    cargador = CargadorRouters(app)
+    if routers_diferidos_habilitados():
+        cargador.registrar(routers)
+    else:
+        for _, modulo in routers:
+            app.include_router(importlib.import_module(modulo).router)
+
+    generar_openapi = app.openapi
+
+    def openapi_completo():
+        # El esquema se genera en la primera petición a /openapi.json y necesita todas las rutas
+        if cargador.pendientes():
+            cargador.cargar_todos()
+        return generar_openapi()
+
+    app.openapi = openapi_completo
+    app.state.cargador_routers = cargador
+    return cargador
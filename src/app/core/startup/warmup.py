@@ -0,0 +1,120 @@
+# src/app/core/startup/warmup.py
+"""Calentamiento del worker antes de aceptar tráfico.
+
+Se ejecuta en el lifespan de la app: abre conexiones del pool, carga los catálogos de referencia en
+`cache_referencia`, inicializa el backend de passlib y recorre los validadores de cada ruta. Hasta
+que termina, /health/ready responde 503.
+"""
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from src.app.core.database.database import engine
+
+logger = logging.getLogger(__name__)
+
+calentamiento_terminado = threading.Event()
+
+
+def calentamiento_habilitado() -> bool:
+    return os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+
+
+def abrir_conexiones(engine: Engine, cantidad: int) -> int:
+    """Abre `cantidad` conexiones a la vez y las devuelve al pool, que las conserva abiertas"""
+    conexiones = []
+    try:
+        for _ in range(cantidad):
+            conexion = engine.connect()
+            conexiones.append(conexion)
+            conexion.execute(text("SELECT 1"))
+    finally:
+        for conexion in conexiones:
+            conexion.close()
+    return len(conexiones)
+
+
+def precargar_catalogos(engine: Engine):
+    """Llena cache_referencia por los mismos servicios que usan los routers"""
+    from src.app.features.rol.infrastructure.repositories.rol_repository_impl import RolRepositoryImpl
+    from src.app.features.rol.application.services.rol_service import RolService
+    from src.app.features.carrera.infrastructure.repositories.carrera_repository_impl import CarreraRepositoryImpl
+    from src.app.features.carrera.application.services.carrera_service import CarreraService
+    from src.app.features.bibliotecas.infrastructure.repositories.biblioteca_repository_impl import BibliotecaRepositoryImpl
+    from src.app.features.bibliotecas.application.services.biblioteca_service import BibliotecaService
+    from src.app.features.laboratorios.infrastructure.repositories.laboratorio_repository_impl import LaboratorioRepositoryImpl
+    from src.app.features.laboratorios.application.services.laboratorio_service import LaboratorioService
+    from src.app.features.user.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+    from src.app.features.ciclo.infrastructure.repositories.ciclo_repository_impl import CicloRepositoryImpl
+    from src.app.features.ciclo.application.services.ciclo_service import CicloService
+
+    with Session(engine) as session:
+        RolService(RolRepositoryImpl(session)).get_all()
+        CarreraService(CarreraRepositoryImpl(session)).get_all()
+        BibliotecaService(BibliotecaRepositoryImpl(session)).get_all()
+        LaboratorioService(LaboratorioRepositoryImpl(session), UserRepositoryImpl(session)).get_all()
+        ciclo_service = CicloService(CicloRepositoryImpl(session))
+        ciclo_service.get_ciclos_activos()
+        ciclo_service.get_last_cycle_id()
+
+
+def inicializar_passlib():
+    """passlib detecta el backend de bcrypt en el primer hash; se fuerza aquí sin calcular ninguno"""
+    from src.app.features.user.application.services.user_service import pwd_context
+    pwd_context.handler().get_backend()
+
+
+def construir_validadores(app: FastAPI) -> int:
+    """Pasa una vez por el validador de cada cuerpo y respuesta: los modelos con referencias
+    pendientes terminan de construirse en su primer uso. Solo recorre las rutas ya cargadas; con
+    LAZY_ROUTERS=true los marcadores de routers diferidos se saltan y no se importa ninguna feature"""
+    campos = 0
+    for route in app.routes:
+        # Los marcadores de routers diferidos no son APIRoute
+        if not isinstance(route, APIRoute):
+            continue
+        for campo in (route.body_field, route.response_field, route.secure_cloned_response_field):
+            if campo is not None:
+                campo.validate(None, {}, loc=("calentamiento",))
+                campos += 1
+    return campos
+
+
+def calentar(app: FastAPI):
+    pasos = [
+        ("pool", lambda: abrir_conexiones(engine, int(os.getenv("WARMUP_POOL_CONNECTIONS", str(engine.pool.size()))))),
+        ("catalogos", lambda: precargar_catalogos(engine)),
+        ("passlib", inicializar_passlib),
+        ("validadores", lambda: construir_validadores(app)),
+    ]
+    inicio = time.perf_counter()
+    for nombre, paso in pasos:
+        inicio_paso = time.perf_counter()
+        try:
+            resultado = paso()
+        except Exception:
+            # Un paso fallido no impide arrancar: esa parte se calentará con las primeras peticiones
+            logger.exception("Calentamiento: falló el paso %s", nombre)
+            continue
+        logger.info(
+            "Calentamiento: %s en %.1f ms", nombre, (time.perf_counter() - inicio_paso) * 1000,
+            extra={"paso": nombre, "resultado": resultado},
+        )
+    logger.info("Calentamiento terminado en %.1f ms", (time.perf_counter() - inicio) * 1000)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if calentamiento_habilitado():
+        # Uvicorn no acepta conexiones hasta que termina el arranque del lifespan
+        calentar(app)
+    calentamiento_terminado.set()
+    yield
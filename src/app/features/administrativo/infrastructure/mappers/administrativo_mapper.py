@@ -8,7 +8,7 @@ class AdministrativoMapper:
         if not administrativo_db:
             return None
             
-        return Administrativo(
+        return Administrativo.model_construct(
             id_administrativo=administrativo_db.id_administrativo,
             id_usuario=administrativo_db.id_usuario,
             departamento=administrativo_db.departamento
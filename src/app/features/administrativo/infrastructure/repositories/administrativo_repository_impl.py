@@ -6,11 +6,13 @@ from src.app.features.administrativo.domain.entities.administrativo import Admin
 from src.app.features.administrativo.infrastructure.models.administrativo_model import AdministrativoDB
 from src.app.features.administrativo.infrastructure.mappers.administrativo_mapper import AdministrativoMapper
 from src.app.features.user.infrastructure.models.user_model import UserDB
+from src.app.core.database.replicas import lectura_replica
 
 class AdministrativoRepositoryImpl(AdministrativoRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[Administrativo]:
         try:
             statement = select(AdministrativoDB)
@@ -35,6 +37,7 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_departamento(self, departamento: str) -> List[Administrativo]:
         try:
             statement = select(AdministrativoDB).where(AdministrativoDB.departamento == departamento)
@@ -47,9 +50,11 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
         try:
             administrativo_db = AdministrativoMapper.to_db(administrativo)
             self.session.add(administrativo_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = AdministrativoMapper.to_domain(administrativo_db)
             self.session.commit()
-            self.session.refresh(administrativo_db)
-            return AdministrativoMapper.to_domain(administrativo_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -60,9 +65,10 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
             if administrativo_db:
                 administrativo_db.departamento = administrativo.departamento
                 self.session.add(administrativo_db)
+                self.session.flush()
+                entidad = AdministrativoMapper.to_domain(administrativo_db)
                 self.session.commit()
-                self.session.refresh(administrativo_db)
-                return AdministrativoMapper.to_domain(administrativo_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -89,6 +95,7 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
             raise e
 
     # Implementación de métodos con JOINs para datos detallados
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         try:
             statement = select(AdministrativoDB, UserDB).join(UserDB, AdministrativoDB.id_usuario == UserDB.id_usuario)
@@ -106,6 +113,7 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_administrativo: int) -> Optional[dict]:
         try:
             statement = select(AdministrativoDB, UserDB).join(
@@ -123,6 +131,7 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_usuario_id_with_details(self, id_usuario: int) -> Optional[dict]:
         try:
             statement = select(AdministrativoDB, UserDB).join(
@@ -140,6 +149,7 @@ class AdministrativoRepositoryImpl(AdministrativoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_departamento_with_details(self, departamento: str) -> List[dict]:
         try:
             statement = select(AdministrativoDB, UserDB).join(
@@ -3,13 +3,14 @@ from typing import List, Optional
 from src.app.features.bibliotecas.domain.entities.biblioteca import Biblioteca
 from src.app.features.bibliotecas.domain.repositories.biblioteca_repository import BibliotecaRepository
 from src.app.features.bibliotecas.application.dtos import CreateBibliotecaDTO, UpdateBibliotecaDTO
+from src.app.shared.cache.cache_referencia import cache_referencia
 
 class BibliotecaService:
     def __init__(self, biblioteca_repository: BibliotecaRepository):
         self.biblioteca_repository = biblioteca_repository
     
     def get_all(self) -> List[Biblioteca]:
-        return self.biblioteca_repository.get_all()
+        return list(cache_referencia.obtener("bibliotecas", self.biblioteca_repository.get_all))
     
     def get_by_id(self, id_biblioteca: int) -> Optional[Biblioteca]:
         return self.biblioteca_repository.get_by_id(id_biblioteca)
@@ -29,7 +30,9 @@ class BibliotecaService:
             ubicacion=create_dto.ubicacion
         )
         
-        return self.biblioteca_repository.create(biblioteca)
+        guardado = self.biblioteca_repository.create(biblioteca)
+        cache_referencia.invalidar("bibliotecas")
+        return guardado
     
     def update(self, id_biblioteca: int, update_dto: UpdateBibliotecaDTO) -> Optional[Biblioteca]:
         existing_biblioteca = self.biblioteca_repository.get_by_id(id_biblioteca)
@@ -48,14 +51,18 @@ class BibliotecaService:
         if update_dto.ubicacion is not None:
             existing_biblioteca.ubicacion = update_dto.ubicacion
         
-        return self.biblioteca_repository.update(id_biblioteca, existing_biblioteca)
+        guardado = self.biblioteca_repository.update(id_biblioteca, existing_biblioteca)
+        cache_referencia.invalidar("bibliotecas")
+        return guardado
     
     def delete(self, id_biblioteca: int) -> bool:
         existing_biblioteca = self.biblioteca_repository.get_by_id(id_biblioteca)
         if not existing_biblioteca:
             raise ValueError(f"Biblioteca con ID {id_biblioteca} no encontrada")
         
-        return self.biblioteca_repository.delete(id_biblioteca)
+        eliminado = self.biblioteca_repository.delete(id_biblioteca)
+        cache_referencia.invalidar("bibliotecas")
+        return eliminado
     
     def exists_by_nombre(self, nombre: str) -> bool:
         return self.biblioteca_repository.exists_by_nombre(nombre)
\ No newline at end of file
@@ -8,7 +8,7 @@ class BibliotecaMapper:
         if not biblioteca_db:
             return None
             
-        return Biblioteca(
+        return Biblioteca.model_construct(
             id_biblioteca=biblioteca_db.id_biblioteca,
             nombre=biblioteca_db.nombre,
             ubicacion=biblioteca_db.ubicacion
@@ -38,9 +38,11 @@ class BibliotecaRepositoryImpl(BibliotecaRepository):
         try:
             biblioteca_db = BibliotecaMapper.to_db(biblioteca)
             self.session.add(biblioteca_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = BibliotecaMapper.to_domain(biblioteca_db)
             self.session.commit()
-            self.session.refresh(biblioteca_db)
-            return BibliotecaMapper.to_domain(biblioteca_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -52,9 +54,10 @@ class BibliotecaRepositoryImpl(BibliotecaRepository):
                 biblioteca_db.nombre = biblioteca.nombre
                 biblioteca_db.ubicacion = biblioteca.ubicacion
                 self.session.add(biblioteca_db)
+                self.session.flush()
+                entidad = BibliotecaMapper.to_domain(biblioteca_db)
                 self.session.commit()
-                self.session.refresh(biblioteca_db)
-                return BibliotecaMapper.to_domain(biblioteca_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -5,13 +5,14 @@ from src.app.features.carrera.domain.value_objects.nombre_carrera import NombreC
 from src.app.features.carrera.domain.value_objects.facultad import FacultadValueObject
 from src.app.features.carrera.domain.repositories.carrera_repository import CarreraRepository
 from src.app.features.carrera.application.dtos import CreateCarreraDTO, UpdateCarreraDTO
+from src.app.shared.cache.cache_referencia import cache_referencia
 
 class CarreraService:
     def __init__(self, carrera_repository: CarreraRepository):
         self.carrera_repository = carrera_repository
     
     def get_all(self) -> List[Carrera]:
-        return self.carrera_repository.get_all()
+        return list(cache_referencia.obtener("carreras", self.carrera_repository.get_all))
     
     def get_by_id(self, id_carrera: int) -> Optional[Carrera]:
         return self.carrera_repository.get_by_id(id_carrera)
@@ -32,7 +33,9 @@ class CarreraService:
             facultad=FacultadValueObject(valor=create_dto.facultad)
         )
         
-        return self.carrera_repository.create(carrera)
+        guardado = self.carrera_repository.create(carrera)
+        cache_referencia.invalidar("carreras")
+        return guardado
     
     def update(self, id_carrera: int, update_dto: UpdateCarreraDTO) -> Optional[Carrera]:
         existing_carrera = self.carrera_repository.get_by_id(id_carrera)
@@ -52,7 +55,9 @@ class CarreraService:
         if update_dto.facultad:
             existing_carrera.cambiar_facultad(update_dto.facultad)
         
-        return self.carrera_repository.update(id_carrera, existing_carrera)
+        guardado = self.carrera_repository.update(id_carrera, existing_carrera)
+        cache_referencia.invalidar("carreras")
+        return guardado
     
     def delete(self, id_carrera: int) -> bool:
         existing_carrera = self.carrera_repository.get_by_id(id_carrera)
@@ -62,7 +67,9 @@ class CarreraService:
         # Aquí podrías agregar validaciones adicionales
         # Por ejemplo: verificar que no haya estudiantes en esta carrera
         
-        return self.carrera_repository.delete(id_carrera)
+        eliminado = self.carrera_repository.delete(id_carrera)
+        cache_referencia.invalidar("carreras")
+        return eliminado
     
     def exists_by_nombre(self, nombre_carrera: str) -> bool:
         return self.carrera_repository.exists_by_nombre(nombre_carrera)
\ No newline at end of file
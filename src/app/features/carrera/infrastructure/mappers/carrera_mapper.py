@@ -10,10 +10,10 @@ class CarreraMapper:
         if not carrera_db:
             return None
             
-        return Carrera(
+        return Carrera.model_construct(
             id_carrera=carrera_db.id_carrera,
-            carrera=NombreCarreraValueObject(valor=carrera_db.carrera),
-            facultad=FacultadValueObject(valor=carrera_db.facultad)
+            carrera=NombreCarreraValueObject.model_construct(valor=carrera_db.carrera),
+            facultad=FacultadValueObject.model_construct(valor=carrera_db.facultad)
         )
 
     @staticmethod
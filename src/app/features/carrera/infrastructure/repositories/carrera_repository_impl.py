@@ -38,9 +38,11 @@ class CarreraRepositoryImpl(CarreraRepository):
         try:
             carrera_db = CarreraMapper.to_db(carrera)
             self.session.add(carrera_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = CarreraMapper.to_domain(carrera_db)
             self.session.commit()
-            self.session.refresh(carrera_db)
-            return CarreraMapper.to_domain(carrera_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -52,9 +54,10 @@ class CarreraRepositoryImpl(CarreraRepository):
                 carrera_db.carrera = carrera.carrera.valor
                 carrera_db.facultad = carrera.facultad.valor
                 self.session.add(carrera_db)
+                self.session.flush()
+                entidad = CarreraMapper.to_domain(carrera_db)
                 self.session.commit()
-                self.session.refresh(carrera_db)
-                return CarreraMapper.to_domain(carrera_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -11,6 +11,12 @@ class CreateCatalogoDTO(BaseModel):
 
 class UpdateCatalogoDTO(BaseModel):
     tipo: Optional[str] = None
+    nombre: Optional[str] = None
+    autor: Optional[str] = None
+    isbn: Optional[str] = None
+    descripcion: Optional[str] = None
+
+class PatchCatalogoDTO(BaseModel):
     nombre: Optional[str] = None
     autor: Optional[str] = None
     isbn: Optional[str] = None
@@ -2,8 +2,8 @@
 from typing import List, Optional
 from src.app.features.catalogo.domain.entities.catalogo import Catalogo
 from src.app.features.catalogo.domain.repositories.catalogo_repository import CatalogoRepository
-from src.app.features.catalogo.application.dtos import CreateCatalogoDTO, UpdateCatalogoDTO
-from src.app.features.catalogo.domain.value_objects.tipo_item import TipoItem
+from src.app.features.catalogo.application.dtos import CreateCatalogoDTO, UpdateCatalogoDTO, PatchCatalogoDTO
+from src.app.features.catalogo.domain.value_objects.tipo_item import TipoItem, TipoItemEnum
 from src.app.features.catalogo.domain.value_objects.nombre_item import NombreItem
 from src.app.features.catalogo.domain.value_objects.isbn import ISBN
 
@@ -138,6 +138,48 @@ class CatalogoService:
         
         return self.catalogo_repository.update(id_catalogo, existing_catalogo)
     
+    def patch(self, id_catalogo: int, patch_dto: PatchCatalogoDTO) -> Optional[List[str]]:
+        """Actualización parcial: valida solo los campos enviados y emite un único UPDATE.
+        El tipo no se puede cambiar aquí porque reinicia autor e ISBN; para eso se usa update."""
+        campos = patch_dto.model_dump(exclude_none=True)
+        if not campos:
+            raise ValueError("No se proporcionaron campos para actualizar")
+        
+        cambios = {}
+        if "nombre" in campos:
+            nombre_vo = NombreItem(valor=campos["nombre"])
+            catalogo_con_mismo_nombre = self.catalogo_repository.get_by_nombre(nombre_vo.valor)
+            if catalogo_con_mismo_nombre and catalogo_con_mismo_nombre.id_catalogo != id_catalogo:
+                raise ValueError(f"Ya existe un item en el catálogo con el nombre: {nombre_vo.valor}")
+            cambios["nombre"] = nombre_vo.valor
+        
+        if "autor" in campos:
+            if not campos["autor"].strip():
+                raise ValueError("Los libros deben tener un autor")
+            cambios["autor"] = campos["autor"]
+        
+        if "isbn" in campos:
+            isbn_vo = ISBN(valor=campos["isbn"])
+            if isbn_vo.es_valido():
+                catalogo_con_mismo_isbn = self.catalogo_repository.get_by_isbn(isbn_vo.valor)
+                if catalogo_con_mismo_isbn and catalogo_con_mismo_isbn.id_catalogo != id_catalogo:
+                    raise ValueError(f"Ya existe un libro con el ISBN: {isbn_vo.valor}")
+            cambios["isbn"] = isbn_vo.valor if isbn_vo.es_valido() else None
+        
+        if "descripcion" in campos:
+            cambios["descripcion"] = campos["descripcion"]
+        
+        # Autor e ISBN solo aplican a libros: la condición va en el propio UPDATE
+        solo_libros = "autor" in cambios or "isbn" in cambios
+        tipo = TipoItemEnum.LIBRO.value if solo_libros else None
+        
+        if not self.catalogo_repository.patch(id_catalogo, cambios, tipo=tipo):
+            # Solo en el caso de fallo se distingue "no existe" de "no es un libro"
+            if solo_libros and self.catalogo_repository.get_by_id(id_catalogo):
+                raise ValueError("Solo los libros pueden tener autor o ISBN")
+            return None
+        return list(cambios.keys())
+    
     def delete(self, id_catalogo: int) -> bool:
         existing_catalogo = self.catalogo_repository.get_by_id(id_catalogo)
         if not existing_catalogo:
@@ -159,4 +201,8 @@ class CatalogoService:
         return self.catalogo_repository.get_herramientas()
 
     def get_equipos(self) -> List[Catalogo]:
-        return self.catalogo_repository.get_equipos()
\ No newline at end of file
+        return self.catalogo_repository.get_equipos()
+
+    def reconciliar_contadores(self, id_catalogo: Optional[int] = None) -> List[dict]:
+        """Recalcula los contadores de ejemplares y corrige los que se desviaron"""
+        return self.catalogo_repository.reconciliar_contadores(id_catalogo)
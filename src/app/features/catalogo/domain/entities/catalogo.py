@@ -12,6 +12,11 @@ class Catalogo(BaseModel):
     autor: Optional[str] = None
     isbn: Optional[ISBN] = None
     descripcion: Optional[str] = None
+    # Mantenidos por la persistencia al cambiar los ejemplares; solo lectura para el dominio
+    total_ejemplares: int = 0
+    ejemplares_disponibles: int = 0
+    ejemplares_prestados: int = 0
+    ejemplares_en_mantenimiento: int = 0
 
     def cambiar_nombre(self, nuevo_nombre: str):
         """Método de negocio para cambiar nombre"""
@@ -53,5 +58,9 @@ class Catalogo(BaseModel):
         """Método de negocio: determina si requiere ISBN"""
         return self.es_libro()
 
+    def tiene_ejemplares_disponibles(self) -> bool:
+        """Método de negocio: hay al menos un ejemplar que se puede prestar"""
+        return self.ejemplares_disponibles > 0
+
     class Config:
         arbitrary_types_allowed = True
\ No newline at end of file
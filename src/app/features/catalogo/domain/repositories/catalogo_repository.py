@@ -37,6 +37,10 @@ class CatalogoRepository(ABC):
     def update(self, id_catalogo: int, catalogo: Catalogo) -> Optional[Catalogo]:
         pass
     
+    @abstractmethod
+    def patch(self, id_catalogo: int, cambios: dict, tipo: Optional[str] = None) -> bool:
+        pass
+    
     @abstractmethod
     def delete(self, id_catalogo: int) -> bool:
         pass
@@ -60,4 +64,8 @@ class CatalogoRepository(ABC):
 
     @abstractmethod
     def get_equipos(self) -> List[Catalogo]:
+        pass
+
+    @abstractmethod
+    def reconciliar_contadores(self, id_catalogo: Optional[int] = None) -> List[dict]:
         pass
\ No newline at end of file
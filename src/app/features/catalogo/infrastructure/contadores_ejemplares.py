@@ -0,0 +1,118 @@
+# src/app/features/catalogo/infrastructure/contadores_ejemplares.py
+"""Contadores de ejemplares por item del catálogo: total, disponibles, prestados y en mantenimiento.
+
+El repositorio de ejemplares los ajusta en la misma transacción que el INSERT, UPDATE o DELETE del
+ejemplar, con incrementos relativos (`columna = columna + n`) para no pisar ajustes concurrentes.
+`reconciliar` los recalcula desde Ejemplares y corrige la deriva que deja el SQL manual;
+`recalcular_todos` los reconstruye de una vez tras una carga masiva o una migración.
+"""
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlmodel import Session, select, update
+
+from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
+
+COLUMNAS_POR_ESTADO = {
+    "disponible": "ejemplares_disponibles",
+    "prestado": "ejemplares_prestados",
+    "mantenimiento": "ejemplares_en_mantenimiento",
+}
+COLUMNAS = ("total_ejemplares", *COLUMNAS_POR_ESTADO.values())
+
+# (id_catalogo, estado) de un ejemplar
+Ubicacion = Tuple[int, str]
+
+
+def registrar_cambio(session: Session, antes: Optional[Ubicacion], despues: Optional[Ubicacion]):
+    """Ajusta los contadores por el paso de un ejemplar de `antes` a `despues` (None: no existía / ya no existe).
+    No hace commit: se confirma junto con la escritura del ejemplar."""
+    deltas: Dict[int, Counter] = {}
+    for ubicacion, signo in ((antes, -1), (despues, 1)):
+        if ubicacion is None:
+            continue
+        id_catalogo, estado = ubicacion
+        delta = deltas.setdefault(id_catalogo, Counter())
+        delta["total_ejemplares"] += signo
+        if estado in COLUMNAS_POR_ESTADO:
+            delta[COLUMNAS_POR_ESTADO[estado]] += signo
+
+    for id_catalogo, delta in deltas.items():
+        valores = {columna: getattr(CatalogoDB, columna) + n for columna, n in delta.items() if n}
+        if valores:
+            session.exec(update(CatalogoDB).where(CatalogoDB.id_catalogo == id_catalogo).values(**valores))
+
+
+def _conteos_reales(session: Session, id_catalogo: Optional[int] = None) -> Dict[int, Dict[str, int]]:
+    statement = select(EjemplarDB.id_catalogo, EjemplarDB.estado, func.count()).group_by(
+        EjemplarDB.id_catalogo, EjemplarDB.estado
+    )
+    if id_catalogo is not None:
+        statement = statement.where(EjemplarDB.id_catalogo == id_catalogo)
+
+    conteos: Dict[int, Dict[str, int]] = {}
+    for id_cat, estado, cantidad in session.exec(statement):
+        conteo = conteos.setdefault(id_cat, dict.fromkeys(COLUMNAS, 0))
+        conteo["total_ejemplares"] += cantidad
+        if estado in COLUMNAS_POR_ESTADO:
+            conteo[COLUMNAS_POR_ESTADO[estado]] += cantidad
+    return conteos
+
+
+def recalcular_todos(session: Session) -> int:
+    """Recalcula todos los contadores con un único UPDATE; devuelve los items actualizados.
+    No bloquea por item: es para cargas masivas y migraciones, sin escrituras de ejemplares en curso."""
+    def contar(estado: Optional[str] = None):
+        conteo = select(func.count()).where(EjemplarDB.id_catalogo == CatalogoDB.id_catalogo)
+        if estado is not None:
+            conteo = conteo.where(EjemplarDB.estado == estado)
+        return conteo.scalar_subquery()
+
+    valores = {"total_ejemplares": contar()}
+    valores.update({columna: contar(estado) for estado, columna in COLUMNAS_POR_ESTADO.items()})
+    resultado = session.exec(update(CatalogoDB).values(**valores).execution_options(synchronize_session=False))
+    session.commit()
+    return resultado.rowcount
+
+
+def reconciliar(session: Session, id_catalogo: Optional[int] = None) -> List[dict]:
+    """Corrige los contadores que no coinciden con Ejemplares; devuelve los items corregidos.
+
+    Primero compara todo con una sola agrupación; cada item con deriva se repara en su propia
+    transacción: bloquea la fila del catálogo (las escrituras de ejemplares de ese item esperan a
+    ajustar su contador), vuelve a contar y guarda el valor absoluto.
+    """
+    vacio = dict.fromkeys(COLUMNAS, 0)
+    reales = _conteos_reales(session, id_catalogo)
+    statement = select(CatalogoDB.id_catalogo, *(getattr(CatalogoDB, columna) for columna in COLUMNAS))
+    if id_catalogo is not None:
+        statement = statement.where(CatalogoDB.id_catalogo == id_catalogo)
+    con_deriva = [
+        fila.id_catalogo for fila in session.exec(statement)
+        if {columna: getattr(fila, columna) for columna in COLUMNAS} != reales.get(fila.id_catalogo, vacio)
+    ]
+    session.commit()
+
+    corregidos = []
+    for id_cat in con_deriva:
+        try:
+            guardado = session.exec(
+                select(*(getattr(CatalogoDB, columna) for columna in COLUMNAS))
+                .where(CatalogoDB.id_catalogo == id_cat)
+                .with_for_update()
+            ).first()
+            if guardado is None:
+                session.rollback()
+                continue
+            real = _conteos_reales(session, id_cat).get(id_cat, vacio)
+            antes = dict(zip(COLUMNAS, guardado))
+            if antes != real:
+                session.exec(update(CatalogoDB).where(CatalogoDB.id_catalogo == id_cat).values(**real))
+                corregidos.append({"id_catalogo": id_cat, "antes": antes, "despues": real})
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+    return corregidos
@@ -1,7 +1,7 @@
 # src/app/features/catalogo/infrastructure/mappers/catalogo_mapper.py
 from src.app.features.catalogo.domain.entities.catalogo import Catalogo
 from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
-from src.app.features.catalogo.domain.value_objects.tipo_item import TipoItem
+from src.app.features.catalogo.domain.value_objects.tipo_item import TipoItem, TipoItemEnum
 from src.app.features.catalogo.domain.value_objects.nombre_item import NombreItem
 from src.app.features.catalogo.domain.value_objects.isbn import ISBN
 
@@ -11,13 +11,17 @@ class CatalogoMapper:
         if not catalogo_db:
             return None
             
-        return Catalogo(
+        return Catalogo.model_construct(
             id_catalogo=catalogo_db.id_catalogo,
-            tipo=TipoItem(valor=catalogo_db.tipo),
-            nombre=NombreItem(valor=catalogo_db.nombre),
+            tipo=TipoItem.model_construct(valor=TipoItemEnum(catalogo_db.tipo)),
+            nombre=NombreItem.model_construct(valor=catalogo_db.nombre),
             autor=catalogo_db.autor,
-            isbn=ISBN(valor=catalogo_db.isbn) if catalogo_db.isbn else None,
-            descripcion=catalogo_db.descripcion
+            isbn=ISBN.model_construct(valor=catalogo_db.isbn) if catalogo_db.isbn else None,
+            descripcion=catalogo_db.descripcion,
+            total_ejemplares=catalogo_db.total_ejemplares,
+            ejemplares_disponibles=catalogo_db.ejemplares_disponibles,
+            ejemplares_prestados=catalogo_db.ejemplares_prestados,
+            ejemplares_en_mantenimiento=catalogo_db.ejemplares_en_mantenimiento
         )
 
     @staticmethod
@@ -30,4 +30,22 @@ class CatalogoDB(SQLModel, table=True):
     descripcion: Optional[str] = Field(
         default=None,
         description="Descripción del item"
-    )
\ No newline at end of file
+    )
+
+    # Contadores de ejemplares; los mantiene el repositorio de ejemplares (contadores_ejemplares)
+    total_ejemplares: int = Field(
+        default=0,
+        description="Ejemplares del item en cualquier estado"
+    )
+    ejemplares_disponibles: int = Field(
+        default=0,
+        description="Ejemplares en estado disponible"
+    )
+    ejemplares_prestados: int = Field(
+        default=0,
+        description="Ejemplares en estado prestado"
+    )
+    ejemplares_en_mantenimiento: int = Field(
+        default=0,
+        description="Ejemplares en estado mantenimiento"
+    )
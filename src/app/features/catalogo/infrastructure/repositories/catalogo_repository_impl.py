@@ -1,15 +1,18 @@
 # src/app/features/catalogo/infrastructure/repositories/catalogo_repository_impl.py
 from typing import List, Optional
-from sqlmodel import select, Session
+from sqlmodel import select, update, Session
 from src.app.features.catalogo.domain.repositories.catalogo_repository import CatalogoRepository
 from src.app.features.catalogo.domain.entities.catalogo import Catalogo
 from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
 from src.app.features.catalogo.infrastructure.mappers.catalogo_mapper import CatalogoMapper
+from src.app.features.catalogo.infrastructure import contadores_ejemplares
+from src.app.core.database.replicas import lectura_replica
 
 class CatalogoRepositoryImpl(CatalogoRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB)
@@ -34,6 +37,7 @@ class CatalogoRepositoryImpl(CatalogoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_tipo(self, tipo: str) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB).where(CatalogoDB.tipo == tipo)
@@ -42,6 +46,7 @@ class CatalogoRepositoryImpl(CatalogoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_autor(self, autor: str) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB).where(CatalogoDB.autor == autor)
@@ -64,9 +69,11 @@ class CatalogoRepositoryImpl(CatalogoRepository):
         try:
             catalogo_db = CatalogoMapper.to_db(catalogo)
             self.session.add(catalogo_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = CatalogoMapper.to_domain(catalogo_db)
             self.session.commit()
-            self.session.refresh(catalogo_db)
-            return CatalogoMapper.to_domain(catalogo_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -81,14 +88,27 @@ class CatalogoRepositoryImpl(CatalogoRepository):
                 catalogo_db.isbn = catalogo.isbn.valor if catalogo.isbn and catalogo.isbn.valor else None
                 catalogo_db.descripcion = catalogo.descripcion
                 self.session.add(catalogo_db)
+                self.session.flush()
+                entidad = CatalogoMapper.to_domain(catalogo_db)
                 self.session.commit()
-                self.session.refresh(catalogo_db)
-                return CatalogoMapper.to_domain(catalogo_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
             raise e
 
+    def patch(self, id_catalogo: int, cambios: dict, tipo: Optional[str] = None) -> bool:
+        try:
+            statement = update(CatalogoDB).where(CatalogoDB.id_catalogo == id_catalogo)
+            if tipo is not None:
+                statement = statement.where(CatalogoDB.tipo == tipo)
+            resultado = self.session.exec(statement.values(**cambios))
+            self.session.commit()
+            return resultado.rowcount > 0
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
     def delete(self, id_catalogo: int) -> bool:
         try:
             catalogo_db = self.session.get(CatalogoDB, id_catalogo)
@@ -120,15 +140,16 @@ class CatalogoRepositoryImpl(CatalogoRepository):
             raise e
 
     # Métodos para tipos específicos
+    @lectura_replica
     def get_libros(self) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB).where(CatalogoDB.tipo == "libro")
             catalogos_db = self.session.exec(statement).all()
-            print(catalogos_db)
             return [CatalogoMapper.to_domain(cat_db) for cat_db in catalogos_db]
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_herramientas(self) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB).where(CatalogoDB.tipo == "herramienta")
@@ -137,10 +158,18 @@ class CatalogoRepositoryImpl(CatalogoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_equipos(self) -> List[Catalogo]:
         try:
             statement = select(CatalogoDB).where(CatalogoDB.tipo == "equipo")
             catalogos_db = self.session.exec(statement).all()
             return [CatalogoMapper.to_domain(cat_db) for cat_db in catalogos_db]
         except Exception as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    def reconciliar_contadores(self, id_catalogo: Optional[int] = None) -> List[dict]:
+        try:
+            return contadores_ejemplares.reconciliar(self.session, id_catalogo)
+        except Exception as e:
+            self.session.rollback()
+            raise e
@@ -1,21 +1,36 @@
 # src/app/features/catalogo/presentation/routers/catalogo_router.py
 from fastapi import APIRouter, Depends
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from src.app.features.catalogo.application.services.catalogo_service import CatalogoService
-from src.app.features.catalogo.application.dtos import CreateCatalogoDTO, UpdateCatalogoDTO
+from src.app.features.catalogo.application.dtos import CreateCatalogoDTO, UpdateCatalogoDTO, PatchCatalogoDTO
 from src.app.features.catalogo.infrastructure.dependencies import catalogo_service_dep
+from src.app.core.admin.dependencies import admin_dep
 from src.app.features.catalogo.presentation.schemas.catalogo_schemas import (
     CatalogoCreateRequest,
     CatalogoUpdateRequest,
+    CatalogoPatchRequest,
     CatalogoResponse,
     CatalogosListResponse,
     CatalogoSingleResponse,
-    CatalogoDeleteResponse
+    CatalogoPatchResponse,
+    CatalogoPatchSingleResponse,
+    CatalogoDeleteResponse,
+    ContadoresEjemplaresResponse,
+    ContadoresCorregidosResponse,
+    ContadoresCorregidosListResponse
 )
 from src.app.shared.schemas.generic_response import GenericResponse
 
 router = APIRouter(prefix="/catalogo", tags=["catalogo"])
 
+def _contadores_response(catalogo) -> dict:
+    return {
+        "total_ejemplares": catalogo.total_ejemplares,
+        "ejemplares_disponibles": catalogo.ejemplares_disponibles,
+        "ejemplares_prestados": catalogo.ejemplares_prestados,
+        "ejemplares_en_mantenimiento": catalogo.ejemplares_en_mantenimiento
+    }
+
 @router.get("/", response_model=CatalogosListResponse)
 def get_all_catalogo(service: catalogo_service_dep):
     try:
@@ -28,7 +43,8 @@ def get_all_catalogo(service: catalogo_service_dep):
                 nombre=cat.nombre.valor,
                 autor=cat.autor,
                 isbn=cat.isbn.valor if cat.isbn else None,
-                descripcion=cat.descripcion
+                descripcion=cat.descripcion,
+                **_contadores_response(cat)
             ) for cat in catalogos
         ]
         
@@ -62,7 +78,8 @@ def get_catalogo_by_id(id_catalogo: int, service: catalogo_service_dep):
             nombre=catalogo.nombre.valor,
             autor=catalogo.autor,
             isbn=catalogo.isbn.valor if catalogo.isbn else None,
-            descripcion=catalogo.descripcion
+            descripcion=catalogo.descripcion,
+            **_contadores_response(catalogo)
         )
         
         return GenericResponse.create_success(
@@ -97,7 +114,8 @@ def create_catalogo(catalogo_request: CatalogoCreateRequest, service: catalogo_s
             nombre=catalogo_entity.nombre.valor,
             autor=catalogo_entity.autor,
             isbn=catalogo_entity.isbn.valor if catalogo_entity.isbn else None,
-            descripcion=catalogo_entity.descripcion
+            descripcion=catalogo_entity.descripcion,
+            **_contadores_response(catalogo_entity)
         )
         
         return GenericResponse.create_success(
@@ -145,7 +163,8 @@ def update_catalogo(id_catalogo: int, catalogo_request: CatalogoUpdateRequest, s
             nombre=catalogo_entity.nombre.valor,
             autor=catalogo_entity.autor,
             isbn=catalogo_entity.isbn.valor if catalogo_entity.isbn else None,
-            descripcion=catalogo_entity.descripcion
+            descripcion=catalogo_entity.descripcion,
+            **_contadores_response(catalogo_entity)
         )
         
         return GenericResponse.create_success(
@@ -167,6 +186,39 @@ def update_catalogo(id_catalogo: int, catalogo_request: CatalogoUpdateRequest, s
             status=500
         )
 
+@router.patch("/{id_catalogo}", response_model=CatalogoPatchSingleResponse)
+def patch_catalogo(id_catalogo: int, catalogo_request: CatalogoPatchRequest, service: catalogo_service_dep):
+    try:
+        patch_dto = PatchCatalogoDTO(**catalogo_request.model_dump(exclude_none=True))
+        
+        campos_actualizados = service.patch(id_catalogo, patch_dto)
+        
+        if campos_actualizados is None:
+            return GenericResponse.create_error(
+                message="Item del catálogo no encontrado",
+                errors=[f"Item del catálogo con ID {id_catalogo} no existe"],
+                status=404
+            )
+        
+        return GenericResponse.create_success(
+            message="Item del catálogo actualizado exitosamente",
+            data=CatalogoPatchResponse(id_catalogo=id_catalogo, campos_actualizados=campos_actualizados),
+            status=200
+        )
+        
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al actualizar item del catálogo",
+            errors=[str(e)],
+            status=500
+        )
+
 @router.delete("/{id_catalogo}", response_model=CatalogoDeleteResponse)
 def delete_catalogo(id_catalogo: int, service: catalogo_service_dep):
     try:
@@ -215,7 +267,8 @@ def get_catalogo_by_nombre(nombre: str, service: catalogo_service_dep):
             nombre=catalogo.nombre.valor,
             autor=catalogo.autor,
             isbn=catalogo.isbn.valor if catalogo.isbn else None,
-            descripcion=catalogo.descripcion
+            descripcion=catalogo.descripcion,
+            **_contadores_response(catalogo)
         )
         
         return GenericResponse.create_success(
@@ -243,7 +296,8 @@ def get_catalogo_by_tipo(tipo: str, service: catalogo_service_dep):
                 nombre=cat.nombre.valor,
                 autor=cat.autor,
                 isbn=cat.isbn.valor if cat.isbn else None,
-                descripcion=cat.descripcion
+                descripcion=cat.descripcion,
+                **_contadores_response(cat)
             ) for cat in catalogos
         ]
         
@@ -272,7 +326,8 @@ def get_catalogo_by_autor(autor: str, service: catalogo_service_dep):
                 nombre=cat.nombre.valor,
                 autor=cat.autor,
                 isbn=cat.isbn.valor if cat.isbn else None,
-                descripcion=cat.descripcion
+                descripcion=cat.descripcion,
+                **_contadores_response(cat)
             ) for cat in catalogos
         ]
         
@@ -306,7 +361,8 @@ def get_catalogo_by_isbn(isbn: str, service: catalogo_service_dep):
             nombre=catalogo.nombre.valor,
             autor=catalogo.autor,
             isbn=catalogo.isbn.valor if catalogo.isbn else None,
-            descripcion=catalogo.descripcion
+            descripcion=catalogo.descripcion,
+            **_contadores_response(catalogo)
         )
         
         return GenericResponse.create_success(
@@ -335,7 +391,8 @@ def get_libros(service: catalogo_service_dep):
                 nombre=libro.nombre.valor,
                 autor=libro.autor,
                 isbn=libro.isbn.valor if libro.isbn else None,
-                descripcion=libro.descripcion
+                descripcion=libro.descripcion,
+                **_contadores_response(libro)
             ) for libro in libros
         ]
         
@@ -364,7 +421,8 @@ def get_herramientas(service: catalogo_service_dep):
                 nombre=herramienta.nombre.valor,
                 autor=herramienta.autor,
                 isbn=herramienta.isbn.valor if herramienta.isbn else None,
-                descripcion=herramienta.descripcion
+                descripcion=herramienta.descripcion,
+                **_contadores_response(herramienta)
             ) for herramienta in herramientas
         ]
         
@@ -393,7 +451,8 @@ def get_equipos(service: catalogo_service_dep):
                 nombre=equipo.nombre.valor,
                 autor=equipo.autor,
                 isbn=equipo.isbn.valor if equipo.isbn else None,
-                descripcion=equipo.descripcion
+                descripcion=equipo.descripcion,
+                **_contadores_response(equipo)
             ) for equipo in equipos
         ]
         
@@ -408,4 +467,31 @@ def get_equipos(service: catalogo_service_dep):
             message="Error al obtener equipos",
             errors=[str(e)],
             status=500
-        )
\ No newline at end of file
+        )
+
+# Reescribe contadores de todo el catálogo: solo con la cabecera X-Admin-Token
+@router.post("/reconciliar-contadores", response_model=ContadoresCorregidosListResponse, dependencies=[admin_dep])
+def reconciliar_contadores(service: catalogo_service_dep, id_catalogo: Optional[int] = None):
+    try:
+        corregidos = service.reconciliar_contadores(id_catalogo)
+        
+        corregidos_response = [
+            ContadoresCorregidosResponse(
+                id_catalogo=corregido["id_catalogo"],
+                antes=ContadoresEjemplaresResponse(**corregido["antes"]),
+                despues=ContadoresEjemplaresResponse(**corregido["despues"])
+            ) for corregido in corregidos
+        ]
+        
+        return GenericResponse.create_success(
+            message="Contadores de ejemplares reconciliados exitosamente",
+            data=corregidos_response,
+            status=200
+        )
+        
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al reconciliar contadores de ejemplares",
+            errors=[str(e)],
+            status=500
+        )
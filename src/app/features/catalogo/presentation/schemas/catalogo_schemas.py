@@ -18,6 +18,12 @@ class CatalogoUpdateRequest(BaseModel):
     isbn: Optional[str] = Field(None, max_length=30, description="ISBN del libro (solo para libros)")
     descripcion: Optional[str] = Field(None, description="Descripción del item")
 
+class CatalogoPatchRequest(BaseModel):
+    nombre: Optional[str] = Field(None, max_length=200, description="Nombre del item")
+    autor: Optional[str] = Field(None, max_length=200, description="Autor del libro (solo para libros)")
+    isbn: Optional[str] = Field(None, max_length=30, description="ISBN del libro (solo para libros)")
+    descripcion: Optional[str] = Field(None, description="Descripción del item")
+
 # Response Schema
 class CatalogoResponse(BaseModel):
     id_catalogo: int
@@ -26,11 +32,32 @@ class CatalogoResponse(BaseModel):
     autor: Optional[str] = None
     isbn: Optional[str] = None
     descripcion: Optional[str] = None
+    total_ejemplares: int = 0
+    ejemplares_disponibles: int = 0
+    ejemplares_prestados: int = 0
+    ejemplares_en_mantenimiento: int = 0
 
     class Config:
         from_attributes = True
 
+class ContadoresEjemplaresResponse(BaseModel):
+    total_ejemplares: int
+    ejemplares_disponibles: int
+    ejemplares_prestados: int
+    ejemplares_en_mantenimiento: int
+
+class ContadoresCorregidosResponse(BaseModel):
+    id_catalogo: int
+    antes: ContadoresEjemplaresResponse
+    despues: ContadoresEjemplaresResponse
+
+class CatalogoPatchResponse(BaseModel):
+    id_catalogo: int
+    campos_actualizados: List[str]
+
 # Generic Responses
 CatalogosListResponse = GenericResponse[List[CatalogoResponse]]
 CatalogoSingleResponse = GenericResponse[CatalogoResponse]
-CatalogoDeleteResponse = GenericResponse[None]
\ No newline at end of file
+CatalogoPatchSingleResponse = GenericResponse[CatalogoPatchResponse]
+CatalogoDeleteResponse = GenericResponse[None]
+ContadoresCorregidosListResponse = GenericResponse[List[ContadoresCorregidosResponse]]
\ No newline at end of file
@@ -6,13 +6,14 @@ from src.app.features.ciclo.domain.value_objects.nombre_ciclo import NombreCiclo
 from src.app.features.ciclo.domain.value_objects.rango_fechas import RangoFechasValueObject
 from src.app.features.ciclo.domain.repositories.ciclo_repository import CicloRepository
 from src.app.features.ciclo.application.dtos import CreateCicloDTO, UpdateCicloDTO
+from src.app.shared.cache.cache_referencia import cache_referencia
 
 class CicloService:
     def __init__(self, ciclo_repository: CicloRepository):
         self.ciclo_repository = ciclo_repository
     
     def get_all(self) -> List[Ciclo]:
-        return self.ciclo_repository.get_all()
+        return list(cache_referencia.obtener("ciclos", self.ciclo_repository.get_all))
     
     def get_by_id(self, id_ciclo: int) -> Optional[Ciclo]:
         return self.ciclo_repository.get_by_id(id_ciclo)
@@ -21,7 +22,9 @@ class CicloService:
         return self.ciclo_repository.get_by_nombre(nombre_ciclo)
     
     def get_ciclos_activos(self) -> List[Ciclo]:
-        return self.ciclo_repository.get_ciclos_activos()
+        # La fecha va en la clave: el ciclo actual cambia al cambiar el día aunque nadie escriba
+        clave = f"ciclos:activos:{date.today().isoformat()}"
+        return list(cache_referencia.obtener(clave, self.ciclo_repository.get_ciclos_activos))
     
     def get_ciclos_por_fecha(self, fecha: date) -> List[Ciclo]:
         return self.ciclo_repository.get_ciclos_por_fecha(fecha)
@@ -46,7 +49,9 @@ class CicloService:
             rango_fechas=rango_fechas_vo
         )
         
-        return self.ciclo_repository.create(ciclo)
+        guardado = self.ciclo_repository.create(ciclo)
+        cache_referencia.invalidar("ciclos")
+        return guardado
     
     def update(self, id_ciclo: int, update_dto: UpdateCicloDTO) -> Optional[Ciclo]:
         existing_ciclo = self.ciclo_repository.get_by_id(id_ciclo)
@@ -68,7 +73,9 @@ class CicloService:
             nueva_fecha_final = update_dto.fecha_final or existing_ciclo.rango_fechas.fecha_final
             existing_ciclo.cambiar_rango_fechas(nueva_fecha_inicio, nueva_fecha_final)
         
-        return self.ciclo_repository.update(id_ciclo, existing_ciclo)
+        guardado = self.ciclo_repository.update(id_ciclo, existing_ciclo)
+        cache_referencia.invalidar("ciclos")
+        return guardado
     
     def delete(self, id_ciclo: int) -> bool:
         existing_ciclo = self.ciclo_repository.get_by_id(id_ciclo)
@@ -78,11 +85,13 @@ class CicloService:
         # Aquí podrías agregar validaciones adicionales
         # Por ejemplo: verificar que no haya inscripciones en este ciclo
         
-        return self.ciclo_repository.delete(id_ciclo)
+        eliminado = self.ciclo_repository.delete(id_ciclo)
+        cache_referencia.invalidar("ciclos")
+        return eliminado
     
     def exists_by_nombre(self, nombre_ciclo: str) -> bool:
         return self.ciclo_repository.exists_by_nombre(nombre_ciclo)
     
 
     def get_last_cycle_id(self) -> Optional[int]:
-        return self.ciclo_repository.get_last_cycle_id()
\ No newline at end of file
+        return cache_referencia.obtener("ciclos:ultimo_id", self.ciclo_repository.get_last_cycle_id)
\ No newline at end of file
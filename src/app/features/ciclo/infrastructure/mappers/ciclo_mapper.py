@@ -10,10 +10,10 @@ class CicloMapper:
         if not ciclo_db:
             return None
             
-        return Ciclo(
+        return Ciclo.model_construct(
             id_ciclo=ciclo_db.id_ciclo,
-            ciclo=NombreCicloValueObject(valor=ciclo_db.ciclo),
-            rango_fechas=RangoFechasValueObject(
+            ciclo=NombreCicloValueObject.model_construct(valor=ciclo_db.ciclo),
+            rango_fechas=RangoFechasValueObject.model_construct(
                 fecha_inicio=ciclo_db.fecha_inicio,
                 fecha_final=ciclo_db.fecha_final
             )
@@ -6,6 +6,7 @@ from src.app.features.ciclo.domain.repositories.ciclo_repository import CicloRep
 from src.app.features.ciclo.domain.entities.ciclo import Ciclo
 from src.app.features.ciclo.infrastructure.models.ciclo_model import CicloDB
 from src.app.features.ciclo.infrastructure.mappers.ciclo_mapper import CicloMapper
+from src.app.core.database.replicas import lectura_replica
 
 class CicloRepositoryImpl(CicloRepository):
     def __init__(self, session: Session):
@@ -47,6 +48,7 @@ class CicloRepositoryImpl(CicloRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_ciclos_por_fecha(self, fecha: date) -> List[Ciclo]:
         try:
             statement = select(CicloDB).where(
@@ -62,9 +64,11 @@ class CicloRepositoryImpl(CicloRepository):
         try:
             ciclo_db = CicloMapper.to_db(ciclo)
             self.session.add(ciclo_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = CicloMapper.to_domain(ciclo_db)
             self.session.commit()
-            self.session.refresh(ciclo_db)
-            return CicloMapper.to_domain(ciclo_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -77,9 +81,10 @@ class CicloRepositoryImpl(CicloRepository):
                 ciclo_db.fecha_inicio = ciclo.rango_fechas.fecha_inicio
                 ciclo_db.fecha_final = ciclo.rango_fechas.fecha_final
                 self.session.add(ciclo_db)
+                self.session.flush()
+                entidad = CicloMapper.to_domain(ciclo_db)
                 self.session.commit()
-                self.session.refresh(ciclo_db)
-                return CicloMapper.to_domain(ciclo_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -277,7 +277,6 @@ def get_ciclos_por_fecha(fecha: date, service: ciclo_service_dep):
 def get_last_cycle_id(service: ciclo_service_dep):
     try:
         last_id = service.get_last_cycle_id()
-        print("Last ID obtenido:", last_id)
         if last_id is None:
             return GenericResponse.create_error(
                 message="No hay ciclos disponibles",
@@ -16,4 +16,9 @@ class UpdateEjemplarDTO(BaseModel):
     ubicacion: Optional[str] = None
     id_laboratorio: Optional[int] = None
     id_biblioteca: Optional[int] = None
+    estado: Optional[str] = None
+
+class PatchEjemplarDTO(BaseModel):
+    id_catalogo: Optional[int] = None
+    codigo_inventario: Optional[str] = None
     estado: Optional[str] = None
\ No newline at end of file
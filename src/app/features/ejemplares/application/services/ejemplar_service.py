@@ -2,10 +2,11 @@
 from typing import List, Optional
 from src.app.features.ejemplares.domain.entities.ejemplar import Ejemplar
 from src.app.features.ejemplares.domain.repositories.ejemplar_repository import EjemplarRepository
-from src.app.features.ejemplares.application.dtos import CreateEjemplarDTO, UpdateEjemplarDTO
+from src.app.features.ejemplares.application.dtos import CreateEjemplarDTO, UpdateEjemplarDTO, PatchEjemplarDTO
 from src.app.features.ejemplares.domain.value_objects.codigo_inventario import CodigoInventario
 from src.app.features.ejemplares.domain.value_objects.ubicacion_ejemplar import UbicacionEjemplar
 from src.app.features.ejemplares.domain.value_objects.estado_ejemplar import EstadoEjemplar
+from src.app.shared.concurrency.optimistic_lock import retry_on_conflict
 
 # Importamos dependencias
 from src.app.features.catalogo.domain.repositories.catalogo_repository import CatalogoRepository
@@ -138,6 +139,30 @@ class EjemplarService:
         
         return self.ejemplar_repository.update(id_ejemplar, existing_ejemplar)
     
+    def patch(self, id_ejemplar: int, patch_dto: PatchEjemplarDTO) -> Optional[List[str]]:
+        """Actualización parcial: valida solo los campos enviados y emite un único UPDATE.
+        La ubicación no se cambia aquí porque exige validar la consistencia con sus IDs."""
+        campos = patch_dto.model_dump(exclude_none=True)
+        if not campos:
+            raise ValueError("No se proporcionaron campos para actualizar")
+        
+        cambios = {}
+        if "id_catalogo" in campos:
+            if not self.catalogo_repository.get_by_id(campos["id_catalogo"]):
+                raise ValueError(f"Catálogo con ID {campos['id_catalogo']} no encontrado")
+            cambios["id_catalogo"] = campos["id_catalogo"]
+        
+        if "codigo_inventario" in campos:
+            # La unicidad la garantiza el índice único de la BD
+            cambios["codigo_inventario"] = CodigoInventario(valor=campos["codigo_inventario"]).valor
+        
+        if "estado" in campos:
+            cambios["estado"] = EstadoEjemplar(valor=campos["estado"]).valor.value
+        
+        if not self.ejemplar_repository.patch(id_ejemplar, cambios):
+            return None
+        return list(cambios.keys())
+    
     def delete(self, id_ejemplar: int) -> bool:
         existing_ejemplar = self.ejemplar_repository.get_by_id(id_ejemplar)
         if not existing_ejemplar:
@@ -165,7 +190,7 @@ class EjemplarService:
             raise ValueError(f"Ejemplar con ID {id_ejemplar} no encontrado")
         
         ejemplar.marcar_como_prestado()
-        return self.ejemplar_repository.update(id_ejemplar, ejemplar)
+        return self._guardar_transicion(ejemplar, Ejemplar.marcar_como_prestado)
 
     def marcar_como_devuelto(self, id_ejemplar: int) -> Optional[Ejemplar]:
         ejemplar = self.ejemplar_repository.get_by_id(id_ejemplar)
@@ -173,4 +198,13 @@ class EjemplarService:
             raise ValueError(f"Ejemplar con ID {id_ejemplar} no encontrado")
         
         ejemplar.marcar_como_devuelto()
-        return self.ejemplar_repository.update(id_ejemplar, ejemplar)
\ No newline at end of file
+        return self._guardar_transicion(ejemplar, Ejemplar.marcar_como_devuelto)
+
+    def _guardar_transicion(self, ejemplar: Ejemplar, transicion) -> Optional[Ejemplar]:
+        """Guarda un cambio de estado; si hubo una escritura concurrente relee y reaplica la transición"""
+        return retry_on_conflict(
+            ejemplar,
+            guardar=lambda e: self.ejemplar_repository.update(e.id_ejemplar, e),
+            recargar=lambda: self.ejemplar_repository.get_by_id(ejemplar.id_ejemplar),
+            aplicar=transicion
+        )
\ No newline at end of file
@@ -13,6 +13,7 @@ class Ejemplar(BaseModel):
     id_laboratorio: Optional[int] = None
     id_biblioteca: Optional[int] = None
     estado: EstadoEjemplar = EstadoEjemplar(valor="disponible")
+    version: int = 1
 
     def cambiar_ubicacion_laboratorio(self, id_laboratorio: int):
         """Método de negocio: cambiar a ubicación en laboratorio"""
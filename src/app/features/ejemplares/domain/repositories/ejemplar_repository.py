@@ -1,6 +1,6 @@
 # src/app/features/ejemplares/domain/repositories/ejemplar_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from src.app.features.ejemplares.domain.entities.ejemplar import Ejemplar
 
 class EjemplarRepository(ABC):
@@ -13,6 +13,11 @@ class EjemplarRepository(ABC):
     def get_by_id(self, id_ejemplar: int) -> Optional[Ejemplar]:
         pass
     
+    @abstractmethod
+    def get_by_id_con_tipo(self, id_ejemplar: int) -> Optional[Tuple[Ejemplar, str]]:
+        """El ejemplar y el tipo de su item del catálogo, en una sola consulta"""
+        pass
+    
     @abstractmethod
     def get_by_codigo_inventario(self, codigo_inventario: str) -> Optional[Ejemplar]:
         pass
@@ -45,6 +50,10 @@ class EjemplarRepository(ABC):
     def update(self, id_ejemplar: int, ejemplar: Ejemplar) -> Optional[Ejemplar]:
         pass
     
+    @abstractmethod
+    def patch(self, id_ejemplar: int, cambios: dict) -> bool:
+        pass
+    
     @abstractmethod
     def delete(self, id_ejemplar: int) -> bool:
         pass
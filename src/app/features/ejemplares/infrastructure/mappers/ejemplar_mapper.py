@@ -2,8 +2,8 @@
 from src.app.features.ejemplares.domain.entities.ejemplar import Ejemplar
 from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
 from src.app.features.ejemplares.domain.value_objects.codigo_inventario import CodigoInventario
-from src.app.features.ejemplares.domain.value_objects.ubicacion_ejemplar import UbicacionEjemplar
-from src.app.features.ejemplares.domain.value_objects.estado_ejemplar import EstadoEjemplar
+from src.app.features.ejemplares.domain.value_objects.ubicacion_ejemplar import UbicacionEjemplar, TipoUbicacionEnum
+from src.app.features.ejemplares.domain.value_objects.estado_ejemplar import EstadoEjemplar, EstadoEjemplarEnum
 
 class EjemplarMapper:
     @staticmethod
@@ -11,14 +11,15 @@ class EjemplarMapper:
         if not ejemplar_db:
             return None
             
-        return Ejemplar(
+        return Ejemplar.model_construct(
             id_ejemplar=ejemplar_db.id_ejemplar,
             id_catalogo=ejemplar_db.id_catalogo,
-            codigo_inventario=CodigoInventario(valor=ejemplar_db.codigo_inventario),
-            ubicacion=UbicacionEjemplar(valor=ejemplar_db.ubicacion),
+            codigo_inventario=CodigoInventario.model_construct(valor=ejemplar_db.codigo_inventario),
+            ubicacion=UbicacionEjemplar.model_construct(valor=TipoUbicacionEnum(ejemplar_db.ubicacion)),
             id_laboratorio=ejemplar_db.id_laboratorio,
             id_biblioteca=ejemplar_db.id_biblioteca,
-            estado=EstadoEjemplar(valor=ejemplar_db.estado)
+            estado=EstadoEjemplar.model_construct(valor=EstadoEjemplarEnum(ejemplar_db.estado)),
+            version=ejemplar_db.version
         )
 
     @staticmethod
@@ -33,5 +34,6 @@ class EjemplarMapper:
             ubicacion=ejemplar.ubicacion.valor.value,
             id_laboratorio=ejemplar.id_laboratorio,
             id_biblioteca=ejemplar.id_biblioteca,
-            estado=ejemplar.estado.valor.value
+            estado=ejemplar.estado.valor.value,
+            version=ejemplar.version
         )
\ No newline at end of file
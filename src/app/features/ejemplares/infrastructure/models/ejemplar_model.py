@@ -35,4 +35,8 @@ class EjemplarDB(SQLModel, table=True):
     estado: str = Field(
         default="disponible",
         description="Estado del ejemplar: no_disponible, disponible, prestado, mantenimiento, perdido"
+    )
+    version: int = Field(
+        default=1,
+        description="Versión de la fila para control de concurrencia optimista"
     )
\ No newline at end of file
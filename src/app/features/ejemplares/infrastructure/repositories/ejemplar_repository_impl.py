@@ -1,18 +1,26 @@
 # src/app/features/ejemplares/infrastructure/repositories/ejemplar_repository_impl.py
-from typing import List, Optional
-from sqlmodel import select, Session
+from typing import List, Optional, Tuple
+from sqlmodel import select, update, Session
+from sqlalchemy.exc import IntegrityError
 from src.app.features.ejemplares.domain.repositories.ejemplar_repository import EjemplarRepository
 from src.app.features.ejemplares.domain.entities.ejemplar import Ejemplar
 from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
 from src.app.features.ejemplares.infrastructure.mappers.ejemplar_mapper import EjemplarMapper
+from src.app.shared.concurrency.optimistic_lock import ConcurrencyConflictError
 from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.features.catalogo.infrastructure import contadores_ejemplares
 from src.app.features.bibliotecas.infrastructure.models.biblioteca_model import BibliotecaDB
 from src.app.features.laboratorios.infrastructure.models.laboratorio_model import LaboratorioDB
+from src.app.core.database.replicas import lectura_replica
 
 class EjemplarRepositoryImpl(EjemplarRepository):
     def __init__(self, session: Session):
         self.session = session
+        # id_ejemplar -> (version, id_catalogo, estado) leídos con get_by_id, para ajustar los
+        # contadores del catálogo al guardar sin volver a leer la fila
+        self._leidos = {}
 
+    @lectura_replica
     def get_all(self) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB)
@@ -25,7 +33,24 @@ class EjemplarRepositoryImpl(EjemplarRepository):
     def get_by_id(self, id_ejemplar: int) -> Optional[Ejemplar]:
         try:
             ejemplar_db = self.session.get(EjemplarDB, id_ejemplar)
-            return EjemplarMapper.to_domain(ejemplar_db) if ejemplar_db else None
+            if not ejemplar_db:
+                return None
+            self._leidos[id_ejemplar] = (ejemplar_db.version, ejemplar_db.id_catalogo, ejemplar_db.estado)
+            return EjemplarMapper.to_domain(ejemplar_db)
+        except Exception as e:
+            raise e
+
+    def get_by_id_con_tipo(self, id_ejemplar: int) -> Optional[Tuple[Ejemplar, str]]:
+        try:
+            statement = select(EjemplarDB, CatalogoDB.tipo).join(
+                CatalogoDB, EjemplarDB.id_catalogo == CatalogoDB.id_catalogo
+            ).where(EjemplarDB.id_ejemplar == id_ejemplar)
+            fila = self.session.exec(statement).first()
+            if not fila:
+                return None
+            ejemplar_db, tipo = fila
+            self._leidos[id_ejemplar] = (ejemplar_db.version, ejemplar_db.id_catalogo, ejemplar_db.estado)
+            return EjemplarMapper.to_domain(ejemplar_db), tipo
         except Exception as e:
             raise e
 
@@ -37,6 +62,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_catalogo(self, id_catalogo: int) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB).where(EjemplarDB.id_catalogo == id_catalogo)
@@ -45,6 +71,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_ubicacion(self, ubicacion: str) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB).where(EjemplarDB.ubicacion == ubicacion)
@@ -53,6 +80,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_estado(self, estado: str) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB).where(EjemplarDB.estado == estado)
@@ -61,6 +89,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_biblioteca(self, id_biblioteca: int) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB).where(EjemplarDB.id_biblioteca == id_biblioteca)
@@ -69,6 +98,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_laboratorio(self, id_laboratorio: int) -> List[Ejemplar]:
         try:
             statement = select(EjemplarDB).where(EjemplarDB.id_laboratorio == id_laboratorio)
@@ -81,28 +111,90 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         try:
             ejemplar_db = EjemplarMapper.to_db(ejemplar)
             self.session.add(ejemplar_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = EjemplarMapper.to_domain(ejemplar_db)
+            contadores_ejemplares.registrar_cambio(self.session, None, (ejemplar_db.id_catalogo, ejemplar_db.estado))
             self.session.commit()
-            self.session.refresh(ejemplar_db)
-            return EjemplarMapper.to_domain(ejemplar_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
 
     def update(self, id_ejemplar: int, ejemplar: Ejemplar) -> Optional[Ejemplar]:
         try:
-            ejemplar_db = self.session.get(EjemplarDB, id_ejemplar)
-            if ejemplar_db:
-                ejemplar_db.id_catalogo = ejemplar.id_catalogo
-                ejemplar_db.codigo_inventario = ejemplar.codigo_inventario.valor
-                ejemplar_db.ubicacion = ejemplar.ubicacion.valor.value
-                ejemplar_db.id_laboratorio = ejemplar.id_laboratorio
-                ejemplar_db.id_biblioteca = ejemplar.id_biblioteca
-                ejemplar_db.estado = ejemplar.estado.valor.value
-                self.session.add(ejemplar_db)
-                self.session.commit()
-                self.session.refresh(ejemplar_db)
-                return EjemplarMapper.to_domain(ejemplar_db)
-            return None
+            # Catálogo y estado que se reemplazan: los de la versión que se va a actualizar. Sin SELECT
+            # extra si el ejemplar se leyó con get_by_id; si la fila cambió desde entonces, el UPDATE no se aplica
+            antes = self._leido(id_ejemplar, ejemplar.version)
+            # UPDATE condicional: solo se aplica si la fila sigue en la versión que se leyó
+            statement = update(EjemplarDB).where(
+                EjemplarDB.id_ejemplar == id_ejemplar,
+                EjemplarDB.version == ejemplar.version
+            ).values(
+                id_catalogo=ejemplar.id_catalogo,
+                codigo_inventario=ejemplar.codigo_inventario.valor,
+                ubicacion=ejemplar.ubicacion.valor.value,
+                id_laboratorio=ejemplar.id_laboratorio,
+                id_biblioteca=ejemplar.id_biblioteca,
+                estado=ejemplar.estado.valor.value,
+                version=ejemplar.version + 1
+            )
+            resultado = self.session.exec(statement)
+            if resultado.rowcount == 0:
+                # El rollback cierra la transacción para que la siguiente lectura vea la fila actual
+                self.session.rollback()
+                if self.session.get(EjemplarDB, id_ejemplar) is None:
+                    return None
+                raise ConcurrencyConflictError(
+                    f"El ejemplar con ID {id_ejemplar} fue modificado por otra operación"
+                )
+            despues = (ejemplar.id_catalogo, ejemplar.estado.valor.value)
+            contadores_ejemplares.registrar_cambio(self.session, antes, despues)
+            self.session.commit()
+            ejemplar.id_ejemplar = id_ejemplar
+            ejemplar.version += 1
+            self._leidos[id_ejemplar] = (ejemplar.version, *despues)
+            return ejemplar
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+    def _leido(self, id_ejemplar: int, version: int):
+        leido = self._leidos.get(id_ejemplar)
+        if leido is not None and leido[0] == version:
+            return leido[1:]
+        fila = self.session.exec(
+            select(EjemplarDB.id_catalogo, EjemplarDB.estado)
+            .where(EjemplarDB.id_ejemplar == id_ejemplar, EjemplarDB.version == version)
+        ).first()
+        return tuple(fila) if fila else None
+
+    def patch(self, id_ejemplar: int, cambios: dict) -> bool:
+        try:
+            antes = None
+            if "estado" in cambios or "id_catalogo" in cambios:
+                # Bloquea la fila para que el ajuste de contadores parta del estado que se reemplaza
+                antes = self.session.exec(
+                    select(EjemplarDB.id_catalogo, EjemplarDB.estado)
+                    .where(EjemplarDB.id_ejemplar == id_ejemplar)
+                    .with_for_update()
+                ).first()
+                if antes is None:
+                    self.session.rollback()
+                    return False
+            statement = update(EjemplarDB).where(EjemplarDB.id_ejemplar == id_ejemplar).values(
+                **cambios, version=EjemplarDB.version + 1
+            )
+            resultado = self.session.exec(statement)
+            if antes is not None:
+                contadores_ejemplares.registrar_cambio(self.session, tuple(antes), (
+                    cambios.get("id_catalogo", antes.id_catalogo), cambios.get("estado", antes.estado)
+                ))
+            self.session.commit()
+            return resultado.rowcount > 0
+        except IntegrityError:
+            self.session.rollback()
+            raise ValueError(f"Ya existe un ejemplar con el código de inventario: {cambios.get('codigo_inventario')}")
         except Exception as e:
             self.session.rollback()
             raise e
@@ -112,6 +204,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
             ejemplar_db = self.session.get(EjemplarDB, id_ejemplar)
             if ejemplar_db:
                 self.session.delete(ejemplar_db)
+                contadores_ejemplares.registrar_cambio(self.session, (ejemplar_db.id_catalogo, ejemplar_db.estado), None)
                 self.session.commit()
                 return True
             return False
@@ -128,6 +221,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
             raise e
 
     # Implementación de métodos con JOINs para datos detallados
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         try:
             statement = select(
@@ -158,6 +252,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_ejemplar: int) -> Optional[dict]:
         try:
             statement = select(
@@ -186,6 +281,7 @@ class EjemplarRepositoryImpl(EjemplarRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_disponibles_for_prestamo(self) -> List[dict]:
         try:
             statement = select(
@@ -2,14 +2,17 @@
 from fastapi import APIRouter, Depends
 from typing import Annotated, List
 from src.app.features.ejemplares.application.services.ejemplar_service import EjemplarService
-from src.app.features.ejemplares.application.dtos import CreateEjemplarDTO, UpdateEjemplarDTO
+from src.app.features.ejemplares.application.dtos import CreateEjemplarDTO, UpdateEjemplarDTO, PatchEjemplarDTO
 from src.app.features.ejemplares.infrastructure.dependencies import ejemplar_service_dep
 from src.app.features.ejemplares.presentation.schemas.ejemplar_schemas import (
     EjemplarCreateRequest,
     EjemplarUpdateRequest,
+    EjemplarPatchRequest,
     EjemplarResponse,
     EjemplaresListResponse,
     EjemplarSingleResponse,
+    EjemplarPatchResponse,
+    EjemplarPatchSingleResponse,
     EjemplarDeleteResponse,
     EjemplarDetailResponse,
     EjemplarDetailSingleResponse,
@@ -20,6 +23,7 @@ from src.app.features.ejemplares.presentation.schemas.ejemplar_schemas import (
     LaboratorioBasicResponse
 )
 from src.app.shared.schemas.generic_response import GenericResponse
+from src.app.shared.concurrency.optimistic_lock import ConcurrencyConflictError
 
 router = APIRouter(prefix="/ejemplares", tags=["ejemplares"])
 
@@ -168,6 +172,45 @@ def update_ejemplar(id_ejemplar: int, ejemplar_request: EjemplarUpdateRequest, s
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al actualizar ejemplar",
+            errors=[str(e)],
+            status=500
+        )
+
+@router.patch("/{id_ejemplar}", response_model=EjemplarPatchSingleResponse)
+def patch_ejemplar(id_ejemplar: int, ejemplar_request: EjemplarPatchRequest, service: ejemplar_service_dep):
+    try:
+        patch_dto = PatchEjemplarDTO(**ejemplar_request.model_dump(exclude_none=True))
+        
+        campos_actualizados = service.patch(id_ejemplar, patch_dto)
+        
+        if campos_actualizados is None:
+            return GenericResponse.create_error(
+                message="Ejemplar no encontrado",
+                errors=[f"Ejemplar con ID {id_ejemplar} no existe"],
+                status=404
+            )
+        
+        return GenericResponse.create_success(
+            message="Ejemplar actualizado exitosamente",
+            data=EjemplarPatchResponse(id_ejemplar=id_ejemplar, campos_actualizados=campos_actualizados),
+            status=200
+        )
+        
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -575,6 +618,12 @@ def prestar_ejemplar(id_ejemplar: int, service: ejemplar_service_dep):
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -616,6 +665,12 @@ def devolver_ejemplar(id_ejemplar: int, service: ejemplar_service_dep):
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -20,6 +20,11 @@ class EjemplarUpdateRequest(BaseModel):
     id_biblioteca: Optional[int] = Field(None, description="ID de la biblioteca si la ubicación es biblioteca")
     estado: Optional[str] = Field(None, description="Estado del ejemplar")
 
+class EjemplarPatchRequest(BaseModel):
+    id_catalogo: Optional[int] = Field(None, description="ID del catálogo al que pertenece el ejemplar")
+    codigo_inventario: Optional[str] = Field(None, max_length=50, description="Código único de inventario del ejemplar")
+    estado: Optional[str] = Field(None, description="Estado del ejemplar")
+
 # Response Schema básico
 class EjemplarResponse(BaseModel):
     id_ejemplar: int
@@ -33,6 +38,10 @@ class EjemplarResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class EjemplarPatchResponse(BaseModel):
+    id_ejemplar: int
+    campos_actualizados: List[str]
+
 # Schemas para datos detallados
 class CatalogoBasicResponse(BaseModel):
     id_catalogo: int
@@ -68,6 +77,7 @@ class EjemplarDetailResponse(BaseModel):
 # Generic Responses
 EjemplaresListResponse = GenericResponse[List[EjemplarResponse]]
 EjemplarSingleResponse = GenericResponse[EjemplarResponse]
+EjemplarPatchSingleResponse = GenericResponse[EjemplarPatchResponse]
 EjemplarDeleteResponse = GenericResponse[None]
 
 # Generic Responses para datos detallados
@@ -0,0 +1,53 @@
+# src/app/features/estadisticas/application/services/estadistica_service.py
+from typing import List, Optional, Tuple
+from datetime import date, timedelta
+from src.app.features.estadisticas.domain.entities.estadistica_prestamos import (
+    EstadisticaDiaria,
+    ResumenPrestamos,
+    ActividadBiblioteca,
+    TituloPrestado
+)
+from src.app.features.estadisticas.domain.repositories.estadistica_repository import EstadisticaRepository
+
+# Rango por defecto de las consultas: los últimos 30 días
+DIAS_POR_DEFECTO = 30
+
+class EstadisticaService:
+    def __init__(self, estadistica_repository: EstadisticaRepository):
+        self.estadistica_repository = estadistica_repository
+
+    def get_diarias(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                    id_biblioteca: Optional[int] = None, tipo: Optional[str] = None) -> List[EstadisticaDiaria]:
+        desde, hasta = self._rango(desde, hasta)
+        return self.estadistica_repository.get_diarias(desde, hasta, id_biblioteca, tipo)
+
+    def get_resumen(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                    id_biblioteca: Optional[int] = None, tipo: Optional[str] = None) -> ResumenPrestamos:
+        desde, hasta = self._rango(desde, hasta)
+        return self.estadistica_repository.get_resumen(desde, hasta, id_biblioteca, tipo)
+
+    def get_por_biblioteca(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                           tipo: Optional[str] = None) -> List[ActividadBiblioteca]:
+        desde, hasta = self._rango(desde, hasta)
+        return self.estadistica_repository.get_por_biblioteca(desde, hasta, tipo)
+
+    def get_titulos_mas_prestados(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                                  limite: int = 10, tipo: Optional[str] = None) -> List[TituloPrestado]:
+        if limite < 1:
+            raise ValueError("El límite debe ser mayor que cero")
+        desde, hasta = self._rango(desde, hasta)
+        return self.estadistica_repository.get_titulos_mas_prestados(desde, hasta, limite, tipo)
+
+    def reconstruir(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> dict:
+        """Recalcula las estadísticas de los meses del rango desde Prestamos (job de backfill)"""
+        if desde and hasta and desde > hasta:
+            raise ValueError("La fecha 'desde' no puede ser posterior a 'hasta'")
+        return self.estadistica_repository.reconstruir(desde, hasta)
+
+    @staticmethod
+    def _rango(desde: Optional[date], hasta: Optional[date]) -> Tuple[date, date]:
+        hasta = hasta or date.today()
+        desde = desde or hasta - timedelta(days=DIAS_POR_DEFECTO)
+        if desde > hasta:
+            raise ValueError("La fecha 'desde' no puede ser posterior a 'hasta'")
+        return desde, hasta
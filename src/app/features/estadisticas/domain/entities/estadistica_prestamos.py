@@ -0,0 +1,36 @@
+# src/app/features/estadisticas/domain/entities/estadistica_prestamos.py
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date
+
+class ContadoresPrestamos(BaseModel):
+    prestamos: int = 0
+    devoluciones: int = 0
+    devoluciones_con_retraso: int = 0
+    dias_retraso: int = 0
+
+    def tasa_retraso(self) -> float:
+        # Proporción de devoluciones posteriores a la fecha esperada
+        return self.devoluciones_con_retraso / self.devoluciones if self.devoluciones else 0.0
+
+    def promedio_dias_retraso(self) -> float:
+        # Días de retraso promedio de las devoluciones con retraso
+        return self.dias_retraso / self.devoluciones_con_retraso if self.devoluciones_con_retraso else 0.0
+
+class EstadisticaDiaria(ContadoresPrestamos):
+    fecha: date
+
+class ResumenPrestamos(ContadoresPrestamos):
+    desde: date
+    hasta: date
+
+class ActividadBiblioteca(ContadoresPrestamos):
+    # 0 agrupa los ejemplares de laboratorio
+    id_biblioteca: int
+    nombre: Optional[str] = None
+
+class TituloPrestado(BaseModel):
+    id_catalogo: int
+    nombre: Optional[str] = None
+    tipo: Optional[str] = None
+    prestamos: int
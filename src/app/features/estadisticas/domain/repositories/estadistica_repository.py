@@ -0,0 +1,35 @@
+# src/app/features/estadisticas/domain/repositories/estadistica_repository.py
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from datetime import date
+from src.app.features.estadisticas.domain.entities.estadistica_prestamos import (
+    EstadisticaDiaria,
+    ResumenPrestamos,
+    ActividadBiblioteca,
+    TituloPrestado
+)
+
+class EstadisticaRepository(ABC):
+
+    @abstractmethod
+    def get_diarias(self, desde: date, hasta: date, id_biblioteca: Optional[int] = None,
+                    tipo: Optional[str] = None) -> List[EstadisticaDiaria]:
+        pass
+
+    @abstractmethod
+    def get_resumen(self, desde: date, hasta: date, id_biblioteca: Optional[int] = None,
+                    tipo: Optional[str] = None) -> ResumenPrestamos:
+        pass
+
+    @abstractmethod
+    def get_por_biblioteca(self, desde: date, hasta: date, tipo: Optional[str] = None) -> List[ActividadBiblioteca]:
+        pass
+
+    @abstractmethod
+    def get_titulos_mas_prestados(self, desde: date, hasta: date, limite: int = 10,
+                                  tipo: Optional[str] = None) -> List[TituloPrestado]:
+        pass
+
+    @abstractmethod
+    def reconstruir(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> dict:
+        pass
@@ -0,0 +1,16 @@
+# src/app/features/estadisticas/infrastructure/dependencies.py
+from typing import Annotated
+from fastapi import Depends
+from src.app.core.database.database import session_dep
+from src.app.features.estadisticas.infrastructure.repositories.estadistica_repository_impl import EstadisticaRepositoryImpl
+from src.app.features.estadisticas.application.services.estadistica_service import EstadisticaService
+
+def get_estadistica_repository(session: session_dep) -> EstadisticaRepositoryImpl:
+    return EstadisticaRepositoryImpl(session=session)
+
+def get_estadistica_service(
+    estadistica_repository: Annotated[EstadisticaRepositoryImpl, Depends(get_estadistica_repository)]
+) -> EstadisticaService:
+    return EstadisticaService(estadistica_repository=estadistica_repository)
+
+estadistica_service_dep = Annotated[EstadisticaService, Depends(get_estadistica_service)]
\ No newline at end of file
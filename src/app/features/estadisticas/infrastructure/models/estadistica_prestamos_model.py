@@ -0,0 +1,65 @@
+# src/app/features/estadisticas/infrastructure/models/estadistica_prestamos_model.py
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import date
+
+class EstadisticaPrestamosDiariaDB(SQLModel, table=True):
+    __tablename__ = "EstadisticasPrestamosDiarias"
+    __table_args__ = (
+        UniqueConstraint("fecha", "id_biblioteca", "tipo", name="uq_estadisticas_prestamos_diarias"),
+    )
+
+    id_estadistica: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="Identificador único de la fila de estadística"
+    )
+    fecha: date = Field(
+        description="Día al que corresponden los contadores"
+    )
+    id_biblioteca: int = Field(
+        description="Biblioteca del ejemplar; 0 para los ejemplares de laboratorio"
+    )
+    tipo: str = Field(
+        max_length=50,
+        description="Tipo de item del catálogo: herramienta, libro, equipo"
+    )
+    prestamos: int = Field(
+        default=0,
+        description="Préstamos realizados ese día"
+    )
+    devoluciones: int = Field(
+        default=0,
+        description="Devoluciones registradas ese día"
+    )
+    devoluciones_con_retraso: int = Field(
+        default=0,
+        description="Devoluciones de ese día posteriores a la fecha esperada"
+    )
+    dias_retraso: int = Field(
+        default=0,
+        description="Suma de los días de retraso de las devoluciones de ese día"
+    )
+
+class EstadisticaPrestamosTituloDB(SQLModel, table=True):
+    __tablename__ = "EstadisticasPrestamosTitulos"
+    __table_args__ = (
+        UniqueConstraint("periodo", "id_catalogo", name="uq_estadisticas_prestamos_titulos"),
+    )
+
+    id_estadistica: Optional[int] = Field(
+        default=None,
+        primary_key=True,
+        description="Identificador único de la fila de estadística"
+    )
+    periodo: date = Field(
+        description="Primer día del mes al que corresponde el contador"
+    )
+    id_catalogo: int = Field(
+        description="ID del item del catálogo"
+    )
+    prestamos: int = Field(
+        default=0,
+        description="Préstamos del item realizados ese mes"
+    )
@@ -0,0 +1,135 @@
+# src/app/features/estadisticas/infrastructure/repositories/estadistica_repository_impl.py
+from typing import List, Optional
+from datetime import date
+from sqlalchemy import func
+from sqlmodel import select, Session
+from src.app.features.estadisticas.domain.repositories.estadistica_repository import EstadisticaRepository
+from src.app.features.estadisticas.domain.entities.estadistica_prestamos import (
+    EstadisticaDiaria,
+    ResumenPrestamos,
+    ActividadBiblioteca,
+    TituloPrestado
+)
+from src.app.features.estadisticas.infrastructure.models.estadistica_prestamos_model import (
+    EstadisticaPrestamosDiariaDB,
+    EstadisticaPrestamosTituloDB
+)
+from src.app.features.estadisticas.infrastructure import rollups_prestamos
+from src.app.features.bibliotecas.infrastructure.models.biblioteca_model import BibliotecaDB
+from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.core.database.replicas import lectura_replica
+
+# Nombre con el que se informan los ejemplares sin biblioteca
+NOMBRE_SIN_BIBLIOTECA = "Laboratorios"
+
+class EstadisticaRepositoryImpl(EstadisticaRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    # Sumas de los contadores diarios; las consultas leen solo las filas del rango, nunca Prestamos
+    @staticmethod
+    def _sumas():
+        return (
+            func.coalesce(func.sum(EstadisticaPrestamosDiariaDB.prestamos), 0).label("prestamos"),
+            func.coalesce(func.sum(EstadisticaPrestamosDiariaDB.devoluciones), 0).label("devoluciones"),
+            func.coalesce(func.sum(EstadisticaPrestamosDiariaDB.devoluciones_con_retraso), 0).label("devoluciones_con_retraso"),
+            func.coalesce(func.sum(EstadisticaPrestamosDiariaDB.dias_retraso), 0).label("dias_retraso"),
+        )
+
+    @staticmethod
+    def _filtrar(statement, desde: date, hasta: date, id_biblioteca: Optional[int] = None,
+                 tipo: Optional[str] = None):
+        statement = statement.where(
+            EstadisticaPrestamosDiariaDB.fecha >= desde,
+            EstadisticaPrestamosDiariaDB.fecha <= hasta
+        )
+        if id_biblioteca is not None:
+            statement = statement.where(EstadisticaPrestamosDiariaDB.id_biblioteca == id_biblioteca)
+        if tipo is not None:
+            statement = statement.where(EstadisticaPrestamosDiariaDB.tipo == tipo)
+        return statement
+
+    @staticmethod
+    def _contadores(fila) -> dict:
+        return {
+            "prestamos": int(fila.prestamos),
+            "devoluciones": int(fila.devoluciones),
+            "devoluciones_con_retraso": int(fila.devoluciones_con_retraso),
+            "dias_retraso": int(fila.dias_retraso),
+        }
+
+    @lectura_replica
+    def get_diarias(self, desde: date, hasta: date, id_biblioteca: Optional[int] = None,
+                    tipo: Optional[str] = None) -> List[EstadisticaDiaria]:
+        try:
+            statement = self._filtrar(
+                select(EstadisticaPrestamosDiariaDB.fecha, *self._sumas()),
+                desde, hasta, id_biblioteca, tipo
+            ).group_by(EstadisticaPrestamosDiariaDB.fecha).order_by(EstadisticaPrestamosDiariaDB.fecha)
+            return [
+                EstadisticaDiaria(fecha=fila.fecha, **self._contadores(fila))
+                for fila in self.session.exec(statement).all()
+            ]
+        except Exception as e:
+            raise e
+
+    @lectura_replica
+    def get_resumen(self, desde: date, hasta: date, id_biblioteca: Optional[int] = None,
+                    tipo: Optional[str] = None) -> ResumenPrestamos:
+        try:
+            statement = self._filtrar(select(*self._sumas()), desde, hasta, id_biblioteca, tipo)
+            fila = self.session.exec(statement).one()
+            return ResumenPrestamos(desde=desde, hasta=hasta, **self._contadores(fila))
+        except Exception as e:
+            raise e
+
+    @lectura_replica
+    def get_por_biblioteca(self, desde: date, hasta: date, tipo: Optional[str] = None) -> List[ActividadBiblioteca]:
+        try:
+            statement = self._filtrar(
+                select(EstadisticaPrestamosDiariaDB.id_biblioteca, BibliotecaDB.nombre, *self._sumas()).outerjoin(
+                    BibliotecaDB, EstadisticaPrestamosDiariaDB.id_biblioteca == BibliotecaDB.id_biblioteca
+                ),
+                desde, hasta, tipo=tipo
+            ).group_by(
+                EstadisticaPrestamosDiariaDB.id_biblioteca, BibliotecaDB.nombre
+            ).order_by(EstadisticaPrestamosDiariaDB.id_biblioteca)
+            return [
+                ActividadBiblioteca(
+                    id_biblioteca=fila.id_biblioteca,
+                    nombre=NOMBRE_SIN_BIBLIOTECA if fila.id_biblioteca == rollups_prestamos.SIN_BIBLIOTECA else fila.nombre,
+                    **self._contadores(fila)
+                )
+                for fila in self.session.exec(statement).all()
+            ]
+        except Exception as e:
+            raise e
+
+    @lectura_replica
+    def get_titulos_mas_prestados(self, desde: date, hasta: date, limite: int = 10,
+                                  tipo: Optional[str] = None) -> List[TituloPrestado]:
+        try:
+            # Los títulos se acumulan por mes: el rango se extiende a los meses completos que toca
+            total = func.sum(EstadisticaPrestamosTituloDB.prestamos).label("prestamos")
+            statement = select(
+                EstadisticaPrestamosTituloDB.id_catalogo, CatalogoDB.nombre, CatalogoDB.tipo, total
+            ).join(
+                CatalogoDB, EstadisticaPrestamosTituloDB.id_catalogo == CatalogoDB.id_catalogo
+            ).where(
+                EstadisticaPrestamosTituloDB.periodo >= rollups_prestamos.inicio_de_mes(desde),
+                EstadisticaPrestamosTituloDB.periodo <= rollups_prestamos.inicio_de_mes(hasta)
+            )
+            if tipo is not None:
+                statement = statement.where(CatalogoDB.tipo == tipo)
+            statement = statement.group_by(
+                EstadisticaPrestamosTituloDB.id_catalogo, CatalogoDB.nombre, CatalogoDB.tipo
+            ).having(total > 0).order_by(total.desc(), EstadisticaPrestamosTituloDB.id_catalogo).limit(limite)
+            return [
+                TituloPrestado(id_catalogo=fila.id_catalogo, nombre=fila.nombre, tipo=fila.tipo, prestamos=int(fila.prestamos))
+                for fila in self.session.exec(statement).all()
+            ]
+        except Exception as e:
+            raise e
+
+    def reconstruir(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> dict:
+        return rollups_prestamos.reconstruir(self.session, desde, hasta)
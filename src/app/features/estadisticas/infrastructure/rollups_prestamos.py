@@ -0,0 +1,243 @@
+# src/app/features/estadisticas/infrastructure/rollups_prestamos.py
+"""Tablas de estadísticas de préstamos precalculadas (rollups).
+
+- EstadisticasPrestamosDiarias: por día × biblioteca × tipo de catálogo, préstamos, devoluciones,
+  devoluciones con retraso y días de retraso acumulados.
+- EstadisticasPrestamosTitulos: préstamos por mes × item del catálogo, para los títulos más prestados.
+
+El repositorio de préstamos las ajusta en la misma transacción que la escritura del préstamo, con
+incrementos relativos (upsert `columna = columna + n`) para no pisar ajustes concurrentes. Cada
+préstamo aporta al día en que se prestó y, una vez devuelto, al día en que se devolvió. La
+biblioteca, el item y el tipo son el origen guardado en el préstamo (los del ejemplar al prestarse):
+si el ejemplar cambia de biblioteca, la devolución resta y suma en la misma fila que el préstamo.
+
+`reconstruir` recalcula un rango de meses desde Prestamos: para llenarlas la primera vez o
+corregir la deriva que deja el SQL manual. Los préstamos sin origen no cuentan; `anotar_origenes`
+se los pone con la ubicación actual del ejemplar.
+"""
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, select, update
+
+from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
+from src.app.features.estadisticas.infrastructure.models.estadistica_prestamos_model import (
+    EstadisticaPrestamosDiariaDB,
+    EstadisticaPrestamosTituloDB,
+)
+from src.app.features.prestamos.infrastructure.models.prestamo_model import PrestamoDB
+
+DIARIAS = "diarias"
+TITULOS = "titulos"
+
+# Los ejemplares de laboratorio no tienen biblioteca: se agrupan bajo este id
+SIN_BIBLIOTECA = 0
+
+_CLAVES = {
+    DIARIAS: ("fecha", "id_biblioteca", "tipo"),
+    TITULOS: ("periodo", "id_catalogo"),
+}
+_COLUMNAS = {
+    DIARIAS: ("prestamos", "devoluciones", "devoluciones_con_retraso", "dias_retraso"),
+    TITULOS: ("prestamos",),
+}
+_MODELOS = {
+    DIARIAS: EstadisticaPrestamosDiariaDB,
+    TITULOS: EstadisticaPrestamosTituloDB,
+}
+
+# (id_biblioteca_origen, id_catalogo_origen, tipo_origen, fecha_prestamo, fecha_devolucion_esperada,
+# fecha_devolucion_real) de un préstamo; las columnas de Prestamos en ese orden
+Aporte = Tuple[Optional[int], Optional[int], Optional[str], datetime, date, Optional[datetime]]
+COLUMNAS_APORTE = (
+    PrestamoDB.id_biblioteca_origen,
+    PrestamoDB.id_catalogo_origen,
+    PrestamoDB.tipo_origen,
+    PrestamoDB.fecha_prestamo,
+    PrestamoDB.fecha_devolucion_esperada,
+    PrestamoDB.fecha_devolucion_real,
+)
+
+
+def _dia(valor) -> date:
+    return valor.date() if isinstance(valor, datetime) else valor
+
+
+def inicio_de_mes(dia: date) -> date:
+    return dia.replace(day=1)
+
+
+def siguiente_mes(dia: date) -> date:
+    return date(dia.year + dia.month // 12, dia.month % 12 + 1, 1)
+
+
+def dias_retraso(fecha_devolucion_esperada: date, fecha_devolucion_real) -> int:
+    return max((_dia(fecha_devolucion_real) - fecha_devolucion_esperada).days, 0)
+
+
+def aportes(fecha_prestamo, fecha_devolucion_esperada: date,
+            fecha_devolucion_real) -> Iterator[Tuple[str, date, str, int]]:
+    """(tabla, fecha o periodo, columna, cantidad) que un préstamo suma a los rollups"""
+    dia = _dia(fecha_prestamo)
+    yield DIARIAS, dia, "prestamos", 1
+    yield TITULOS, inicio_de_mes(dia), "prestamos", 1
+    if fecha_devolucion_real is not None:
+        dia_devolucion = _dia(fecha_devolucion_real)
+        retraso = dias_retraso(fecha_devolucion_esperada, dia_devolucion)
+        yield DIARIAS, dia_devolucion, "devoluciones", 1
+        if retraso:
+            yield DIARIAS, dia_devolucion, "devoluciones_con_retraso", 1
+            yield DIARIAS, dia_devolucion, "dias_retraso", retraso
+
+
+def _clave(tabla: str, fecha: date, id_biblioteca: Optional[int], id_catalogo: int, tipo: str) -> tuple:
+    if tabla == DIARIAS:
+        return fecha, id_biblioteca or SIN_BIBLIOTECA, tipo
+    return fecha, id_catalogo
+
+
+def registrar_cambio(session: Session, antes: Optional[Aporte], despues: Optional[Aporte]):
+    """Ajusta los rollups por el paso de un préstamo de `antes` a `despues` (None: no existía / ya no existe).
+    No lee nada: el origen viaja en el aporte. No hace commit: se confirma junto con la escritura del préstamo."""
+    filas: Dict[str, Dict[tuple, Counter]] = {DIARIAS: {}, TITULOS: {}}
+    for prestamo, signo in ((antes, -1), (despues, 1)):
+        # Sin origen el préstamo no cuenta (filas anteriores a la migración aún sin anotar)
+        if prestamo is None or prestamo[1] is None:
+            continue
+        id_biblioteca, id_catalogo, tipo, *fechas = prestamo
+        for tabla, fecha, columna, cantidad in aportes(*fechas):
+            clave = _clave(tabla, fecha, id_biblioteca, id_catalogo, tipo)
+            filas[tabla].setdefault(clave, Counter())[columna] += signo * cantidad
+
+    # Una renovación o un cambio de estado se anulan: _acumular no emite ninguna sentencia
+    for tabla, por_clave in filas.items():
+        _acumular(session, tabla, por_clave)
+
+
+def _acumular(session: Session, tabla: str, por_clave: Dict[tuple, Counter]):
+    """Suma los contadores a sus filas, creándolas si no existen, con un único upsert por tabla"""
+    por_clave = {clave: delta for clave, delta in por_clave.items() if any(delta.values())}
+    if not por_clave:
+        return
+    modelo, claves = _MODELOS[tabla], _CLAVES[tabla]
+    columnas = sorted({columna for delta in por_clave.values() for columna in delta})
+    valores = [
+        {**dict(zip(claves, clave)), **{columna: delta.get(columna, 0) for columna in columnas}}
+        for clave, delta in por_clave.items()
+    ]
+    tabla_sql = modelo.__table__
+    dialecto = session.get_bind().dialect.name
+
+    if dialecto in ("mysql", "mariadb"):
+        statement = mysql_insert(tabla_sql).values(valores)
+        statement = statement.on_duplicate_key_update(
+            {columna: tabla_sql.c[columna] + statement.inserted[columna] for columna in columnas}
+        )
+    elif dialecto in ("sqlite", "postgresql"):
+        insertar = sqlite_insert if dialecto == "sqlite" else postgresql_insert
+        statement = insertar(tabla_sql).values(valores)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(claves),
+            set_={columna: tabla_sql.c[columna] + statement.excluded[columna] for columna in columnas}
+        )
+    else:
+        # Sin upsert nativo: UPDATE y, si la fila no existía, INSERT
+        for fila in valores:
+            condicion = [getattr(modelo, clave) == fila[clave] for clave in claves]
+            resultado = session.exec(update(modelo).where(*condicion).values(
+                **{columna: getattr(modelo, columna) + fila[columna] for columna in columnas}
+            ))
+            if resultado.rowcount == 0:
+                session.exec(insert(tabla_sql).values(fila))
+        return
+    session.exec(statement)
+
+
+def anotar_origenes(session: Session) -> int:
+    """Pone a los préstamos sin origen la biblioteca, el item y el tipo actuales de su ejemplar; devuelve
+    cuántos anotó. Para las filas anteriores a la migración o cargadas sin pasar por el repositorio."""
+    del_ejemplar = EjemplarDB.id_ejemplar == PrestamoDB.id_ejemplar
+    tipo = select(CatalogoDB.tipo).join(EjemplarDB, EjemplarDB.id_catalogo == CatalogoDB.id_catalogo)
+    try:
+        resultado = session.exec(update(PrestamoDB).where(PrestamoDB.id_catalogo_origen.is_(None)).values(
+            id_biblioteca_origen=select(EjemplarDB.id_biblioteca).where(del_ejemplar).scalar_subquery(),
+            id_catalogo_origen=select(EjemplarDB.id_catalogo).where(del_ejemplar).scalar_subquery(),
+            tipo_origen=tipo.where(del_ejemplar).scalar_subquery(),
+        ))
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return resultado.rowcount
+
+
+def reconstruir(session: Session, desde: Optional[date] = None, hasta: Optional[date] = None) -> dict:
+    """Recalcula los rollups de los meses de `desde` a `hasta` (ambos incluidos) desde Prestamos.
+
+    Sin `desde` parte del primer préstamo; sin `hasta` llega al mes en curso. Lee los préstamos
+    prestados o devueltos en el rango por lotes, agrega en memoria y reemplaza las filas del rango
+    en una transacción. Los préstamos que se registren mientras tanto pueden perderse o contarse
+    dos veces: con el rango del mes en curso conviene ejecutarlo fuera del horario de préstamos.
+    """
+    if desde is None:
+        primero = session.exec(select(func.min(PrestamoDB.fecha_prestamo))).first()
+        desde = _dia(primero) if primero else date.today()
+    inicio = inicio_de_mes(desde)
+    fin = siguiente_mes(hasta or date.today())
+    if fin <= inicio:
+        raise ValueError("La fecha 'hasta' no puede ser anterior a 'desde'")
+    # Las columnas de Prestamos son DATETIME: se comparan contra el inicio de cada día
+    limite_inicio, limite_fin = datetime.combine(inicio, datetime.min.time()), datetime.combine(fin, datetime.min.time())
+
+    # Solo Prestamos: el origen está en la fila, sin JOIN con Ejemplares ni Catalogo
+    statement = select(*COLUMNAS_APORTE).where(
+        PrestamoDB.id_catalogo_origen.is_not(None),
+        or_(
+            (PrestamoDB.fecha_prestamo >= limite_inicio) & (PrestamoDB.fecha_prestamo < limite_fin),
+            (PrestamoDB.fecha_devolucion_real >= limite_inicio) & (PrestamoDB.fecha_devolucion_real < limite_fin),
+        )
+    ).execution_options(yield_per=5000)
+
+    filas: Dict[str, Dict[tuple, Counter]] = {DIARIAS: {}, TITULOS: {}}
+    prestamos_leidos = 0
+    try:
+        for id_biblioteca, id_catalogo, tipo, *fechas in session.exec(statement):
+            prestamos_leidos += 1
+            for tabla, fecha, columna, cantidad in aportes(*fechas):
+                # Un préstamo prestado antes del rango y devuelto dentro solo aporta su devolución
+                if not inicio <= fecha < fin:
+                    continue
+                clave = _clave(tabla, fecha, id_biblioteca, id_catalogo, tipo)
+                filas[tabla].setdefault(clave, Counter())[columna] += cantidad
+
+        session.exec(delete(EstadisticaPrestamosDiariaDB).where(
+            EstadisticaPrestamosDiariaDB.fecha >= inicio, EstadisticaPrestamosDiariaDB.fecha < fin
+        ))
+        session.exec(delete(EstadisticaPrestamosTituloDB).where(
+            EstadisticaPrestamosTituloDB.periodo >= inicio, EstadisticaPrestamosTituloDB.periodo < fin
+        ))
+        for tabla, por_clave in filas.items():
+            claves, columnas = _CLAVES[tabla], _COLUMNAS[tabla]
+            if por_clave:
+                session.exec(insert(_MODELOS[tabla].__table__), params=[
+                    {**dict(zip(claves, clave)), **{columna: delta[columna] for columna in columnas}}
+                    for clave, delta in por_clave.items()
+                ])
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    return {
+        "desde": inicio,
+        "hasta": date.fromordinal(fin.toordinal() - 1),
+        "prestamos_leidos": prestamos_leidos,
+        "filas_diarias": len(filas[DIARIAS]),
+        "filas_titulos": len(filas[TITULOS]),
+    }
@@ -0,0 +1,208 @@
+# src/app/features/estadisticas/presentation/routers/estadistica_router.py
+from fastapi import APIRouter
+from typing import Optional
+from datetime import date
+from src.app.core.admin.dependencies import admin_dep
+from src.app.features.estadisticas.domain.entities.estadistica_prestamos import ContadoresPrestamos
+from src.app.features.estadisticas.infrastructure.dependencies import estadistica_service_dep
+from src.app.features.estadisticas.presentation.schemas.estadistica_schemas import (
+    EstadisticaDiariaResponse,
+    ResumenPrestamosResponse,
+    ActividadBibliotecaResponse,
+    TituloPrestadoResponse,
+    ReconstruccionEstadisticasResponse,
+    EstadisticasDiariasListResponse,
+    ResumenPrestamosSingleResponse,
+    ActividadBibliotecasListResponse,
+    TitulosPrestadosListResponse,
+    ReconstruccionEstadisticasSingleResponse
+)
+from src.app.shared.schemas.generic_response import GenericResponse
+
+router = APIRouter(prefix="/estadisticas", tags=["estadisticas"])
+
+def _contadores(estadistica: ContadoresPrestamos) -> dict:
+    return {
+        "prestamos": estadistica.prestamos,
+        "devoluciones": estadistica.devoluciones,
+        "devoluciones_con_retraso": estadistica.devoluciones_con_retraso,
+        "dias_retraso": estadistica.dias_retraso,
+        "tasa_retraso": round(estadistica.tasa_retraso(), 4),
+        "promedio_dias_retraso": round(estadistica.promedio_dias_retraso(), 2)
+    }
+
+@router.get("/prestamos/diarias", response_model=EstadisticasDiariasListResponse)
+def get_estadisticas_diarias(
+    service: estadistica_service_dep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    id_biblioteca: Optional[int] = None,
+    tipo: Optional[str] = None
+):
+    try:
+        diarias = service.get_diarias(desde, hasta, id_biblioteca, tipo)
+
+        diarias_response = [
+            EstadisticaDiariaResponse(fecha=diaria.fecha, **_contadores(diaria))
+            for diaria in diarias
+        ]
+
+        return GenericResponse.create_success(
+            message="Estadísticas diarias de préstamos obtenidas exitosamente",
+            data=diarias_response,
+            status=200
+        )
+
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al obtener estadísticas diarias de préstamos",
+            errors=[str(e)],
+            status=500
+        )
+
+@router.get("/prestamos/resumen", response_model=ResumenPrestamosSingleResponse)
+def get_resumen_prestamos(
+    service: estadistica_service_dep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    id_biblioteca: Optional[int] = None,
+    tipo: Optional[str] = None
+):
+    try:
+        resumen = service.get_resumen(desde, hasta, id_biblioteca, tipo)
+
+        resumen_response = ResumenPrestamosResponse(
+            desde=resumen.desde,
+            hasta=resumen.hasta,
+            **_contadores(resumen)
+        )
+
+        return GenericResponse.create_success(
+            message="Resumen de préstamos obtenido exitosamente",
+            data=resumen_response,
+            status=200
+        )
+
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al obtener resumen de préstamos",
+            errors=[str(e)],
+            status=500
+        )
+
+@router.get("/prestamos/bibliotecas", response_model=ActividadBibliotecasListResponse)
+def get_actividad_bibliotecas(
+    service: estadistica_service_dep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    tipo: Optional[str] = None
+):
+    try:
+        actividades = service.get_por_biblioteca(desde, hasta, tipo)
+
+        actividades_response = [
+            ActividadBibliotecaResponse(
+                id_biblioteca=actividad.id_biblioteca,
+                nombre=actividad.nombre,
+                **_contadores(actividad)
+            ) for actividad in actividades
+        ]
+
+        return GenericResponse.create_success(
+            message="Actividad de préstamos por biblioteca obtenida exitosamente",
+            data=actividades_response,
+            status=200
+        )
+
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al obtener actividad de préstamos por biblioteca",
+            errors=[str(e)],
+            status=500
+        )
+
+@router.get("/prestamos/titulos", response_model=TitulosPrestadosListResponse)
+def get_titulos_mas_prestados(
+    service: estadistica_service_dep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    limite: int = 10,
+    tipo: Optional[str] = None
+):
+    try:
+        titulos = service.get_titulos_mas_prestados(desde, hasta, limite, tipo)
+
+        titulos_response = [
+            TituloPrestadoResponse(
+                id_catalogo=titulo.id_catalogo,
+                nombre=titulo.nombre,
+                tipo=titulo.tipo,
+                prestamos=titulo.prestamos
+            ) for titulo in titulos
+        ]
+
+        return GenericResponse.create_success(
+            message="Títulos más prestados obtenidos exitosamente",
+            data=titulos_response,
+            status=200
+        )
+
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al obtener títulos más prestados",
+            errors=[str(e)],
+            status=500
+        )
+
+# Reemplaza filas de las tablas de estadísticas: solo con la cabecera X-Admin-Token
+@router.post("/prestamos/backfill", response_model=ReconstruccionEstadisticasSingleResponse, dependencies=[admin_dep])
+def reconstruir_estadisticas_prestamos(
+    service: estadistica_service_dep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None
+):
+    try:
+        reconstruccion = service.reconstruir(desde, hasta)
+
+        return GenericResponse.create_success(
+            message="Estadísticas de préstamos reconstruidas exitosamente",
+            data=ReconstruccionEstadisticasResponse(**reconstruccion),
+            status=200
+        )
+
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al reconstruir estadísticas de préstamos",
+            errors=[str(e)],
+            status=500
+        )
@@ -0,0 +1,45 @@
+# src/app/features/estadisticas/presentation/schemas/estadistica_schemas.py
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+from src.app.shared.schemas.generic_response import GenericResponse
+
+# Response Schemas
+class ContadoresPrestamosResponse(BaseModel):
+    prestamos: int
+    devoluciones: int
+    devoluciones_con_retraso: int
+    dias_retraso: int
+    tasa_retraso: float
+    promedio_dias_retraso: float
+
+class EstadisticaDiariaResponse(ContadoresPrestamosResponse):
+    fecha: date
+
+class ResumenPrestamosResponse(ContadoresPrestamosResponse):
+    desde: date
+    hasta: date
+
+class ActividadBibliotecaResponse(ContadoresPrestamosResponse):
+    id_biblioteca: int
+    nombre: Optional[str] = None
+
+class TituloPrestadoResponse(BaseModel):
+    id_catalogo: int
+    nombre: Optional[str] = None
+    tipo: Optional[str] = None
+    prestamos: int
+
+class ReconstruccionEstadisticasResponse(BaseModel):
+    desde: date
+    hasta: date
+    prestamos_leidos: int
+    filas_diarias: int
+    filas_titulos: int
+
+# Generic Responses
+EstadisticasDiariasListResponse = GenericResponse[List[EstadisticaDiariaResponse]]
+ResumenPrestamosSingleResponse = GenericResponse[ResumenPrestamosResponse]
+ActividadBibliotecasListResponse = GenericResponse[List[ActividadBibliotecaResponse]]
+TitulosPrestadosListResponse = GenericResponse[List[TituloPrestadoResponse]]
+ReconstruccionEstadisticasSingleResponse = GenericResponse[ReconstruccionEstadisticasResponse]
\ No newline at end of file
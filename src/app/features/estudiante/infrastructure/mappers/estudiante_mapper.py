@@ -8,7 +8,7 @@ class EstudianteMapper:
         if not estudiante_db:
             return None
             
-        return Estudiante(
+        return Estudiante.model_construct(
             id_estudiante=estudiante_db.id_estudiante,
             id_usuario=estudiante_db.id_usuario,
             id_carrera=estudiante_db.id_carrera
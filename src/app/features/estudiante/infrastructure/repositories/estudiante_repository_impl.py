@@ -7,10 +7,13 @@ from src.app.features.estudiante.infrastructure.models.estudiante_model import E
 from src.app.features.estudiante.infrastructure.mappers.estudiante_mapper import EstudianteMapper
 from src.app.features.user.infrastructure.models.user_model import UserDB
 from src.app.features.carrera.infrastructure.models.carrera_model import CarreraDB
+from src.app.core.database.replicas import lectura_replica
+
 class EstudianteRepositoryImpl(EstudianteRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[Estudiante]:
         try:
             statement = select(EstudianteDB)
@@ -35,6 +38,7 @@ class EstudianteRepositoryImpl(EstudianteRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_carrera_id(self, id_carrera: int) -> List[Estudiante]:
         try:
             statement = select(EstudianteDB).where(EstudianteDB.id_carrera == id_carrera)
@@ -47,9 +51,11 @@ class EstudianteRepositoryImpl(EstudianteRepository):
         try:
             estudiante_db = EstudianteMapper.to_db(estudiante)
             self.session.add(estudiante_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = EstudianteMapper.to_domain(estudiante_db)
             self.session.commit()
-            self.session.refresh(estudiante_db)
-            return EstudianteMapper.to_domain(estudiante_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -60,9 +66,10 @@ class EstudianteRepositoryImpl(EstudianteRepository):
             if estudiante_db:
                 estudiante_db.id_carrera = estudiante.id_carrera
                 self.session.add(estudiante_db)
+                self.session.flush()
+                entidad = EstudianteMapper.to_domain(estudiante_db)
                 self.session.commit()
-                self.session.refresh(estudiante_db)
-                return EstudianteMapper.to_domain(estudiante_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -88,6 +95,7 @@ class EstudianteRepositoryImpl(EstudianteRepository):
         except Exception as e:
             raise e
         
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         """Obtener todos los estudiantes con JOIN para usuario y carrera"""
         try:
@@ -112,6 +120,7 @@ class EstudianteRepositoryImpl(EstudianteRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_estudiante: int) -> Optional[dict]:
         """Obtener estudiante por ID con JOIN"""
         try:
@@ -135,6 +144,7 @@ class EstudianteRepositoryImpl(EstudianteRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_usuario_id_with_details(self, id_usuario: int) -> Optional[dict]:
         """Obtener estudiante por ID de usuario con JOIN"""
         try:
@@ -158,6 +168,7 @@ class EstudianteRepositoryImpl(EstudianteRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_carrera_id_with_details(self, id_carrera: int) -> List[dict]:
         """Obtener estudiantes por ID de carrera con JOIN"""
         try:
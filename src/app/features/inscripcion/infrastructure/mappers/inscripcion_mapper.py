@@ -9,12 +9,12 @@ class InscripcionMapper:
         if not inscripcion_db:
             return None
             
-        return Inscripcion(
+        return Inscripcion.model_construct(
             id_inscripcion=inscripcion_db.id_inscripcion,
             id_usuario=inscripcion_db.id_usuario,
             id_ciclo=inscripcion_db.id_ciclo,
             fecha_inscripcion=inscripcion_db.fecha_inscripcion,
-            estado=EstadoInscripcionValueObject(valor=EstadoInscripcionEnum(inscripcion_db.estado))
+            estado=EstadoInscripcionValueObject.model_construct(valor=EstadoInscripcionEnum(inscripcion_db.estado))
         )
 
     @staticmethod
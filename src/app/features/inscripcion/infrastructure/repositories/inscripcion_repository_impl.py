@@ -6,11 +6,13 @@ from src.app.features.inscripcion.domain.entities.inscripcion import Inscripcion
 from src.app.features.inscripcion.infrastructure.models.inscripcion_model import InscripcionDB
 from src.app.features.inscripcion.infrastructure.mappers.inscripcion_mapper import InscripcionMapper
 from src.app.features.inscripcion.domain.value_objects.estado_inscripcion import EstadoInscripcionEnum
+from src.app.core.database.replicas import lectura_replica
 
 class InscripcionRepositoryImpl(InscripcionRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[Inscripcion]:
         try:
             statement = select(InscripcionDB)
@@ -35,6 +37,7 @@ class InscripcionRepositoryImpl(InscripcionRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_ciclo_id(self, id_ciclo: int) -> List[Inscripcion]:
         try:
             statement = select(InscripcionDB).where(InscripcionDB.id_ciclo == id_ciclo)
@@ -43,6 +46,7 @@ class InscripcionRepositoryImpl(InscripcionRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_inscripciones_activas_by_usuario(self, id_usuario: int) -> List[Inscripcion]:
         try:
             statement = select(InscripcionDB).where(
@@ -58,9 +62,11 @@ class InscripcionRepositoryImpl(InscripcionRepository):
         try:
             inscripcion_db = InscripcionMapper.to_db(inscripcion)
             self.session.add(inscripcion_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = InscripcionMapper.to_domain(inscripcion_db)
             self.session.commit()
-            self.session.refresh(inscripcion_db)
-            return InscripcionMapper.to_domain(inscripcion_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -71,9 +77,10 @@ class InscripcionRepositoryImpl(InscripcionRepository):
             if inscripcion_db:
                 inscripcion_db.estado = inscripcion.estado.valor.value
                 self.session.add(inscripcion_db)
+                self.session.flush()
+                entidad = InscripcionMapper.to_domain(inscripcion_db)
                 self.session.commit()
-                self.session.refresh(inscripcion_db)
-                return InscripcionMapper.to_domain(inscripcion_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -103,6 +110,7 @@ class InscripcionRepositoryImpl(InscripcionRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_inscripciones_by_usuario_and_ciclo(self, id_usuario: int, id_ciclo: int) -> List[Inscripcion]:
         try:
             statement = select(InscripcionDB).where(
@@ -5,6 +5,7 @@ from src.app.features.laboratorios.domain.repositories.laboratorio_repository im
 from src.app.features.laboratorios.application.dtos import CreateLaboratorioDTO, UpdateLaboratorioDTO
 from src.app.features.laboratorios.domain.value_objects.nombre_laboratorio import NombreLaboratorio
 from src.app.features.laboratorios.domain.value_objects.ubicacion_laboratorio import UbicacionLaboratorio
+from src.app.shared.cache.cache_referencia import cache_referencia
 
 # Importamos los servicios/repositorios de las dependencias
 from src.app.features.user.domain.repositories.user_repository import UserRepository
@@ -19,7 +20,7 @@ class LaboratorioService:
         self.user_repository = user_repository
     
     def get_all(self) -> List[Laboratorio]:
-        return self.laboratorio_repository.get_all()
+        return list(cache_referencia.obtener("laboratorios", self.laboratorio_repository.get_all))
     
     def get_by_id(self, id_laboratorio: int) -> Optional[Laboratorio]:
         return self.laboratorio_repository.get_by_id(id_laboratorio)
@@ -54,7 +55,9 @@ class LaboratorioService:
             responsable_id=create_dto.responsable_id
         )
         
-        return self.laboratorio_repository.create(laboratorio)
+        guardado = self.laboratorio_repository.create(laboratorio)
+        cache_referencia.invalidar("laboratorios")
+        return guardado
     
     def update(self, id_laboratorio: int, update_dto: UpdateLaboratorioDTO) -> Optional[Laboratorio]:
         existing_laboratorio = self.laboratorio_repository.get_by_id(id_laboratorio)
@@ -82,14 +85,18 @@ class LaboratorioService:
         if update_dto.responsable_id is not None:
             existing_laboratorio.responsable_id = update_dto.responsable_id if update_dto.responsable_id != 0 else None
         
-        return self.laboratorio_repository.update(id_laboratorio, existing_laboratorio)
+        guardado = self.laboratorio_repository.update(id_laboratorio, existing_laboratorio)
+        cache_referencia.invalidar("laboratorios")
+        return guardado
     
     def delete(self, id_laboratorio: int) -> bool:
         existing_laboratorio = self.laboratorio_repository.get_by_id(id_laboratorio)
         if not existing_laboratorio:
             raise ValueError(f"Laboratorio con ID {id_laboratorio} no encontrado")
         
-        return self.laboratorio_repository.delete(id_laboratorio)
+        eliminado = self.laboratorio_repository.delete(id_laboratorio)
+        cache_referencia.invalidar("laboratorios")
+        return eliminado
     
     def exists_by_nombre(self, nombre: str) -> bool:
         return self.laboratorio_repository.exists_by_nombre(nombre)
@@ -10,10 +10,10 @@ class LaboratorioMapper:
         if not laboratorio_db:
             return None
             
-        return Laboratorio(
+        return Laboratorio.model_construct(
             id_laboratorio=laboratorio_db.id_laboratorio,
-            nombre=NombreLaboratorio(valor=laboratorio_db.nombre),
-            ubicacion=UbicacionLaboratorio(valor=laboratorio_db.ubicacion),
+            nombre=NombreLaboratorio.model_construct(valor=laboratorio_db.nombre),
+            ubicacion=UbicacionLaboratorio.model_construct(valor=laboratorio_db.ubicacion),
             responsable_id=laboratorio_db.responsable_id
         )
 
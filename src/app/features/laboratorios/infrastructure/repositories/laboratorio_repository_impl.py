@@ -6,6 +6,7 @@ from src.app.features.laboratorios.domain.entities.laboratorio import Laboratori
 from src.app.features.laboratorios.infrastructure.models.laboratorio_model import LaboratorioDB
 from src.app.features.laboratorios.infrastructure.mappers.laboratorio_mapper import LaboratorioMapper
 from src.app.features.user.infrastructure.models.user_model import UserDB
+from src.app.core.database.replicas import lectura_replica
 
 class LaboratorioRepositoryImpl(LaboratorioRepository):
     def __init__(self, session: Session):
@@ -35,6 +36,7 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_responsable(self, responsable_id: int) -> List[Laboratorio]:
         try:
             statement = select(LaboratorioDB).where(LaboratorioDB.responsable_id == responsable_id)
@@ -47,9 +49,11 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
         try:
             laboratorio_db = LaboratorioMapper.to_db(laboratorio)
             self.session.add(laboratorio_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = LaboratorioMapper.to_domain(laboratorio_db)
             self.session.commit()
-            self.session.refresh(laboratorio_db)
-            return LaboratorioMapper.to_domain(laboratorio_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -62,9 +66,10 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
                 laboratorio_db.ubicacion = laboratorio.ubicacion.valor
                 laboratorio_db.responsable_id = laboratorio.responsable_id
                 self.session.add(laboratorio_db)
+                self.session.flush()
+                entidad = LaboratorioMapper.to_domain(laboratorio_db)
                 self.session.commit()
-                self.session.refresh(laboratorio_db)
-                return LaboratorioMapper.to_domain(laboratorio_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -91,6 +96,7 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
             raise e
 
     # Implementación de métodos con JOINs para datos detallados
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         try:
             statement = select(LaboratorioDB, UserDB).join(
@@ -110,6 +116,7 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_laboratorio: int) -> Optional[dict]:
         try:
             statement = select(LaboratorioDB, UserDB).join(
@@ -127,6 +134,7 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_responsable_with_details(self, responsable_id: int) -> List[dict]:
         try:
             statement = select(LaboratorioDB, UserDB).join(
@@ -145,6 +153,7 @@ class LaboratorioRepositoryImpl(LaboratorioRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_nombre_with_details(self, nombre: str) -> Optional[dict]:
         try:
             statement = select(LaboratorioDB, UserDB).join(
@@ -8,7 +8,7 @@ class MaestroMapper:
         if not maestro_db:
             return None
             
-        return Maestro(
+        return Maestro.model_construct(
             id_maestro=maestro_db.id_maestro,
             id_usuario=maestro_db.id_usuario
         )
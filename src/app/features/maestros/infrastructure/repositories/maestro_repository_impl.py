@@ -6,11 +6,13 @@ from src.app.features.maestros.domain.entities.maestro import Maestro
 from src.app.features.maestros.infrastructure.models.maestro_model import MaestroDB
 from src.app.features.maestros.infrastructure.mappers.maestro_mapper import MaestroMapper
 from src.app.features.user.infrastructure.models.user_model import UserDB
+from src.app.core.database.replicas import lectura_replica
 
 class MaestroRepositoryImpl(MaestroRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[Maestro]:
         try:
             statement = select(MaestroDB)
@@ -39,9 +41,11 @@ class MaestroRepositoryImpl(MaestroRepository):
         try:
             maestro_db = MaestroMapper.to_db(maestro)
             self.session.add(maestro_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = MaestroMapper.to_domain(maestro_db)
             self.session.commit()
-            self.session.refresh(maestro_db)
-            return MaestroMapper.to_domain(maestro_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -52,9 +56,10 @@ class MaestroRepositoryImpl(MaestroRepository):
             if maestro_db:
                 # En esta versión simple no hay campos para actualizar
                 self.session.add(maestro_db)
+                self.session.flush()
+                entidad = MaestroMapper.to_domain(maestro_db)
                 self.session.commit()
-                self.session.refresh(maestro_db)
-                return MaestroMapper.to_domain(maestro_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -81,6 +86,7 @@ class MaestroRepositoryImpl(MaestroRepository):
             raise e
 
     # Implementación de métodos con JOINs para datos detallados
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         try:
             statement = select(MaestroDB, UserDB).join(UserDB, MaestroDB.id_usuario == UserDB.id_usuario)
@@ -98,6 +104,7 @@ class MaestroRepositoryImpl(MaestroRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_maestro: int) -> Optional[dict]:
         try:
             statement = select(MaestroDB, UserDB).join(
@@ -115,6 +122,7 @@ class MaestroRepositoryImpl(MaestroRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_usuario_id_with_details(self, id_usuario: int) -> Optional[dict]:
         try:
             statement = select(MaestroDB, UserDB).join(
@@ -0,0 +1,266 @@
+# src/app/features/prestamos/application/services/motor_multas.py
+"""Cálculo en lote de días de retraso, multas y antigüedad de la cartera vencida.
+
+Trabaja sobre las fechas de todos los préstamos en columnas (`FechasColumnares`) con una sola
+fecha de corte: con NumPy (en requirements.txt) cada paso es una operación vectorizada sobre todo el
+lote. Si NumPy no se puede importar, el mismo cálculo se hace en Python puro como respaldo, con
+idéntico resultado pero varias veces más lento.
+
+- Días de retraso: como `FechasPrestamo.calcular_dias_retraso`, hasta la devolución o hasta el corte,
+  lo que ocurra antes. Con un corte pasado, un préstamo devuelto después cuenta como abierto.
+- Multa: tarifa diaria por tramos progresivos (MULTA_TARIFAS, p. ej. "1-7:5,8-30:10,31:20": los
+  días 1 a 7 a 5, del 8 al 30 a 10 y del 31 en adelante a 20), tras MULTA_DIAS_GRACIA días de
+  gracia y con un tope opcional por préstamo (MULTA_TOPE).
+- Antigüedad: los préstamos se reparten en tramos de días de retraso (MULTA_TRAMOS_ANTIGUEDAD,
+  los límites inferiores, p. ej. "1,8,31,61" da al corriente, 1-7, 8-30, 31-60 y 61+).
+"""
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+from src.app.features.prestamos.domain.value_objects.fechas_columnares import FechasColumnares
+
+try:
+    import numpy as np
+except ImportError:  # Respaldo: sin NumPy se usa el cálculo en Python puro
+    np = None
+
+# (primer día, último día o None si no tiene fin, tarifa por día)
+Tramo = Tuple[int, Optional[int], float]
+
+
+def parsear_tarifas(texto: str) -> List[Tramo]:
+    """"1-7:5,8-30:10,31:20" -> [(1, 7, 5.0), (8, 30, 10.0), (31, None, 20.0)]"""
+    tramos: List[Tramo] = []
+    for parte in filter(None, (p.strip() for p in texto.split(","))):
+        dias, _, tarifa = parte.partition(":")
+        desde, _, hasta = dias.partition("-")
+        tramos.append((int(desde), int(hasta) if hasta.strip() else None, float(tarifa)))
+    tramos.sort()
+    for (desde, hasta, _), (siguiente, _, _) in zip(tramos, tramos[1:]):
+        if hasta is None or hasta >= siguiente:
+            raise ValueError(f"Los tramos de MULTA_TARIFAS se traslapan: {texto}")
+    if any(desde < 1 or tarifa < 0 for desde, _, tarifa in tramos):
+        raise ValueError(f"MULTA_TARIFAS inválida: {texto}")
+    return tramos
+
+
+def parsear_limites(texto: str) -> List[int]:
+    limites = sorted({int(p) for p in texto.split(",") if p.strip()})
+    if any(limite < 1 for limite in limites):
+        raise ValueError(f"MULTA_TRAMOS_ANTIGUEDAD inválida: {texto}")
+    return limites
+
+
+TARIFAS = parsear_tarifas(os.getenv("MULTA_TARIFAS", "1-7:5,8-30:10,31:20"))
+DIAS_GRACIA = int(os.getenv("MULTA_DIAS_GRACIA", "0"))
+TOPE = float(os.getenv("MULTA_TOPE")) if os.getenv("MULTA_TOPE") else None
+LIMITES_ANTIGUEDAD = parsear_limites(os.getenv("MULTA_TRAMOS_ANTIGUEDAD", "1,8,31,61"))
+
+
+@dataclass
+class ResultadoMultas:
+    motor: str
+    fecha_corte: date
+    prestamos_evaluados: int
+    prestamos_con_retraso: int
+    dias_retraso_total: int
+    multa_total: float
+    # Por tramo de antigüedad: {"tramo", "desde", "hasta", "prestamos", "dias_retraso", "multa"}
+    tramos: List[dict] = field(default_factory=list)
+    # {"id_prestamo", "id_usuario", "dias_retraso", "multa"}, de mayor a menor multa
+    mayores_multas: List[dict] = field(default_factory=list)
+    # {"id_usuario", "prestamos", "multa"}, de mayor a menor multa
+    usuarios: List[dict] = field(default_factory=list)
+    # Por préstamo, en el orden de las columnas de entrada (arreglos NumPy o listas)
+    dias_retraso: Sequence[int] = ()
+    multas: Sequence[float] = ()
+
+
+class MotorMultas:
+    def __init__(self, tarifas: Sequence[Tramo] = TARIFAS, dias_gracia: int = DIAS_GRACIA,
+                 tope: Optional[float] = TOPE, limites_antiguedad: Sequence[int] = LIMITES_ANTIGUEDAD,
+                 usar_numpy: Optional[bool] = None):
+        self.tarifas = list(tarifas)
+        self.dias_gracia = dias_gracia
+        self.tope = tope
+        self.limites_antiguedad = list(limites_antiguedad)
+        if usar_numpy and np is None:
+            raise RuntimeError("El motor vectorizado requiere instalar numpy")
+        self.usar_numpy = np is not None if usar_numpy is None else usar_numpy
+
+    @property
+    def motor(self) -> str:
+        return "numpy" if self.usar_numpy else "python"
+
+    def calcular(self, columnas: FechasColumnares, fecha_corte: Optional[date] = None,
+                 limite: int = 10) -> ResultadoMultas:
+        """Calcula todo el lote con una sola fecha de corte (hoy si no se indica)"""
+        fecha_corte = fecha_corte or date.today()
+        if self.usar_numpy:
+            return self._calcular_numpy(columnas, fecha_corte, limite)
+        return self._calcular_python(columnas, fecha_corte, limite)
+
+    def _descripcion_tramos(self) -> List[Tuple[str, int, Optional[int]]]:
+        limites = [0, *self.limites_antiguedad]
+        descripcion = []
+        for i, desde in enumerate(limites):
+            hasta = limites[i + 1] - 1 if i + 1 < len(limites) else None
+            if desde == 0:
+                nombre = "al_corriente" if hasta == 0 else f"0-{hasta}"
+            else:
+                nombre = f"{desde}-{hasta}" if hasta is not None else f"{desde}+"
+            descripcion.append((nombre, desde, hasta))
+        return descripcion
+
+    def _resultado(self, fecha_corte: date, evaluados: int, con_retraso: int, dias_total: int,
+                   multa_total: float, cantidades, dias_por_tramo, multa_por_tramo,
+                   mayores: List[dict], usuarios: List[dict], dias_retraso, multas) -> ResultadoMultas:
+        tramos = [
+            {
+                "tramo": nombre,
+                "desde": desde,
+                "hasta": hasta,
+                "prestamos": int(cantidades[i]),
+                "dias_retraso": int(dias_por_tramo[i]),
+                "multa": round(float(multa_por_tramo[i]), 2),
+            }
+            for i, (nombre, desde, hasta) in enumerate(self._descripcion_tramos())
+        ]
+        return ResultadoMultas(
+            motor=self.motor,
+            fecha_corte=fecha_corte,
+            prestamos_evaluados=evaluados,
+            prestamos_con_retraso=con_retraso,
+            dias_retraso_total=dias_total,
+            multa_total=round(multa_total, 2),
+            tramos=tramos,
+            mayores_multas=mayores,
+            usuarios=usuarios,
+            dias_retraso=dias_retraso,
+            multas=multas,
+        )
+
+    def _calcular_numpy(self, columnas: FechasColumnares, fecha_corte: date, limite: int) -> ResultadoMultas:
+        n = len(columnas)
+        ids = np.fromiter(columnas.ids, dtype=np.int64, count=n)
+        usuarios = np.fromiter(columnas.usuarios, dtype=np.int64, count=n)
+        esperadas = np.fromiter(columnas.esperadas, dtype=np.int64, count=n)
+        devoluciones = np.fromiter(columnas.devoluciones, dtype=np.int64, count=n)
+
+        # Días de retraso: hasta la devolución o hasta el corte, lo que ocurra antes
+        corte = fecha_corte.toordinal()
+        fin = np.minimum(np.where(devoluciones > 0, devoluciones, corte), corte)
+        dias = np.maximum(fin - esperadas, 0)
+
+        # Multa progresiva: cada tramo cobra los días cobrables que caen dentro de él
+        cobrables = np.maximum(dias - self.dias_gracia, 0)
+        multas = np.zeros(n, dtype=np.float64)
+        for desde, hasta, tarifa in self.tarifas:
+            en_tramo = np.maximum(cobrables - (desde - 1), 0)
+            if hasta is not None:
+                np.minimum(en_tramo, hasta - desde + 1, out=en_tramo)
+            multas += en_tramo * tarifa
+        if self.tope is not None:
+            np.minimum(multas, self.tope, out=multas)
+        multas = np.round(multas, 2)
+
+        # Antigüedad: índice de tramo por préstamo y agregados con bincount
+        cantidad_tramos = len(self.limites_antiguedad) + 1
+        indices = np.searchsorted(np.asarray(self.limites_antiguedad, dtype=np.int64), dias, side="right")
+        cantidades = np.bincount(indices, minlength=cantidad_tramos)
+        dias_por_tramo = np.bincount(indices, weights=dias, minlength=cantidad_tramos)
+        multa_por_tramo = np.bincount(indices, weights=multas, minlength=cantidad_tramos)
+
+        # Mayores multas: de mayor a menor, a igualdad por id
+        con_multa = np.flatnonzero(multas > 0)
+        orden = con_multa[np.lexsort((ids[con_multa], -multas[con_multa]))][:limite]
+        mayores = [
+            {"id_prestamo": int(ids[i]), "id_usuario": int(usuarios[i]),
+             "dias_retraso": int(dias[i]), "multa": float(multas[i])}
+            for i in orden
+        ]
+
+        # Multa por usuario: agrupar con unique + bincount
+        por_usuario = []
+        if con_multa.size:
+            ids_usuario, inverso = np.unique(usuarios[con_multa], return_inverse=True)
+            multa_usuario = np.round(np.bincount(inverso, weights=multas[con_multa]), 2)
+            prestamos_usuario = np.bincount(inverso)
+            orden_usuarios = np.lexsort((ids_usuario, -multa_usuario))[:limite]
+            por_usuario = [
+                {"id_usuario": int(ids_usuario[i]), "prestamos": int(prestamos_usuario[i]),
+                 "multa": float(multa_usuario[i])}
+                for i in orden_usuarios
+            ]
+
+        return self._resultado(
+            fecha_corte, n, int(np.count_nonzero(dias)), int(dias.sum()), float(multas.sum()),
+            cantidades, dias_por_tramo, multa_por_tramo, mayores, por_usuario, dias, multas
+        )
+
+    def _multa(self, dias: int) -> float:
+        cobrables = max(dias - self.dias_gracia, 0)
+        multa = 0.0
+        for desde, hasta, tarifa in self.tarifas:
+            en_tramo = max(cobrables - (desde - 1), 0)
+            if hasta is not None:
+                en_tramo = min(en_tramo, hasta - desde + 1)
+            multa += en_tramo * tarifa
+        if self.tope is not None:
+            multa = min(multa, self.tope)
+        return round(multa, 2)
+
+    def _calcular_python(self, columnas: FechasColumnares, fecha_corte: date, limite: int) -> ResultadoMultas:
+        corte = fecha_corte.toordinal()
+        cantidad_tramos = len(self.limites_antiguedad) + 1
+        cantidades = [0] * cantidad_tramos
+        dias_por_tramo = [0] * cantidad_tramos
+        multa_por_tramo = [0.0] * cantidad_tramos
+        dias_retraso: List[int] = []
+        multas: List[float] = []
+        multa_usuario: dict = {}
+        prestamos_usuario: dict = {}
+
+        # La multa solo depende de los días de retraso: se calcula una vez por cantidad de días
+        multa_por_dias: dict = {}
+
+        for id_usuario, esperada, devolucion in zip(columnas.usuarios, columnas.esperadas, columnas.devoluciones):
+            dias = max(min(devolucion or corte, corte) - esperada, 0)
+            multa = multa_por_dias.get(dias)
+            if multa is None:
+                multa = multa_por_dias[dias] = self._multa(dias)
+
+            indice = bisect_right(self.limites_antiguedad, dias)
+            cantidades[indice] += 1
+            dias_por_tramo[indice] += dias
+            multa_por_tramo[indice] += multa
+            if multa > 0:
+                multa_usuario[id_usuario] = multa_usuario.get(id_usuario, 0.0) + multa
+                prestamos_usuario[id_usuario] = prestamos_usuario.get(id_usuario, 0) + 1
+            dias_retraso.append(dias)
+            multas.append(multa)
+
+        orden = sorted(
+            (i for i, multa in enumerate(multas) if multa > 0),
+            key=lambda i: (-multas[i], columnas.ids[i])
+        )[:limite]
+        mayores = [
+            {"id_prestamo": columnas.ids[i], "id_usuario": columnas.usuarios[i],
+             "dias_retraso": dias_retraso[i], "multa": multas[i]}
+            for i in orden
+        ]
+        por_usuario = [
+            {"id_usuario": id_usuario, "prestamos": prestamos_usuario[id_usuario], "multa": round(multa, 2)}
+            for id_usuario, multa in sorted(multa_usuario.items(), key=lambda par: (-round(par[1], 2), par[0]))[:limite]
+        ]
+
+        return self._resultado(
+            fecha_corte, len(columnas), sum(1 for dias in dias_retraso if dias), sum(dias_retraso), sum(multas),
+            cantidades, dias_por_tramo, multa_por_tramo, mayores, por_usuario, dias_retraso, multas
+        )
+
+
+motor_multas = MotorMultas()
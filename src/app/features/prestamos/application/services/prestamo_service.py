@@ -6,10 +6,14 @@ from src.app.features.prestamos.domain.repositories.prestamo_repository import P
 from src.app.features.prestamos.application.dtos import CreatePrestamoDTO, UpdatePrestamoDTO, DevolverPrestamoDTO, RenovarPrestamoDTO
 from src.app.features.prestamos.domain.value_objects.estado_prestamo import EstadoPrestamo
 from src.app.features.prestamos.domain.value_objects.fechas_prestamo import FechasPrestamo
+from src.app.features.prestamos.domain.value_objects.origen_prestamo import OrigenPrestamo
+from src.app.features.prestamos.application.services.motor_multas import ResultadoMultas, motor_multas
+from src.app.shared.concurrency.optimistic_lock import ConcurrencyConflictError, retry_on_conflict
 
 # Importamos los servicios/repositorios de las dependencias
 from src.app.features.user.domain.repositories.user_repository import UserRepository
 from src.app.features.ejemplares.domain.repositories.ejemplar_repository import EjemplarRepository
+from src.app.features.ejemplares.domain.entities.ejemplar import Ejemplar
 
 class PrestamoService:
     def __init__(
@@ -52,21 +56,17 @@ class PrestamoService:
         if not usuario:
             raise ValueError(f"Usuario con ID {create_dto.id_usuario} no encontrado")
         
-        # Validar que el ejemplar existe
-        ejemplar = self.ejemplar_repository.get_by_id(create_dto.id_ejemplar)
-        if not ejemplar:
+        # Validar que el ejemplar existe; el tipo de su catálogo llega en la misma consulta
+        encontrado = self.ejemplar_repository.get_by_id_con_tipo(create_dto.id_ejemplar)
+        if not encontrado:
             raise ValueError(f"Ejemplar con ID {create_dto.id_ejemplar} no encontrado")
+        ejemplar, tipo = encontrado
         
-        # Validar que el ejemplar esté disponible
+        # Validar que el ejemplar esté disponible; un ejemplar disponible no tiene préstamos abiertos
+        # (nadie más, ni este usuario), así que no hace falta recorrer los préstamos activos
         if not ejemplar.estado.esta_disponible():
             raise ValueError(f"El ejemplar con ID {create_dto.id_ejemplar} no está disponible para préstamo")
         
-        # Validar que el usuario no tenga préstamos activos del mismo ejemplar
-        prestamos_activos_usuario = self.prestamo_repository.get_prestamos_activos()
-        for prestamo in prestamos_activos_usuario:
-            if prestamo.id_usuario == create_dto.id_usuario and prestamo.id_ejemplar == create_dto.id_ejemplar:
-                raise ValueError(f"El usuario ya tiene un préstamo activo para este ejemplar")
-        
         # Crear los value objects
         fechas_vo = FechasPrestamo(
             fecha_devolucion_esperada=create_dto.fecha_devolucion_esperada
@@ -79,12 +79,13 @@ class PrestamoService:
             id_usuario=create_dto.id_usuario,
             id_ejemplar=create_dto.id_ejemplar,
             fechas=fechas_vo,
-            estado=estado_vo
+            estado=estado_vo,
+            origen=self._origen(ejemplar, tipo)
         )
         
-        # Marcar el ejemplar como prestado
+        # Marcar el ejemplar como prestado; si otro préstamo lo tomó antes, la relectura lo rechaza
         ejemplar.marcar_como_prestado()
-        self.ejemplar_repository.update(ejemplar.id_ejemplar, ejemplar)
+        self._guardar_ejemplar(ejemplar, Ejemplar.marcar_como_prestado)
         
         return self.prestamo_repository.create(prestamo)
     
@@ -101,9 +102,10 @@ class PrestamoService:
         
         # Validar ejemplar si se está cambiando
         if update_dto.id_ejemplar and update_dto.id_ejemplar != existing_prestamo.id_ejemplar:
-            ejemplar = self.ejemplar_repository.get_by_id(update_dto.id_ejemplar)
-            if not ejemplar:
+            encontrado = self.ejemplar_repository.get_by_id_con_tipo(update_dto.id_ejemplar)
+            if not encontrado:
                 raise ValueError(f"Ejemplar con ID {update_dto.id_ejemplar} no encontrado")
+            existing_prestamo.origen = self._origen(*encontrado)
         
         # Actualizar campos
         if update_dto.id_usuario is not None:
@@ -113,13 +115,55 @@ class PrestamoService:
             existing_prestamo.id_ejemplar = update_dto.id_ejemplar
         
         if update_dto.fecha_devolucion_esperada is not None:
-            existing_prestamo.fechas.fecha_devolucion_esperada = update_dto.fecha_devolucion_esperada
+            existing_prestamo.fechas.fecha_devolucion_esperada = FechasPrestamo.validar_fecha_devolucion_esperada(
+                update_dto.fecha_devolucion_esperada
+            )
         
         if update_dto.estado is not None:
             existing_prestamo.estado = EstadoPrestamo(valor=update_dto.estado)
         
         return self.prestamo_repository.update(id_prestamo, existing_prestamo)
     
+    def patch(self, id_prestamo: int, update_dto: UpdatePrestamoDTO) -> Optional[List[str]]:
+        """Actualización parcial: valida solo los campos enviados y emite un único UPDATE"""
+        campos = update_dto.model_dump(exclude_none=True)
+        if not campos:
+            raise ValueError("No se proporcionaron campos para actualizar")
+        
+        cambios = {}
+        if "id_usuario" in campos:
+            if not self.user_repository.get_by_id(campos["id_usuario"]):
+                raise ValueError(f"Usuario con ID {campos['id_usuario']} no encontrado")
+            cambios["id_usuario"] = campos["id_usuario"]
+        
+        origen = None
+        if "id_ejemplar" in campos:
+            encontrado = self.ejemplar_repository.get_by_id_con_tipo(campos["id_ejemplar"])
+            if not encontrado:
+                raise ValueError(f"Ejemplar con ID {campos['id_ejemplar']} no encontrado")
+            cambios["id_ejemplar"] = campos["id_ejemplar"]
+            origen = self._origen(*encontrado)
+        
+        if "fecha_devolucion_esperada" in campos:
+            cambios["fecha_devolucion_esperada"] = FechasPrestamo.validar_fecha_devolucion_esperada(
+                campos["fecha_devolucion_esperada"]
+            )
+        
+        if "estado" in campos:
+            cambios["estado"] = EstadoPrestamo(valor=campos["estado"]).valor.value
+        
+        actualizados = list(cambios.keys())
+        if origen is not None:
+            # El préstamo pasa a contar en las estadísticas del nuevo ejemplar
+            cambios.update(
+                id_biblioteca_origen=origen.id_biblioteca,
+                id_catalogo_origen=origen.id_catalogo,
+                tipo_origen=origen.tipo
+            )
+        if not self.prestamo_repository.patch(id_prestamo, cambios):
+            return None
+        return actualizados
+    
     def delete(self, id_prestamo: int) -> bool:
         existing_prestamo = self.prestamo_repository.get_by_id(id_prestamo)
         if not existing_prestamo:
@@ -130,7 +174,7 @@ class PrestamoService:
             ejemplar = self.ejemplar_repository.get_by_id(existing_prestamo.id_ejemplar)
             if ejemplar:
                 ejemplar.marcar_como_devuelto()
-                self.ejemplar_repository.update(ejemplar.id_ejemplar, ejemplar)
+                self._guardar_ejemplar(ejemplar, Ejemplar.marcar_como_devuelto)
         
         return self.prestamo_repository.delete(id_prestamo)
 
@@ -160,13 +204,18 @@ class PrestamoService:
         
         prestamo.devolver(fecha_devolucion_real)
         
+        # Primero el préstamo: si dos devoluciones compiten, la perdedora falla aquí sin tocar el ejemplar
+        prestamo = self._guardar_prestamo(prestamo, lambda p: p.devolver(fecha_devolucion_real))
+        if not prestamo:
+            return None
+        
         # Marcar el ejemplar como disponible
         ejemplar = self.ejemplar_repository.get_by_id(prestamo.id_ejemplar)
         if ejemplar:
             ejemplar.marcar_como_devuelto()
-            self.ejemplar_repository.update(ejemplar.id_ejemplar, ejemplar)
+            self._guardar_ejemplar(ejemplar, Ejemplar.marcar_como_devuelto)
         
-        return self.prestamo_repository.update(id_prestamo, prestamo)
+        return prestamo
 
     def renovar(self, id_prestamo: int, renovar_dto: RenovarPrestamoDTO) -> Optional[Prestamo]:
         prestamo = self.prestamo_repository.get_by_id(id_prestamo)
@@ -175,13 +224,49 @@ class PrestamoService:
         
         prestamo.renovar(renovar_dto.nueva_fecha_devolucion)
         
-        return self.prestamo_repository.update(id_prestamo, prestamo)
+        return self._guardar_prestamo(prestamo, lambda p: p.renovar(renovar_dto.nueva_fecha_devolucion))
 
     def marcar_retrasados(self):
         """Método para marcar automáticamente los préstamos retrasados"""
         prestamos_activos = self.prestamo_repository.get_prestamos_activos()
+        hoy = date.today()
         
         for prestamo in prestamos_activos:
-            if prestamo.esta_vencido():
+            if prestamo.esta_vencido(hoy):
                 prestamo.marcar_como_retrasado()
-                self.prestamo_repository.update(prestamo.id_prestamo, prestamo)
\ No newline at end of file
+                try:
+                    self.prestamo_repository.update(prestamo.id_prestamo, prestamo)
+                except ConcurrencyConflictError:
+                    # Otra operación cambió el préstamo (p. ej. se devolvió); la siguiente pasada lo reevalúa
+                    continue
+
+    def calcular_multas(self, fecha_corte: Optional[date] = None, incluir_devueltos: bool = False,
+                        limite: int = 10) -> ResultadoMultas:
+        """Días de retraso, multas y antigüedad de todos los préstamos en un solo cálculo en lote"""
+        if limite < 1:
+            raise ValueError("El límite debe ser mayor que cero")
+        fecha_corte = fecha_corte or date.today()
+        columnas = self.prestamo_repository.get_fechas_columnares(fecha_corte, incluir_devueltos)
+        return motor_multas.calcular(columnas, fecha_corte, limite)
+
+    @staticmethod
+    def _origen(ejemplar: Ejemplar, tipo: str) -> OrigenPrestamo:
+        return OrigenPrestamo(id_biblioteca=ejemplar.id_biblioteca, id_catalogo=ejemplar.id_catalogo, tipo=tipo)
+
+    def _guardar_prestamo(self, prestamo: Prestamo, transicion) -> Optional[Prestamo]:
+        """Guarda una transición del préstamo; si hubo una escritura concurrente relee y la reaplica"""
+        return retry_on_conflict(
+            prestamo,
+            guardar=lambda p: self.prestamo_repository.update(p.id_prestamo, p),
+            recargar=lambda: self.prestamo_repository.get_by_id(prestamo.id_prestamo),
+            aplicar=transicion
+        )
+
+    def _guardar_ejemplar(self, ejemplar: Ejemplar, transicion) -> Optional[Ejemplar]:
+        """Guarda el cambio de estado del ejemplar con la misma política de reintento"""
+        return retry_on_conflict(
+            ejemplar,
+            guardar=lambda e: self.ejemplar_repository.update(e.id_ejemplar, e),
+            recargar=lambda: self.ejemplar_repository.get_by_id(ejemplar.id_ejemplar),
+            aplicar=transicion
+        )
\ No newline at end of file
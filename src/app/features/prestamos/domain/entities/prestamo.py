@@ -2,8 +2,9 @@
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime, date
-from src.app.features.prestamos.domain.value_objects.estado_prestamo import EstadoPrestamo
+from src.app.features.prestamos.domain.value_objects.estado_prestamo import EstadoPrestamo, EstadoPrestamoEnum
 from src.app.features.prestamos.domain.value_objects.fechas_prestamo import FechasPrestamo
+from src.app.features.prestamos.domain.value_objects.origen_prestamo import OrigenPrestamo
 
 class Prestamo(BaseModel):
     id_prestamo: Optional[int] = None
@@ -11,6 +12,32 @@ class Prestamo(BaseModel):
     id_ejemplar: int
     fechas: FechasPrestamo
     estado: EstadoPrestamo = EstadoPrestamo(valor="activo")
+    version: int = 1
+    origen: Optional[OrigenPrestamo] = None
+
+    @classmethod
+    def rehidratar(
+        cls,
+        id_prestamo: int,
+        id_usuario: int,
+        id_ejemplar: int,
+        fecha_prestamo: datetime,
+        fecha_devolucion_esperada: date,
+        fecha_devolucion_real: Optional[datetime],
+        estado: str,
+        version: int = 1,
+        origen: Optional[OrigenPrestamo] = None
+    ) -> "Prestamo":
+        """Reconstruye un préstamo guardado; las validaciones de creación solo aplican a datos nuevos"""
+        return cls.model_construct(
+            id_prestamo=id_prestamo,
+            id_usuario=id_usuario,
+            id_ejemplar=id_ejemplar,
+            fechas=FechasPrestamo.rehidratar(fecha_prestamo, fecha_devolucion_esperada, fecha_devolucion_real),
+            estado=EstadoPrestamo.model_construct(valor=EstadoPrestamoEnum(estado)),
+            version=version,
+            origen=origen
+        )
 
     def devolver(self, fecha_devolucion_real: Optional[datetime] = None):
         """Método de negocio: devolver el préstamo"""
@@ -28,7 +55,7 @@ class Prestamo(BaseModel):
         if not self.fechas.se_puede_renovar():
             raise ValueError("No se puede renovar un préstamo vencido")
         
-        self.fechas.fecha_devolucion_esperada = nueva_fecha_devolucion
+        self.fechas.fecha_devolucion_esperada = FechasPrestamo.validar_fecha_devolucion_esperada(nueva_fecha_devolucion)
 
     def marcar_como_retrasado(self):
         """Método de negocio: marcar como retrasado"""
@@ -38,13 +65,13 @@ class Prestamo(BaseModel):
         if self.fechas.esta_vencido():
             self.estado = EstadoPrestamo(valor="retrasado")
 
-    def obtener_dias_retraso(self) -> int:
+    def obtener_dias_retraso(self, hoy: Optional[date] = None) -> int:
         """Método de negocio: obtener días de retraso"""
-        return self.fechas.calcular_dias_retraso()
+        return self.fechas.calcular_dias_retraso(hoy)
 
-    def esta_vencido(self) -> bool:
+    def esta_vencido(self, hoy: Optional[date] = None) -> bool:
         """Método de negocio: verificar si está vencido"""
-        return self.fechas.esta_vencido()
+        return self.fechas.esta_vencido(hoy)
 
     def se_puede_renovar(self) -> bool:
         """Método de negocio: verificar si se puede renovar"""
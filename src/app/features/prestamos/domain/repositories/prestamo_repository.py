@@ -1,7 +1,9 @@
 # src/app/features/prestamos/domain/repositories/prestamo_repository.py
 from abc import ABC, abstractmethod
 from typing import List, Optional
+from datetime import date
 from src.app.features.prestamos.domain.entities.prestamo import Prestamo
+from src.app.features.prestamos.domain.value_objects.fechas_columnares import FechasColumnares
 
 class PrestamoRepository(ABC):
     
@@ -45,6 +47,10 @@ class PrestamoRepository(ABC):
     def update(self, id_prestamo: int, prestamo: Prestamo) -> Optional[Prestamo]:
         pass
     
+    @abstractmethod
+    def patch(self, id_prestamo: int, cambios: dict) -> bool:
+        pass
+    
     @abstractmethod
     def delete(self, id_prestamo: int) -> bool:
         pass
@@ -64,4 +70,9 @@ class PrestamoRepository(ABC):
 
     @abstractmethod
     def get_prestamos_activos_with_details(self) -> List[dict]:
+        pass
+
+    # Fechas en columnas para el cálculo de multas en lote
+    @abstractmethod
+    def get_fechas_columnares(self, fecha_corte: date, incluir_devueltos: bool = False) -> FechasColumnares:
         pass
\ No newline at end of file
@@ -0,0 +1,16 @@
+# src/app/features/prestamos/domain/value_objects/fechas_columnares.py
+from dataclasses import dataclass, field
+from typing import List
+
+@dataclass(frozen=True)
+class FechasColumnares:
+    """Fechas de muchos préstamos en columnas paralelas, para calcularlas en lote.
+    Las fechas son ordinales de día (`date.toordinal()`); 0 en `devoluciones` = no devuelto.
+    No es un BaseModel: validar elemento por elemento costaría lo que se quiere ahorrar."""
+    ids: List[int] = field(default_factory=list)
+    usuarios: List[int] = field(default_factory=list)
+    esperadas: List[int] = field(default_factory=list)
+    devoluciones: List[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
\ No newline at end of file
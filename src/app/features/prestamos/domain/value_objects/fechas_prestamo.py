@@ -22,7 +22,22 @@ class FechasPrestamo(BaseModel):
             raise ValueError("La fecha de devolución real no puede ser anterior a la fecha de préstamo")
         return self
 
-    def calcular_dias_retraso(self) -> int:
+    @classmethod
+    def rehidratar(
+        cls,
+        fecha_prestamo: datetime,
+        fecha_devolucion_esperada: date,
+        fecha_devolucion_real: Optional[datetime] = None
+    ) -> "FechasPrestamo":
+        """Reconstruye fechas ya persistidas sin las reglas de creación: un préstamo histórico vencido es válido"""
+        return cls.model_construct(
+            fecha_prestamo=fecha_prestamo,
+            fecha_devolucion_esperada=fecha_devolucion_esperada,
+            fecha_devolucion_real=fecha_devolucion_real
+        )
+
+    def calcular_dias_retraso(self, hoy: Optional[date] = None) -> int:
+        # `hoy` permite fijar la fecha de corte una vez para muchos préstamos
         if self.fecha_devolucion_real:
             # Si ya se devolvió, calcular retraso al momento de la devolución
             if self.fecha_devolucion_real.date() > self.fecha_devolucion_esperada:
@@ -30,12 +45,13 @@ class FechasPrestamo(BaseModel):
             return 0
         else:
             # Si no se ha devuelto, calcular retraso hasta hoy
-            if date.today() > self.fecha_devolucion_esperada:
-                return (date.today() - self.fecha_devolucion_esperada).days
+            hoy = hoy or date.today()
+            if hoy > self.fecha_devolucion_esperada:
+                return (hoy - self.fecha_devolucion_esperada).days
             return 0
 
-    def esta_vencido(self) -> bool:
-        return self.calcular_dias_retraso() > 0
+    def esta_vencido(self, hoy: Optional[date] = None) -> bool:
+        return self.calcular_dias_retraso(hoy) > 0
 
     def se_puede_renovar(self) -> bool:
         # Se puede renovar si no está vencido y no se ha devuelto
@@ -0,0 +1,10 @@
+# src/app/features/prestamos/domain/value_objects/origen_prestamo.py
+from pydantic import BaseModel
+from typing import Optional
+
+class OrigenPrestamo(BaseModel):
+    """Biblioteca, item del catálogo y tipo del ejemplar al prestarse. Las estadísticas del préstamo
+    se cuentan siempre aquí, aunque después el ejemplar cambie de biblioteca"""
+    id_biblioteca: Optional[int] = None
+    id_catalogo: int
+    tipo: str
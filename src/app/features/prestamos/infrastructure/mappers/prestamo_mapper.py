@@ -1,27 +1,28 @@
 # src/app/features/prestamos/infrastructure/mappers/prestamo_mapper.py
 from src.app.features.prestamos.domain.entities.prestamo import Prestamo
+from src.app.features.prestamos.domain.value_objects.origen_prestamo import OrigenPrestamo
 from src.app.features.prestamos.infrastructure.models.prestamo_model import PrestamoDB
-from src.app.features.prestamos.domain.value_objects.estado_prestamo import EstadoPrestamo
-from src.app.features.prestamos.domain.value_objects.fechas_prestamo import FechasPrestamo
 
 class PrestamoMapper:
     @staticmethod
     def to_domain(prestamo_db: PrestamoDB) -> Prestamo:
         if not prestamo_db:
             return None
-            
-        fechas = FechasPrestamo(
-            fecha_prestamo=prestamo_db.fecha_prestamo,
-            fecha_devolucion_esperada=prestamo_db.fecha_devolucion_esperada,
-            fecha_devolucion_real=prestamo_db.fecha_devolucion_real
-        )
         
-        return Prestamo(
+        return Prestamo.rehidratar(
             id_prestamo=prestamo_db.id_prestamo,
             id_usuario=prestamo_db.id_usuario,
             id_ejemplar=prestamo_db.id_ejemplar,
-            fechas=fechas,
-            estado=EstadoPrestamo(valor=prestamo_db.estado)
+            fecha_prestamo=prestamo_db.fecha_prestamo,
+            fecha_devolucion_esperada=prestamo_db.fecha_devolucion_esperada,
+            fecha_devolucion_real=prestamo_db.fecha_devolucion_real,
+            estado=prestamo_db.estado,
+            version=prestamo_db.version,
+            origen=OrigenPrestamo.model_construct(
+                id_biblioteca=prestamo_db.id_biblioteca_origen,
+                id_catalogo=prestamo_db.id_catalogo_origen,
+                tipo=prestamo_db.tipo_origen
+            ) if prestamo_db.id_catalogo_origen is not None else None
         )
 
     @staticmethod
@@ -36,5 +37,9 @@ class PrestamoMapper:
             fecha_prestamo=prestamo.fechas.fecha_prestamo,
             fecha_devolucion_esperada=prestamo.fechas.fecha_devolucion_esperada,
             fecha_devolucion_real=prestamo.fechas.fecha_devolucion_real,
-            estado=prestamo.estado.valor.value
+            estado=prestamo.estado.valor.value,
+            version=prestamo.version,
+            id_biblioteca_origen=prestamo.origen.id_biblioteca if prestamo.origen else None,
+            id_catalogo_origen=prestamo.origen.id_catalogo if prestamo.origen else None,
+            tipo_origen=prestamo.origen.tipo if prestamo.origen else None
         )
\ No newline at end of file
@@ -33,4 +33,20 @@ class PrestamoDB(SQLModel, table=True):
     estado: str = Field(
         default="activo",
         description="Estado del préstamo: activo, completado, retrasado"
-    )
\ No newline at end of file
+    )
+    version: int = Field(
+        default=1,
+        description="Versión de la fila para control de concurrencia optimista"
+    )
+    id_biblioteca_origen: Optional[int] = Field(
+        default=None,
+        description="Biblioteca del ejemplar al prestarse (NULL: laboratorio); para las estadísticas"
+    )
+    id_catalogo_origen: Optional[int] = Field(
+        default=None,
+        description="Item del catálogo del ejemplar al prestarse; para las estadísticas"
+    )
+    tipo_origen: Optional[str] = Field(
+        default=None,
+        description="Tipo del item del catálogo al prestarse; para las estadísticas"
+    )
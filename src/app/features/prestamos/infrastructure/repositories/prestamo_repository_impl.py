@@ -1,19 +1,28 @@
 # src/app/features/prestamos/infrastructure/repositories/prestamo_repository_impl.py
 from typing import List, Optional
 from datetime import datetime, date, timedelta
-from sqlmodel import select, Session
+from sqlalchemy import or_
+from sqlmodel import select, update, Session
 from src.app.features.prestamos.domain.repositories.prestamo_repository import PrestamoRepository
 from src.app.features.prestamos.domain.entities.prestamo import Prestamo
 from src.app.features.prestamos.infrastructure.models.prestamo_model import PrestamoDB
 from src.app.features.prestamos.infrastructure.mappers.prestamo_mapper import PrestamoMapper
+from src.app.features.prestamos.domain.value_objects.fechas_columnares import FechasColumnares
+from src.app.shared.concurrency.optimistic_lock import ConcurrencyConflictError
 from src.app.features.user.infrastructure.models.user_model import UserDB
 from src.app.features.ejemplares.infrastructure.models.ejemplar_model import EjemplarDB
 from src.app.features.catalogo.infrastructure.models.catalogo_model import CatalogoDB
+from src.app.features.estadisticas.infrastructure import rollups_prestamos
+from src.app.core.database.replicas import lectura_replica
 
 class PrestamoRepositoryImpl(PrestamoRepository):
     def __init__(self, session: Session):
         self.session = session
+        # id_prestamo -> (version, origen y fechas) leídos con get_by_id o get_prestamos_activos,
+        # para ajustar las estadísticas al guardar sin volver a leer la fila
+        self._leidos = {}
 
+    @lectura_replica
     def get_all(self) -> List[Prestamo]:
         try:
             statement = select(PrestamoDB)
@@ -26,10 +35,14 @@ class PrestamoRepositoryImpl(PrestamoRepository):
     def get_by_id(self, id_prestamo: int) -> Optional[Prestamo]:
         try:
             prestamo_db = self.session.get(PrestamoDB, id_prestamo)
-            return PrestamoMapper.to_domain(prestamo_db) if prestamo_db else None
+            if not prestamo_db:
+                return None
+            self._recordar(prestamo_db)
+            return PrestamoMapper.to_domain(prestamo_db)
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_usuario(self, id_usuario: int) -> List[Prestamo]:
         try:
             statement = select(PrestamoDB).where(PrestamoDB.id_usuario == id_usuario)
@@ -38,6 +51,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_ejemplar(self, id_ejemplar: int) -> List[Prestamo]:
         try:
             statement = select(PrestamoDB).where(PrestamoDB.id_ejemplar == id_ejemplar)
@@ -46,6 +60,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_estado(self, estado: str) -> List[Prestamo]:
         try:
             statement = select(PrestamoDB).where(PrestamoDB.estado == estado)
@@ -58,10 +73,13 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         try:
             statement = select(PrestamoDB).where(PrestamoDB.estado == "activo")
             prestamos_db = self.session.exec(statement).all()
+            for prestamo_db in prestamos_db:
+                self._recordar(prestamo_db)
             return [PrestamoMapper.to_domain(prestamo_db) for prestamo_db in prestamos_db]
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_prestamos_retrasados(self) -> List[Prestamo]:
         try:
             statement = select(PrestamoDB).where(PrestamoDB.estado == "retrasado")
@@ -70,6 +88,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_prestamos_por_vencer(self, dias: int = 3) -> List[Prestamo]:
         try:
             fecha_limite = date.today() + timedelta(days=dias)
@@ -86,28 +105,110 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         try:
             prestamo_db = PrestamoMapper.to_db(prestamo)
             self.session.add(prestamo_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = PrestamoMapper.to_domain(prestamo_db)
+            rollups_prestamos.registrar_cambio(self.session, None, self._aporte(prestamo_db))
             self.session.commit()
-            self.session.refresh(prestamo_db)
-            return PrestamoMapper.to_domain(prestamo_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
 
     def update(self, id_prestamo: int, prestamo: Prestamo) -> Optional[Prestamo]:
         try:
-            prestamo_db = self.session.get(PrestamoDB, id_prestamo)
-            if prestamo_db:
-                prestamo_db.id_usuario = prestamo.id_usuario
-                prestamo_db.id_ejemplar = prestamo.id_ejemplar
-                prestamo_db.fecha_prestamo = prestamo.fechas.fecha_prestamo
-                prestamo_db.fecha_devolucion_esperada = prestamo.fechas.fecha_devolucion_esperada
-                prestamo_db.fecha_devolucion_real = prestamo.fechas.fecha_devolucion_real
-                prestamo_db.estado = prestamo.estado.valor.value
-                self.session.add(prestamo_db)
-                self.session.commit()
-                self.session.refresh(prestamo_db)
-                return PrestamoMapper.to_domain(prestamo_db)
-            return None
+            # Origen y fechas que se reemplazan: los de la versión que se va a actualizar. Sin SELECT
+            # extra si el préstamo se leyó antes; si la fila cambió desde entonces, el UPDATE no se aplica
+            antes = self._leido(id_prestamo, prestamo.version)
+            # UPDATE condicional: solo se aplica si la fila sigue en la versión que se leyó
+            statement = update(PrestamoDB).where(
+                PrestamoDB.id_prestamo == id_prestamo,
+                PrestamoDB.version == prestamo.version
+            ).values(
+                id_usuario=prestamo.id_usuario,
+                id_ejemplar=prestamo.id_ejemplar,
+                fecha_prestamo=prestamo.fechas.fecha_prestamo,
+                fecha_devolucion_esperada=prestamo.fechas.fecha_devolucion_esperada,
+                fecha_devolucion_real=prestamo.fechas.fecha_devolucion_real,
+                estado=prestamo.estado.valor.value,
+                id_biblioteca_origen=prestamo.origen.id_biblioteca if prestamo.origen else None,
+                id_catalogo_origen=prestamo.origen.id_catalogo if prestamo.origen else None,
+                tipo_origen=prestamo.origen.tipo if prestamo.origen else None,
+                version=prestamo.version + 1
+            )
+            resultado = self.session.exec(statement)
+            if resultado.rowcount == 0:
+                # El rollback cierra la transacción para que la siguiente lectura vea la fila actual
+                self.session.rollback()
+                if self.session.get(PrestamoDB, id_prestamo) is None:
+                    return None
+                raise ConcurrencyConflictError(
+                    f"El préstamo con ID {id_prestamo} fue modificado por otra operación"
+                )
+            origen = prestamo.origen
+            despues = (
+                origen.id_biblioteca if origen else None,
+                origen.id_catalogo if origen else None,
+                origen.tipo if origen else None,
+                prestamo.fechas.fecha_prestamo,
+                prestamo.fechas.fecha_devolucion_esperada,
+                prestamo.fechas.fecha_devolucion_real
+            )
+            rollups_prestamos.registrar_cambio(self.session, antes, despues)
+            self.session.commit()
+            prestamo.id_prestamo = id_prestamo
+            prestamo.version += 1
+            self._leidos[id_prestamo] = (prestamo.version, despues)
+            return prestamo
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+    def _recordar(self, prestamo_db: PrestamoDB):
+        self._leidos[prestamo_db.id_prestamo] = (prestamo_db.version, self._aporte(prestamo_db))
+
+    @staticmethod
+    def _aporte(prestamo_db):
+        return tuple(getattr(prestamo_db, columna.key) for columna in rollups_prestamos.COLUMNAS_APORTE)
+
+    def _leido(self, id_prestamo: int, version: int):
+        leido = self._leidos.get(id_prestamo)
+        if leido is not None and leido[0] == version:
+            return leido[1]
+        fila = self.session.exec(
+            select(*rollups_prestamos.COLUMNAS_APORTE).where(
+                PrestamoDB.id_prestamo == id_prestamo, PrestamoDB.version == version
+            )
+        ).first()
+        return tuple(fila) if fila else None
+
+    def patch(self, id_prestamo: int, cambios: dict) -> bool:
+        try:
+            antes = None
+            if "id_catalogo_origen" in cambios or "fecha_devolucion_esperada" in cambios:
+                # Bloquea la fila para que el ajuste de estadísticas parta del préstamo que se reemplaza
+                antes = self.session.exec(
+                    select(*rollups_prestamos.COLUMNAS_APORTE).where(
+                        PrestamoDB.id_prestamo == id_prestamo
+                    ).with_for_update()
+                ).first()
+                if antes is None:
+                    self.session.rollback()
+                    return False
+                antes = tuple(antes)
+            statement = update(PrestamoDB).where(PrestamoDB.id_prestamo == id_prestamo).values(
+                **cambios, version=PrestamoDB.version + 1
+            )
+            resultado = self.session.exec(statement)
+            if antes is not None:
+                despues = tuple(
+                    cambios.get(columna.key, valor)
+                    for columna, valor in zip(rollups_prestamos.COLUMNAS_APORTE, antes)
+                )
+                rollups_prestamos.registrar_cambio(self.session, antes, despues)
+            self._leidos.pop(id_prestamo, None)
+            self.session.commit()
+            return resultado.rowcount > 0
         except Exception as e:
             self.session.rollback()
             raise e
@@ -117,6 +218,8 @@ class PrestamoRepositoryImpl(PrestamoRepository):
             prestamo_db = self.session.get(PrestamoDB, id_prestamo)
             if prestamo_db:
                 self.session.delete(prestamo_db)
+                rollups_prestamos.registrar_cambio(self.session, self._aporte(prestamo_db), None)
+                self._leidos.pop(id_prestamo, None)
                 self.session.commit()
                 return True
             return False
@@ -124,7 +227,46 @@ class PrestamoRepositoryImpl(PrestamoRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
+    def get_fechas_columnares(self, fecha_corte: date, incluir_devueltos: bool = False) -> FechasColumnares:
+        try:
+            # Fin del día de corte: las columnas son DATETIME
+            limite = datetime.combine(fecha_corte + timedelta(days=1), datetime.min.time())
+            # Abiertos al corte: prestados hasta ese día y no devueltos todavía, o devueltos después
+            abiertos = or_(PrestamoDB.fecha_devolucion_real.is_(None), PrestamoDB.fecha_devolucion_real >= limite)
+            # Solo las cuatro columnas, sin construir filas ORM ni entidades por préstamo
+            statement = select(
+                PrestamoDB.id_prestamo,
+                PrestamoDB.id_usuario,
+                PrestamoDB.fecha_devolucion_esperada,
+                PrestamoDB.fecha_devolucion_real
+            ).where(PrestamoDB.fecha_prestamo < limite)
+            if incluir_devueltos:
+                # De los devueltos solo interesan los que se devolvieron después de la fecha esperada
+                statement = statement.where(or_(
+                    abiertos,
+                    PrestamoDB.fecha_devolucion_real > PrestamoDB.fecha_devolucion_esperada
+                ))
+            else:
+                statement = statement.where(abiertos)
+            filas = self.session.exec(statement).all()
+            if incluir_devueltos:
+                # DATETIME > DATE también deja pasar las devoluciones del mismo día esperado, sin retraso
+                filas = [
+                    fila for fila in filas
+                    if fila[3] is None or fila[3] >= limite or fila[3].date() > fila[2]
+                ]
+            return FechasColumnares(
+                ids=[fila[0] for fila in filas],
+                usuarios=[fila[1] for fila in filas],
+                esperadas=[fila[2].toordinal() for fila in filas],
+                devoluciones=[fila[3].toordinal() if fila[3] else 0 for fila in filas]
+            )
+        except Exception as e:
+            raise e
+
     # Implementación de métodos con JOINs para datos detallados
+    @lectura_replica
     def get_all_with_details(self) -> List[dict]:
         try:
             statement = select(
@@ -155,6 +297,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
             self.session.rollback()
             raise e
 
+    @lectura_replica
     def get_by_id_with_details(self, id_prestamo: int) -> Optional[dict]:
         try:
             statement = select(
@@ -183,6 +326,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_usuario_with_details(self, id_usuario: int) -> List[dict]:
         try:
             statement = select(
@@ -212,6 +356,7 @@ class PrestamoRepositoryImpl(PrestamoRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_prestamos_activos_with_details(self) -> List[dict]:
         try:
             statement = select(
@@ -1,6 +1,6 @@
 # src/app/features/prestamos/presentation/routers/prestamo_router.py
 from fastapi import APIRouter, Depends
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from datetime import date, datetime, timedelta
 from src.app.features.prestamos.application.services.prestamo_service import PrestamoService
 from src.app.features.prestamos.application.dtos import CreatePrestamoDTO, UpdatePrestamoDTO, DevolverPrestamoDTO, RenovarPrestamoDTO
@@ -13,15 +13,23 @@ from src.app.features.prestamos.presentation.schemas.prestamo_schemas import (
     PrestamoResponse,
     PrestamosListResponse,
     PrestamoSingleResponse,
+    PrestamoPatchResponse,
+    PrestamoPatchSingleResponse,
     PrestamoDeleteResponse,
     PrestamoDetailResponse,
     PrestamoDetailSingleResponse,
     PrestamosDetailListResponse,
+    ReporteMultasResponse,
+    ReporteMultasSingleResponse,
+    TramoAntiguedadResponse,
+    MultaPrestamoResponse,
+    MultaUsuarioResponse,
     UsuarioBasicResponse,
     EjemplarBasicResponse,
     CatalogoBasicResponse
 )
 from src.app.shared.schemas.generic_response import GenericResponse
+from src.app.shared.concurrency.optimistic_lock import ConcurrencyConflictError
 
 router = APIRouter(prefix="/prestamos", tags=["prestamos"])
 
@@ -118,6 +126,12 @@ def create_prestamo(prestamo_request: PrestamoCreateRequest, service: prestamo_s
             status=201
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -166,6 +180,45 @@ def update_prestamo(id_prestamo: int, prestamo_request: PrestamoUpdateRequest, s
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al actualizar préstamo",
+            errors=[str(e)],
+            status=500
+        )
+
+@router.patch("/{id_prestamo}", response_model=PrestamoPatchSingleResponse)
+def patch_prestamo(id_prestamo: int, prestamo_request: PrestamoUpdateRequest, service: prestamo_service_dep):
+    try:
+        update_dto = UpdatePrestamoDTO(**prestamo_request.model_dump(exclude_none=True))
+        
+        campos_actualizados = service.patch(id_prestamo, update_dto)
+        
+        if campos_actualizados is None:
+            return GenericResponse.create_error(
+                message="Préstamo no encontrado",
+                errors=[f"Préstamo con ID {id_prestamo} no existe"],
+                status=404
+            )
+        
+        return GenericResponse.create_success(
+            message="Préstamo actualizado exitosamente",
+            data=PrestamoPatchResponse(id_prestamo=id_prestamo, campos_actualizados=campos_actualizados),
+            status=200
+        )
+        
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -197,6 +250,12 @@ def delete_prestamo(id_prestamo: int, service: prestamo_service_dep):
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -392,6 +451,48 @@ def get_prestamos_por_vencer(dias: int, service: prestamo_service_dep):
             status=500
         )
 
+# Endpoints de reportes
+@router.get("/reportes/multas", response_model=ReporteMultasSingleResponse)
+def get_reporte_multas(
+    service: prestamo_service_dep,
+    fecha_corte: Optional[date] = None,
+    incluir_devueltos: bool = False,
+    limite: int = 10
+):
+    try:
+        reporte = service.calcular_multas(fecha_corte, incluir_devueltos, limite)
+        
+        reporte_response = ReporteMultasResponse(
+            fecha_corte=reporte.fecha_corte,
+            motor=reporte.motor,
+            prestamos_evaluados=reporte.prestamos_evaluados,
+            prestamos_con_retraso=reporte.prestamos_con_retraso,
+            dias_retraso_total=reporte.dias_retraso_total,
+            multa_total=reporte.multa_total,
+            tramos=[TramoAntiguedadResponse(**tramo) for tramo in reporte.tramos],
+            mayores_multas=[MultaPrestamoResponse(**multa) for multa in reporte.mayores_multas],
+            usuarios=[MultaUsuarioResponse(**usuario) for usuario in reporte.usuarios]
+        )
+        
+        return GenericResponse.create_success(
+            message="Reporte de multas generado exitosamente",
+            data=reporte_response,
+            status=200
+        )
+        
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al generar reporte de multas",
+            errors=[str(e)],
+            status=500
+        )
+
 # Endpoints detallados (con información de usuario, ejemplar y catálogo)
 @router.get("/detalles/", response_model=PrestamosDetailListResponse)
 def get_all_prestamos_detalles(service: prestamo_service_dep):
@@ -612,6 +713,12 @@ def devolver_prestamo(id_prestamo: int, devolver_request: PrestamoDevolverReques
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
@@ -657,6 +764,12 @@ def renovar_prestamo(id_prestamo: int, renovar_request: PrestamoRenovarRequest,
             status=200
         )
         
+    except ConcurrencyConflictError as e:
+        return GenericResponse.create_error(
+            message="Conflicto de concurrencia",
+            errors=[str(e)],
+            status=409
+        )
     except ValueError as e:
         return GenericResponse.create_error(
             message="Error de validación",
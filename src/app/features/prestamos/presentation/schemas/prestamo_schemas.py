@@ -36,6 +36,10 @@ class PrestamoResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class PrestamoPatchResponse(BaseModel):
+    id_prestamo: int
+    campos_actualizados: List[str]
+
 # Schemas para datos detallados
 class UsuarioBasicResponse(BaseModel):
     id_usuario: int
@@ -72,11 +76,46 @@ class PrestamoDetailResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# Reporte de multas y antigüedad de la cartera vencida
+class TramoAntiguedadResponse(BaseModel):
+    tramo: str
+    desde: int
+    hasta: Optional[int] = None
+    prestamos: int
+    dias_retraso: int
+    multa: float
+
+class MultaPrestamoResponse(BaseModel):
+    id_prestamo: int
+    id_usuario: int
+    dias_retraso: int
+    multa: float
+
+class MultaUsuarioResponse(BaseModel):
+    id_usuario: int
+    prestamos: int
+    multa: float
+
+class ReporteMultasResponse(BaseModel):
+    fecha_corte: date
+    motor: str
+    prestamos_evaluados: int
+    prestamos_con_retraso: int
+    dias_retraso_total: int
+    multa_total: float
+    tramos: List[TramoAntiguedadResponse]
+    mayores_multas: List[MultaPrestamoResponse]
+    usuarios: List[MultaUsuarioResponse]
+
 # Generic Responses
 PrestamosListResponse = GenericResponse[List[PrestamoResponse]]
 PrestamoSingleResponse = GenericResponse[PrestamoResponse]
+PrestamoPatchSingleResponse = GenericResponse[PrestamoPatchResponse]
 PrestamoDeleteResponse = GenericResponse[None]
 
 # Generic Responses para datos detallados
 PrestamoDetailSingleResponse = GenericResponse[PrestamoDetailResponse]
-PrestamosDetailListResponse = GenericResponse[List[PrestamoDetailResponse]]
\ No newline at end of file
+PrestamosDetailListResponse = GenericResponse[List[PrestamoDetailResponse]]
+
+# Generic Response del reporte de multas
+ReporteMultasSingleResponse = GenericResponse[ReporteMultasResponse]
\ No newline at end of file
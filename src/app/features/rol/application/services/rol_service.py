@@ -4,6 +4,7 @@ from src.app.features.rol.domain.entities.rol import Rol
 from src.app.features.rol.domain.value_objects.tipo_rol import TipoRolValueObject
 from src.app.features.rol.domain.repositories.rol_repository import RolRepository
 from src.app.features.rol.application.dtos import CreateRolDTO, UpdateRolDTO
+from src.app.shared.cache.cache_referencia import cache_referencia
 
 class RolService:
     def __init__(self, rol_repository: RolRepository):
@@ -11,7 +12,7 @@ class RolService:
     
     def get_all(self) -> List[Rol]:
         """Obtener todos los roles (devuelve entidades)"""
-        return self.rol_repository.get_all()
+        return list(cache_referencia.obtener("roles", self.rol_repository.get_all))
     
     def get_by_id(self, id_rol: int) -> Optional[Rol]:
         """Obtener rol por ID (devuelve entidad)"""
@@ -35,7 +36,9 @@ class RolService:
         )
         
         # Guardar a través del repositorio
-        return self.rol_repository.create(rol)
+        guardado = self.rol_repository.create(rol)
+        cache_referencia.invalidar("roles")
+        return guardado
     
     def update(self, id_rol: int, update_dto: UpdateRolDTO) -> Optional[Rol]:
         """Actualizar un rol existente (devuelve entidad)"""
@@ -59,7 +62,9 @@ class RolService:
             existing_rol.cambiar_tipo_rol(update_dto.tipo_rol)
         
         # Actualizar a través del repositorio
-        return self.rol_repository.update(id_rol, existing_rol)
+        guardado = self.rol_repository.update(id_rol, existing_rol)
+        cache_referencia.invalidar("roles")
+        return guardado
     
     def delete(self, id_rol: int) -> bool:
         """Eliminar un rol (lógico)"""
@@ -73,7 +78,9 @@ class RolService:
             raise ValueError("No se pueden eliminar los roles del sistema base")
         
         # Eliminar a través del repositorio
-        return self.rol_repository.delete(id_rol)
+        eliminado = self.rol_repository.delete(id_rol)
+        cache_referencia.invalidar("roles")
+        return eliminado
     
     def exists_by_tipo(self, tipo_rol: str) -> bool:
         """Verificar si existe un rol por tipo"""
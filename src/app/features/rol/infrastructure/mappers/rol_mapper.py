@@ -12,9 +12,9 @@ class RolMapper:
         if not rol_db:
             return None
             
-        return Rol(
+        return Rol.model_construct(
             id_rol=rol_db.id_rol,
-            tipo_rol=TipoRolValueObject(valor=rol_db.tipo_rol)
+            tipo_rol=TipoRolValueObject.model_construct(valor=rol_db.tipo_rol)
         )
 
     @staticmethod
@@ -38,9 +38,11 @@ class RolRepositoryImpl(RolRepository):
         try:
             rol_db = RolMapper.to_db(rol)
             self.session.add(rol_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = RolMapper.to_domain(rol_db)
             self.session.commit()
-            self.session.refresh(rol_db)
-            return RolMapper.to_domain(rol_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -52,9 +54,10 @@ class RolRepositoryImpl(RolRepository):
                 # Actualizamos los campos
                 rol_db.tipo_rol = rol.tipo_rol.valor
                 self.session.add(rol_db)
+                self.session.flush()
+                entidad = RolMapper.to_domain(rol_db)
                 self.session.commit()
-                self.session.refresh(rol_db)
-                return RolMapper.to_domain(rol_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
@@ -6,14 +6,16 @@ from src.app.features.user.domain.value_objects.email import EmailValueObject
 from src.app.features.user.domain.value_objects.matricula import MatriculaValueObject
 from src.app.features.user.domain.repositories.user_repository import UserRepository
 from src.app.features.user.application.dtos import CreateUserDTO, UpdateUserDTO
+from src.app.features.rol.domain.repositories.rol_repository import RolRepository
 from passlib.context import CryptContext
 
 # Configuración para encriptación de contraseñas
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 class UserService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, rol_repository: RolRepository):
         self.user_repository = user_repository
+        self.rol_repository = rol_repository
 
     def get_all(self) -> List[User]:
         """Obtener todos los usuarios"""
@@ -118,6 +120,38 @@ class UserService:
         # Actualizar a través del repositorio
         return self.user_repository.update(id_usuario, existing_user)
 
+    def patch(self, id_usuario: int, update_dto: UpdateUserDTO) -> Optional[List[str]]:
+        """Actualizar parcialmente un usuario con un único UPDATE (sin leerlo antes)"""
+        campos = update_dto.model_dump(exclude_none=True)
+        if not campos:
+            raise ValueError("No se proporcionaron campos para actualizar")
+
+        # Validar solo los campos enviados; la unicidad de email y matrícula la garantiza la BD
+        cambios = {}
+        if "nombre" in campos:
+            cambios["nombre"] = NombreUsuario(valor=campos["nombre"]).valor
+        if "apellidoP" in campos:
+            cambios["apellidoP"] = campos["apellidoP"]
+        if "apellidoM" in campos:
+            cambios["apellidoM"] = campos["apellidoM"]
+        if "matricula" in campos:
+            cambios["matricula"] = MatriculaValueObject(valor=campos["matricula"]).valor
+        if "email" in campos:
+            cambios["email"] = EmailValueObject(valor=campos["email"]).valor
+        if "contraseña" in campos:
+            cambios["contraseña"] = pwd_context.hash(campos["contraseña"])
+        if "id_rol" in campos:
+            # Un rol inexistente fallaría por la llave foránea; se valida aquí para dar un error claro
+            if not self.rol_repository.get_by_id(campos["id_rol"]):
+                raise ValueError(f"Rol con ID {campos['id_rol']} no encontrado")
+            cambios["id_rol"] = campos["id_rol"]
+        if "status" in campos:
+            cambios["status"] = campos["status"]
+
+        if not self.user_repository.patch(id_usuario, cambios):
+            return None
+        return list(cambios.keys())
+
     def delete(self, id_usuario: int) -> bool:
         """Eliminar un usuario (lógico: desactivar)"""
         user = self.user_repository.get_by_id(id_usuario)
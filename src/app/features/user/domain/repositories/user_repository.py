@@ -33,6 +33,10 @@ class UserRepository(ABC):
     def update(self, id_usuario: int, user: User) -> Optional[User]:
         pass
     
+    @abstractmethod
+    def patch(self, id_usuario: int, cambios: dict) -> bool:
+        pass
+    
     @abstractmethod
     def delete(self, id_usuario: int) -> bool:
         pass
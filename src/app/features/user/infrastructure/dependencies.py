@@ -5,13 +5,22 @@ from src.app.core.database.database import session_dep
 from src.app.features.user.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from src.app.features.user.application.services.user_service import UserService
 
+# Importar dependencias de las otras features
+from src.app.features.rol.infrastructure.repositories.rol_repository_impl import RolRepositoryImpl
+
 def get_user_repository(session: session_dep) -> UserRepositoryImpl:
     """Provee la implementación concreta del repositorio de User"""
     return UserRepositoryImpl(session=session)
 
-def get_user_service(user_repository: Annotated[UserRepositoryImpl, Depends(get_user_repository)]) -> UserService:
-    """Provee el servicio de aplicación de User inyectado con el repositorio"""
-    return UserService(user_repository=user_repository)
+def get_rol_repository(session: session_dep) -> RolRepositoryImpl:
+    return RolRepositoryImpl(session=session)
+
+def get_user_service(
+    user_repository: Annotated[UserRepositoryImpl, Depends(get_user_repository)],
+    rol_repository: Annotated[RolRepositoryImpl, Depends(get_rol_repository)]
+) -> UserService:
+    """Provee el servicio de aplicación de User inyectado con los repositorios"""
+    return UserService(user_repository=user_repository, rol_repository=rol_repository)
 
 # Dependencias tipadas para usar en los routers
 user_repository_dep = Annotated[UserRepositoryImpl, Depends(get_user_repository)]
@@ -17,13 +17,13 @@ class UserMapper:
         # Convertir status string a booleano
         status_bool = user_db.status == "activo"
         
-        return User(
+        return User.model_construct(
             id_usuario=user_db.id_usuario,
-            nombre=NombreUsuario(valor=user_db.nombre),
+            nombre=NombreUsuario.model_construct(valor=user_db.nombre),
             apellidoP=user_db.apellidoP,
             apellidoM=user_db.apellidoM,
-            matricula=MatriculaValueObject(valor=user_db.matricula),
-            email=EmailValueObject(valor=user_db.email),
+            matricula=MatriculaValueObject.model_construct(valor=user_db.matricula),
+            email=EmailValueObject.model_construct(valor=user_db.email),
             contraseña=user_db.contraseña,
             id_rol=user_db.id_rol,
             status=status_bool
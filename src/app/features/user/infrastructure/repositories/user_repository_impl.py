@@ -1,17 +1,20 @@
 # src/app/features/user/infrastructure/repositories/user_repository_impl.py
 from typing import List, Optional
-from sqlmodel import select, Session
+from sqlmodel import select, update, Session
+from sqlalchemy.exc import IntegrityError
 from src.app.features.user.domain.repositories.user_repository import UserRepository
 from src.app.features.user.domain.entities.user import User
 from src.app.features.user.infrastructure.models.user_model import UserDB
 from src.app.features.user.infrastructure.mappers.user_mapper import UserMapper
 from src.app.features.rol.infrastructure.models.rol_model import RolDB
+from src.app.core.database.replicas import lectura_replica
 
 
 class UserRepositoryImpl(UserRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @lectura_replica
     def get_all(self) -> List[User]:
         try:
             statement = select(UserDB)
@@ -44,6 +47,7 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise e
 
+    @lectura_replica
     def get_by_rol(self, id_rol: int) -> List[User]:
         try:
             statement = select(UserDB).where(UserDB.id_rol == id_rol)
@@ -56,9 +60,11 @@ class UserRepositoryImpl(UserRepository):
         try:
             user_db = UserMapper.to_db(user)
             self.session.add(user_db)
+            # flush emite el INSERT y recupera el id autoincremental sin un SELECT extra
+            self.session.flush()
+            entidad = UserMapper.to_domain(user_db)
             self.session.commit()
-            self.session.refresh(user_db)
-            return UserMapper.to_domain(user_db)
+            return entidad
         except Exception as e:
             self.session.rollback()
             raise e
@@ -78,14 +84,31 @@ class UserRepositoryImpl(UserRepository):
                 user_db.status = "activo" if user.status else "inactivo"
                 
                 self.session.add(user_db)
+                self.session.flush()
+                entidad = UserMapper.to_domain(user_db)
                 self.session.commit()
-                self.session.refresh(user_db)
-                return UserMapper.to_domain(user_db)
+                return entidad
             return None
         except Exception as e:
             self.session.rollback()
             raise e
 
+    def patch(self, id_usuario: int, cambios: dict) -> bool:
+        try:
+            valores = dict(cambios)
+            if "status" in valores:
+                valores["status"] = "activo" if valores["status"] else "inactivo"
+            statement = update(UserDB).where(UserDB.id_usuario == id_usuario).values(**valores)
+            resultado = self.session.exec(statement)
+            self.session.commit()
+            return resultado.rowcount > 0
+        except IntegrityError:
+            self.session.rollback()
+            raise ValueError("El email o la matrícula ya están registrados")
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
     def delete(self, id_usuario: int) -> bool:
         try:
             user_db = self.session.get(UserDB, id_usuario)
@@ -116,6 +139,7 @@ class UserRepositoryImpl(UserRepository):
         except Exception as e:
             raise e
          
+    @lectura_replica
     def get_all_users_with_details(self):
         try:
             statement = (
@@ -11,6 +11,8 @@ from src.app.features.user.presentation.schemas.user_schemas import (
     UserResponse,
     UsersListResponse,
     UserSingleResponse,
+    UserPatchResponse,
+    UserPatchSingleResponse,
     UserDeleteResponse,
     UserLoginRequest,
     UserLoginResponse,
@@ -197,6 +199,40 @@ def update_user(id_usuario: int, user_request: UserUpdateRequest, service: user_
             status=500
         )
 
+@router.patch("/{id_usuario}", response_model=UserPatchSingleResponse)
+def patch_user(id_usuario: int, user_request: UserUpdateRequest, service: user_service_dep):
+    """Actualizar parcialmente un usuario (solo los campos enviados)"""
+    try:
+        update_dto = UpdateUserDTO(**user_request.model_dump(exclude_none=True))
+        
+        campos_actualizados = service.patch(id_usuario, update_dto)
+        
+        if campos_actualizados is None:
+            return GenericResponse.create_error(
+                message="Usuario no encontrado",
+                errors=[f"Usuario con ID {id_usuario} no existe"],
+                status=404
+            )
+        
+        return GenericResponse.create_success(
+            message="Usuario actualizado exitosamente",
+            data=UserPatchResponse(id_usuario=id_usuario, campos_actualizados=campos_actualizados),
+            status=200
+        )
+        
+    except ValueError as e:
+        return GenericResponse.create_error(
+            message="Error de validación",
+            errors=[str(e)],
+            status=400
+        )
+    except Exception as e:
+        return GenericResponse.create_error(
+            message="Error al actualizar usuario",
+            errors=[str(e)],
+            status=500
+        )
+
 @router.delete("/{id_usuario}", response_model=UserDeleteResponse)
 def delete_user(id_usuario: int, service: user_service_dep):
     """Eliminar un usuario (lógico: desactivar)"""
@@ -40,6 +40,11 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class UserPatchResponse(BaseModel):
+    """Schema para respuesta de una actualización parcial (PATCH)"""
+    id_usuario: int
+    campos_actualizados: List[str]
+
 # Schema para autenticación
 class UserLoginRequest(BaseModel):
     email: EmailStr
@@ -72,4 +77,5 @@ class UserLoginGenericResponse(GenericResponse[UserLoginResponse]):
 UsersDetailsListResponse = GenericResponse[List[UserDetailResponse]]
 UsersListResponse = GenericResponse[List[UserResponse]]
 UserSingleResponse = GenericResponse[UserResponse]
+UserPatchSingleResponse = GenericResponse[UserPatchResponse]
 UserDeleteResponse = GenericResponse[None]
\ No newline at end of file
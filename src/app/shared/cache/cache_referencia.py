@@ -0,0 +1,59 @@
+# src/app/shared/cache/cache_referencia.py
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from src.app.core.observability.metrics import registrar_acceso_cache
+
+T = TypeVar('T')
+
+# Roles, carreras, bibliotecas, laboratorios y ciclos cambian muy poco. La caché es por proceso:
+# una escritura invalida la del worker que la atiende y el TTL acota lo que tardan los demás
+TTL_SEGUNDOS = float(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "300"))
+
+
+class CacheReferencia:
+    """Caché en memoria con TTL para catálogos de referencia. Las claves van por feature
+    ("roles", "ciclos:activos:2025-01-31") para invalidar todas las de una feature a la vez"""
+
+    def __init__(self, ttl: float = TTL_SEGUNDOS):
+        self.ttl = ttl
+        self._entradas: Dict[str, Tuple[float, Any]] = {}
+        self._generacion = 0
+        self._lock = threading.Lock()
+
+    def obtener(self, clave: str, cargar: Callable[[], T]) -> T:
+        nombre = clave.split(":", 1)[0]
+        entrada = self._entradas.get(clave)
+        if entrada is not None and entrada[0] > time.monotonic():
+            registrar_acceso_cache(nombre, True)
+            return entrada[1]
+
+        registrar_acceso_cache(nombre, False)
+        generacion = self._generacion
+        valor = cargar()
+        if self.ttl > 0:
+            with self._lock:
+                # Si hubo una invalidación mientras se cargaba, el valor leído puede ser anterior a la escritura
+                if generacion == self._generacion:
+                    self._entradas[clave] = (time.monotonic() + self.ttl, valor)
+        return valor
+
+    def invalidar(self, feature: str):
+        """Descarta todas las claves de una feature; se llama tras cada escritura"""
+        with self._lock:
+            self._generacion += 1
+            for clave in [c for c in self._entradas if c == feature or c.startswith(feature + ":")]:
+                del self._entradas[clave]
+
+    def limpiar(self):
+        with self._lock:
+            self._generacion += 1
+            self._entradas.clear()
+
+    def claves(self) -> list:
+        return list(self._entradas)
+
+
+cache_referencia = CacheReferencia()
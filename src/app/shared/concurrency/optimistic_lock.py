@@ -0,0 +1,34 @@
+# src/app/shared/concurrency/optimistic_lock.py
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Intentos totales (el primero más los reintentos) antes de responder 409
+MAX_INTENTOS = 3
+
+class ConcurrencyConflictError(Exception):
+    """La fila cambió de versión entre la lectura y la escritura (bloqueo optimista)"""
+    pass
+
+def retry_on_conflict(
+    entidad: T,
+    guardar: Callable[[T], Optional[T]],
+    recargar: Callable[[], Optional[T]],
+    aplicar: Callable[[T], None],
+    max_intentos: int = MAX_INTENTOS
+) -> Optional[T]:
+    """
+    Persiste una entidad ya modificada. Si otra operación la cambió primero, la relee,
+    vuelve a aplicar la transición de dominio (que puede rechazarla con ValueError) y
+    reintenta. Agotados los intentos se propaga ConcurrencyConflictError.
+    """
+    for intento in range(1, max_intentos + 1):
+        try:
+            return guardar(entidad)
+        except ConcurrencyConflictError:
+            if intento == max_intentos:
+                raise
+            entidad = recargar()
+            if entidad is None:
+                return None
+            aplicar(entidad)